@@ -1,24 +1,74 @@
-from surf_report.providers.surfline.surfline import SurflineAPI
+import contextlib
+import sys
+from pathlib import Path
+from typing import Any
+
 from surf_report.providers.surfline.ui import (
     display_combined_spot_report,
     display_region_overview,
     display_regions,
     display_spot_forecast,
+    display_spot_report,
     get_user_choice,
 )
 from surf_report.utils.helpers import (
     parse_arguments,
+    read_spot_ids,
     sort_regions,
 )
 from surf_report.utils.logger import setup_logger
 
-logger = setup_logger()
-surfline = SurflineAPI()
+# Built on first use by get_surfline() so that `--help` and offline commands
+# never import the HTTP stack or open the response cache. Either a SurflineAPI
+# or, when a daemon is running, a DaemonClient.
+surfline: Any = None
+
+
+def get_surfline(use_cache: bool = True):
+    """
+    Returns the shared Surfline client, creating it on first use.
+
+    Args:
+        use_cache (bool): Whether the client should read and write the
+            on-disk response cache.
+
+    Returns:
+        SurflineAPI: The client used by every command.
+    """
+    global surfline
+    if surfline is None:
+        from surf_report.providers.surfline.surfline import SurflineAPI
+        from surf_report.utils.cache import ResponseCache
+
+        surfline = SurflineAPI(cache=ResponseCache() if use_cache else None)
+    elif not use_cache:
+        surfline.cache = None
+    return surfline
+
+
+def use_daemon() -> bool:
+    """
+    Routes lookups through a running ``surfreport serve`` daemon, if one
+    answers, instead of building a local client.
+
+    Returns:
+        bool: Whether the daemon is in use.
+    """
+    global surfline
+    if surfline is not None:
+        return False
+    from surf_report.providers.surfline.daemon_client import connect
+
+    client = connect()
+    if client is None:
+        return False
+    surfline = client
+    return True
 
 
 def handle_search(search: str, verbose=False):
     """Displays a list of search results from the user's query."""
-    search_results = surfline.search_surfline(
+    search_results = get_surfline().search_surfline(
         search
     )  # Returns a list of SurflineSearchResult objects
 
@@ -61,52 +111,412 @@ def handle_search(search: str, verbose=False):
     return selected_result.id
 
 
+def browse_regions(args):
+    """Interactive region browser backed by the taxonomy snapshot."""
+    from surf_report.providers.surfline.taxonomy import TaxonomyIndex
+
+    client = get_surfline()
+    taxonomy = TaxonomyIndex.load() or TaxonomyIndex()
+    current_region_id = taxonomy.root_id
+    while True:
+        regions = taxonomy.ensure_children(client, current_region_id)
+        if taxonomy.dirty:
+            taxonomy.save()
+
+        if not regions:  # Handle empty response
+            print("Failed to fetch region data.")
+            parent_id = taxonomy.parent_of(current_region_id)
+            if parent_id is None:
+                return
+            current_region_id = parent_id
+            continue
+
+        regions = sort_regions(regions)
+        display_regions(regions, args.verbose)
+
+        choice = get_user_choice(regions)
+        if choice == 0:
+            print("Returning to the previous region.")
+            current_region_id = (
+                taxonomy.parent_of(current_region_id) or taxonomy.root_id
+            )
+            continue
+
+        current_region = regions[choice - 1]
+
+        if current_region.type == "subregion":
+            region_overview = client.get_region_overview(current_region.subregion)
+            if region_overview:
+                display_region_overview(region_overview)
+
+        if current_region.type == "spot":
+            spot_forecast = client.get_spot_forecast(current_region.spot)
+            if spot_forecast:
+                display_spot_forecast(spot_forecast)
+        else:
+            current_region_id = current_region.id
+
+
+def handle_batch(args):
+    """Streams reports for every spot listed in the spots file."""
+    if args.spots_file == "-":
+        spot_ids = read_spot_ids(sys.stdin)
+    else:
+        with open(args.spots_file, encoding="utf-8") as spots_file:
+            spot_ids = read_spot_ids(spots_file)
+
+    client = get_surfline()
+    if args.rate_limit:
+        from surf_report.utils.transport import HostRateLimiter
+
+        client.rate_limiter = HostRateLimiter(
+            args.rate_limit, client.transport.rate_burst
+        )
+
+    reports = client.get_spot_reports(
+        spot_ids,
+        days=args.days,
+        max_concurrency=args.concurrency,
+        columnar=True,
+        sections=args.sections,
+    )
+    write_batch(args, reports)
+    if client.revalidation.conditional:
+        print(f"Revalidated: {client.revalidation.summary()}", file=sys.stderr)
+    if args.metrics_file:
+        with open(args.metrics_file, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(client.metrics.to_prometheus())
+
+
+def write_batch(args, reports):
+    """Writes batch reports in the requested format and destination."""
+    if args.format == "parquet":
+        if not args.output:
+            sys.exit("Parquet output needs a file: pass --output PATH.")
+        with open(args.output, "wb") as output:
+            export_reports(reports, args.format, output)
+        return
+
+    # Every text format is opened the same way, so --workers writes the
+    # same bytes as the in-process path.
+    with (
+        open(args.output, "w", encoding="utf-8", newline="")
+        if args.output
+        else contextlib.nullcontext(sys.stdout)
+    ) as output:
+        if args.workers:
+            write_rendered_reports(args, reports, output)
+        elif args.format == "text":
+            write_text_reports(reports, output, args.sections)
+        else:
+            export_reports(reports, args.format, output)
+
+
+def write_text_reports(reports, output, sections=None):
+    """Writes each report as text as soon as it arrives."""
+    for spot_report in reports:
+        print(f"\n##### {spot_report.spot_id} #####", file=output)
+        display_spot_report(spot_report, sections, output=output)
+        output.flush()
+
+
+def write_rendered_reports(args, reports, output):
+    """Writes reports grouped and formatted by a pool of worker processes."""
+    from surf_report.providers.surfline.parallel import render_reports
+
+    for text in render_reports(
+        reports,
+        args.format,
+        args.sections,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    ):
+        output.write(text)
+        output.flush()
+
+
+def export_reports(reports, fmt, output):
+    """
+    Streams reports to ``output`` in a machine-readable format, one spot at a
+    time, so only the report being written is held in memory.
+    """
+    from surf_report.providers.surfline.export import open_writer
+    from surf_report.providers.surfline.processing import group_report
+
+    with open_writer(fmt, output) as writer:
+        for spot_report in reports:
+            writer.write(spot_report.spot_id, group_report(spot_report))
+
+
+def handle_rank(args):
+    """Runs the `rank` command for the spots below a taxonomy node."""
+    import time
+
+    from surf_report.providers.surfline.ranking import (
+        rank_spots,
+        region_spots,
+        resolve_region,
+    )
+    from surf_report.providers.surfline.taxonomy import TaxonomyIndex
+    from surf_report.providers.surfline.ui import display_rankings
+
+    taxonomy = TaxonomyIndex.load() or TaxonomyIndex()
+    try:
+        taxonomy_id = resolve_region(taxonomy, args.region)
+    except ValueError as e:
+        print(e)
+        return
+
+    client = get_surfline()
+    spots = region_spots(client, taxonomy, taxonomy_id, max_age=args.max_age * 3600)
+    if taxonomy.dirty:
+        taxonomy.save()
+    if not spots:
+        print(f"No spots found below {args.region}.")
+        return
+
+    start = end = None
+    if args.hours is not None:
+        now = int(time.time())
+        # Include the window that is already under way.
+        start = now - args.interval * 3600
+        end = now + int(args.hours * 3600)
+    rankings = rank_spots(
+        client,
+        spots,
+        top=args.top,
+        days=args.days,
+        interval_hours=args.interval,
+        start=start,
+        end=end,
+        max_concurrency=args.concurrency,
+    )
+    region = taxonomy.get(taxonomy_id)
+    print(f"Ranked {len(spots)} spots in {region.name if region else args.region}.")
+    display_rankings(rankings)
+
+
+def handle_taxonomy(args):
+    """Runs the `taxonomy` command against the offline snapshot."""
+    from surf_report.providers.surfline.taxonomy import (
+        TaxonomyIndex,
+        default_snapshot_path,
+    )
+
+    path = default_snapshot_path()
+    if args.action == "sync":
+        taxonomy = TaxonomyIndex.load() or TaxonomyIndex()
+        requests_made = taxonomy.sync(get_surfline(), depth=args.depth)
+        taxonomy.save(path)
+        print(
+            f"Saved {len(taxonomy)} taxonomy nodes to {path} "
+            f"({requests_made} requests)."
+        )
+        return
+
+    taxonomy = TaxonomyIndex.load(path)
+    if taxonomy is None:
+        print("No taxonomy snapshot found. Run `surfreport taxonomy sync` first.")
+        return
+
+    if args.action == "refresh":
+        refreshed = taxonomy.refresh_stale(get_surfline(), max_age=args.max_age * 3600)
+        taxonomy.save(path)
+        print(f"Refreshed {refreshed} stale taxonomy levels.")
+    else:
+        spot_count = sum(1 for _ in taxonomy.spots())
+        stale = sum(
+            1
+            for node_id in taxonomy.fetched_at
+            if taxonomy.is_stale(node_id, args.max_age * 3600)
+        )
+        print(f"Snapshot: {path}")
+        print(f"Nodes: {len(taxonomy)} ({spot_count} spots)")
+        print(f"Stale levels: {stale} of {len(taxonomy.fetched_at)}")
+
+
+def handle_serve(args):
+    """Runs the forecast daemon until interrupted."""
+    from surf_report.providers.surfline.daemon import build_server, serve
+    from surf_report.providers.surfline.search_index import SpotSearchIndex
+    from surf_report.providers.surfline.taxonomy import TaxonomyIndex
+
+    client = get_surfline()
+    taxonomy = TaxonomyIndex.load()
+    if taxonomy is not None:
+        client.search_index = SpotSearchIndex.from_taxonomy(taxonomy)
+    try:
+        server = build_server(client, socket_path=args.socket, port=args.port)
+    except (RuntimeError, OSError) as e:
+        sys.exit(f"Cannot start daemon: {e}")
+
+    scheduler = None
+    if args.prefetch:
+        if client.cache is None:
+            sys.exit("--prefetch needs the response cache; drop --no-cache.")
+        scheduler = build_prefetch_scheduler(client.cache)
+        if scheduler is None:
+            print("No favourite spots to prefetch.")
+        else:
+            scheduler.start()
+    print(f"Serving on {server.endpoint} (Ctrl-C to stop)")
+    try:
+        serve(server)
+    finally:
+        if scheduler is not None:
+            scheduler.stop()
+            scheduler.save()
+
+
+def build_prefetch_scheduler(
+    cache, favourites=None, days=3, interval=None, rate_limit=None
+):
+    """
+    Builds a scheduler for the favourite spots, or None if there are none.
+
+    Args:
+        cache (ResponseCache): The cache to keep warm.
+        favourites (str, optional): Favourites file; defaults to the config dir.
+        days (int): Number of days prefetched.
+        interval (float, optional): Minutes between refreshes of each spot.
+        rate_limit (float, optional): Requests per second while prefetching.
+    """
+    from surf_report.providers.surfline import prefetch
+
+    spot_ids = prefetch.load_favourites(Path(favourites) if favourites else None)
+    if not spot_ids:
+        return None
+    seconds = interval * 60 if interval is not None else prefetch.DEFAULT_INTERVAL
+    api = prefetch.prefetch_client(
+        cache,
+        rate_limit=rate_limit or prefetch.DEFAULT_RATE_LIMIT,
+        interval=seconds,
+    )
+    return prefetch.PrefetchScheduler(api, spot_ids, days=days, interval=seconds)
+
+
+def handle_prefetch(args):
+    """Runs the `prefetch` command for the favourite spots."""
+    from surf_report.providers.surfline import prefetch
+    from surf_report.utils.cache import ResponseCache
+
+    if args.status:
+        path = args.favourites
+        spot_ids = prefetch.load_favourites(Path(path) if path else None)
+        saved = prefetch.load_state()
+        for spot_id in spot_ids or list(saved):
+            status = saved.get(spot_id) or prefetch.SpotStatus(spot_id)
+            print(prefetch.describe_status(status))
+        return
+
+    scheduler = build_prefetch_scheduler(
+        ResponseCache(),
+        favourites=args.favourites,
+        days=args.days,
+        interval=args.interval,
+        rate_limit=args.rate_limit,
+    )
+    if scheduler is None:
+        path = args.favourites or prefetch.default_favourites_path()
+        sys.exit(f"No favourite spots in {path}; list one spot ID per line.")
+
+    spot_count = len(scheduler.statuses)
+    if args.once:
+        failed = scheduler.run_once()
+        print(f"Prefetched {spot_count - failed} of {spot_count} spots.")
+        return
+
+    print(
+        f"Prefetching {spot_count} spots every {args.interval:g} minutes "
+        "(Ctrl-C to stop)"
+    )
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduler.save()
+
+
+def print_stats():
+    """Prints the request metrics of this run to stderr."""
+    metrics = getattr(surfline, "metrics", None)
+    if metrics is not None and len(metrics):
+        print(metrics.summary(), file=sys.stderr)
+    elif surfline is not None and metrics is None:
+        print(
+            "Lookups went through the daemon; see its /metrics route.", file=sys.stderr
+        )
+    else:
+        print("No API requests were made.", file=sys.stderr)
+
+
 def main():
     args = parse_arguments()
+    setup_logger()
+    try:
+        run(args)
+    finally:
+        if getattr(args, "stats", False):
+            print_stats()
 
-    if args.search:
-        spot_id = handle_search(args.search_string)
-        if spot_id is not None:
-            spot_forecast = surfline.get_spot_forecast(spot_id, args.days)
-            spot_report = surfline.get_spot_report(spot_id, args.days)
-            # display_spot_forecast(spot_forecast)
-            # display_spot_report(spot_report)
-            display_combined_spot_report(spot_forecast, spot_report)
-    else:
-        current_region_id = "58f7ed51dadb30820bb38782"
-        while True:
-            region_data = surfline.get_region_list(current_region_id)
 
-            if not region_data:  # Handle empty response
-                print("Failed to fetch region data.")
-                continue
+def run(args):
+    """Runs the command or interactive mode selected by ``args``."""
+    if args.no_cache:
+        get_surfline(use_cache=False)
 
-            if isinstance(region_data, list):  # Now returns a list of Region objects
-                regions = sort_regions(region_data)
-            else:
-                print("Unexpected region data format.")
-                continue
+    if args.command == "batch":
+        handle_batch(args)
+        return
 
-            display_regions(regions, args.verbose)
+    if args.command == "rank":
+        handle_rank(args)
+        return
 
-            choice = get_user_choice(regions)
-            if choice == 0:
-                print("Returning to the previous region.")
-                continue
+    if args.command == "taxonomy":
+        handle_taxonomy(args)
+        return
 
-            current_region = regions[choice - 1]
+    if args.command == "serve":
+        handle_serve(args)
+        return
 
-            if current_region.type == "subregion":
-                region_overview = surfline.get_region_overview(current_region.subregion)
-                if region_overview:
-                    display_region_overview(region_overview)
+    if args.command == "prefetch":
+        handle_prefetch(args)
+        return
 
-            current_region_id = current_region.id
+    if args.clear_cache:
+        from surf_report.utils.cache import ResponseCache
+
+        ResponseCache().clear()
+        print("Response cache cleared.")
+        return
+
+    # The daemon shares its cache, so --no-cache runs stay local.
+    daemon = not args.no_cache and use_daemon()
+
+    if args.search:
+        client = get_surfline()
+        # The daemon searches its own index; building one here is wasted.
+        if not daemon:
+            from surf_report.providers.surfline.search_index import SpotSearchIndex
+            from surf_report.providers.surfline.taxonomy import TaxonomyIndex
 
-            if current_region.type == "spot":
-                spot_forecast = surfline.get_spot_forecast(current_region.spot)
-                if spot_forecast:
-                    display_spot_forecast(spot_forecast)
+            taxonomy = TaxonomyIndex.load()
+            if taxonomy is not None:
+                client.search_index = SpotSearchIndex.from_taxonomy(taxonomy)
+        spot_id = handle_search(args.search_string)
+        if spot_id is not None:
+            spot_forecast = client.get_spot_forecast(spot_id, args.days)
+            spot_report = client.get_spot_report(
+                spot_id, args.days, sections=args.sections
+            )
+            # display_spot_forecast(spot_forecast)
+            # display_spot_report(spot_report)
+            display_combined_spot_report(spot_forecast, spot_report, args.sections)
+    else:
+        browse_regions(args)
 
 
 if __name__ == "__main__":
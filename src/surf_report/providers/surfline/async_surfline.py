@@ -0,0 +1,176 @@
+"""
+Asyncio-native Surfline client built on a pooled ``httpx.AsyncClient``.
+
+Requires the optional ``async`` extra: ``pip install "surfreport[async]"``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+from surf_report.providers.surfline.models import (
+    Region,
+    SpotForecast,
+    SpotReport,
+    SurflineSearchResult,
+)
+from surf_report.providers.surfline.surfline import (
+    DEFAULT_HEADERS,
+    Endpoints,
+    kbyg_params,
+    parse_region_list,
+    parse_search_results,
+    rebase_url,
+    resolve_base_url,
+)
+from surf_report.providers.surfline.timeseries import section_endpoints
+from surf_report.utils.logger import logger
+from surf_report.utils.user_agent import get_user_agent
+
+if TYPE_CHECKING:
+    import httpx
+
+DEFAULT_MAX_CONCURRENCY = 100
+DEFAULT_TIMEOUT = 10.0
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError(
+            "AsyncSurflineAPI requires httpx. "
+            'Install it with: pip install "surfreport[async]"'
+        ) from exc
+    return httpx
+
+
+class AsyncSurflineAPI:
+    """
+    Async counterpart of ``SurflineAPI`` returning the same model dataclasses.
+
+    All requests share one connection pool, and at most ``max_concurrency``
+    requests are in flight at any time, so a single event loop can serve
+    many concurrent spot lookups.
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+        base_url: Optional[str] = None,
+    ):
+        """
+        Args:
+            client (httpx.AsyncClient, optional): Client to issue requests with.
+                A pooled client sized to ``max_concurrency`` is created if omitted.
+            max_concurrency (int): Upper bound on simultaneous requests.
+            timeout (float): Per-request timeout in seconds for the default client.
+            base_url (str, optional): Scheme and host to send requests to, as
+                for ``SurflineAPI``.
+        """
+        logger.info("Initializing AsyncSurflineAPI")
+        httpx = _import_httpx()
+        self.max_concurrency = max(1, max_concurrency)
+        self.base_url = resolve_base_url(base_url)
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+            timeout=timeout,
+        )
+        headers = DEFAULT_HEADERS.copy()
+        headers["User-Agent"] = get_user_agent()
+        self.client.headers.update(headers)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._http_error = httpx.HTTPError
+
+    async def __aenter__(self) -> AsyncSurflineAPI:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying client if this instance created it."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _get(self, url: str, params: dict) -> Optional[dict]:
+        """A generic GET request handler."""
+        url = rebase_url(url, self.base_url)
+        async with self._semaphore:
+            try:
+                logger.debug("Requesting %s with params %s", url, params)
+                response = await self.client.get(url, params=params)
+                response.raise_for_status()
+                logger.info("Successful API response from %s", url)
+                return response.json()
+            except (self._http_error, ValueError) as e:
+                logger.error(
+                    "Error fetching from %s with params %s: %s", url, params, e
+                )
+                return None
+
+    async def search_surfline(self, query: str) -> List[SurflineSearchResult]:
+        """Search for a query on the Surfline API and return structured data."""
+        params = {"q": query, "querySize": 5, "suggestionSize": 5}
+        data = await self._get(Endpoints.SEARCH.value, params)
+        if not data or not isinstance(data, list):
+            logger.error("Unexpected response format for search_surfline.")
+            return []
+        return parse_search_results(data)
+
+    async def get_region_list(
+        self, taxonomy_id: str, max_depth: int = 0
+    ) -> List[Region]:
+        """Get a list of regions from the Surfline API and return structured data."""
+        params = {"type": "taxonomy", "id": taxonomy_id, "maxDepth": max_depth}
+        data = await self._get(Endpoints.TAXONOMY.value, params)
+        if not data or "contains" not in data:
+            logger.error("Invalid response data for taxonomy ID %s", taxonomy_id)
+            return []
+        return parse_region_list(data)
+
+    async def get_region_overview(self, region_id: str) -> Optional[dict]:
+        """Get the overview of a region."""
+        params = {"subregionId": region_id}
+        return await self._get(Endpoints.REGION_OVERVIEW.value, params)
+
+    async def get_spot_forecast(
+        self, spot_id: str, days: int = 5
+    ) -> Optional[SpotForecast]:
+        """Fetch and return a structured spot forecast."""
+        params = {"spotId": spot_id, "days": days}
+        data = await self._get(Endpoints.SPOT_FORECAST.value, params)
+        if data:
+            return SpotForecast(spot_id=spot_id, days=days, forecast_data=data)
+        return None
+
+    async def get_spot_report(
+        self,
+        spot_id: str,
+        days: int = 3,
+        interval_hours: int = 6,
+        sections: Optional[Iterable[str]] = None,
+    ) -> Optional[SpotReport]:
+        """
+        Fetch and return a structured spot report, requesting the KBYG
+        endpoints behind ``sections`` (all sections by default) concurrently.
+        Endpoints that fail are stored as ``None``.
+        """
+        params = kbyg_params(spot_id, days, interval_hours)
+        names = section_endpoints(sections)
+        results = await asyncio.gather(
+            *(
+                self._get(f"{Endpoints.KBYG_BASE.value}/{name}", params)
+                for name in names
+            )
+        )
+        return SpotReport(
+            spot_id=spot_id, days=days, report_data=dict(zip(names, results))
+        )
@@ -0,0 +1,279 @@
+"""
+Local forecast daemon.
+
+``surfreport serve`` keeps one warm ``SurflineAPI`` (session, connection
+pool, response cache and search index) in a long-running process and serves
+its lookups as JSON over HTTP on a Unix socket, or on a localhost TCP port.
+Encoded responses are also kept in memory for as long as the response
+cache would keep them fresh, so a repeated query costs one local round trip.
+
+See ``daemon_client`` for the client the CLI uses.
+"""
+
+import json
+import os
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from urllib.parse import parse_qsl, urlsplit
+
+from surf_report.providers.surfline.daemon_client import connect
+from surf_report.providers.surfline.protocols import LookupClient
+from surf_report.providers.surfline.surfline import CACHE_TTLS, Endpoints
+from surf_report.utils.logger import logger
+from surf_report.utils.paths import daemon_socket_path
+
+MEMO_SIZE = 512
+JSON_TYPE = "application/json"
+PROMETHEUS_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Route = Callable[[LookupClient, Dict[str, str]], Any]
+
+
+def _health(api: LookupClient, params: Dict[str, str]) -> dict:
+    return {"status": "ok", "pid": os.getpid()}
+
+
+def _metrics(api: LookupClient, params: Dict[str, str]) -> str:
+    return api.metrics.to_prometheus()
+
+
+class Uncached:
+    """An answer to serve but not memoise, such as a partial report."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+# search_surfline and get_region_list return an empty list when the request
+# fails, so an empty answer is not memoised: it may be a transient error.
+def _search(api: LookupClient, params: Dict[str, str]) -> Optional[List[dict]]:
+    results = api.search_surfline(params["q"])
+    return [asdict(result) for result in results] or None
+
+
+def _taxonomy(api: LookupClient, params: Dict[str, str]) -> Optional[dict]:
+    return api.get_taxonomy(params["id"], int(params.get("maxDepth", 0)))
+
+
+def _regions(api: LookupClient, params: Dict[str, str]) -> Optional[List[dict]]:
+    regions = api.get_region_list(params["id"], int(params.get("maxDepth", 0)))
+    return [asdict(region) for region in regions] or None
+
+
+def _region_overview(api: LookupClient, params: Dict[str, str]) -> Optional[dict]:
+    return api.get_region_overview(params["id"])
+
+
+def _spot_forecast(api: LookupClient, params: Dict[str, str]) -> Optional[dict]:
+    forecast = api.get_spot_forecast(params["spotId"], int(params["days"]))
+    return forecast.forecast_data if forecast is not None else None
+
+
+def _spot_report(api: LookupClient, params: Dict[str, str]) -> Any:
+    sections = params.get("sections")
+    report = api.get_spot_report(
+        params["spotId"],
+        int(params["days"]),
+        int(params["intervalHours"]),
+        sections=sections.split(",") if sections is not None else None,
+    )
+    if report is None:
+        return None
+    failed = [name for name, data in report.report_data.items() if data is None]
+    if failed and len(failed) == len(report.report_data):
+        return None
+    # Endpoints that failed are None; retry them on the next request.
+    return Uncached(report.report_data) if failed else report.report_data
+
+
+# Path -> (handler, how long its answers may be served from memory).
+ROUTES: Dict[str, Tuple[Route, float]] = {
+    "/health": (_health, 0),
+    "/metrics": (_metrics, 0),
+    "/search": (_search, CACHE_TTLS[Endpoints.SEARCH]),
+    "/taxonomy": (_taxonomy, CACHE_TTLS[Endpoints.TAXONOMY]),
+    "/regions": (_regions, CACHE_TTLS[Endpoints.TAXONOMY]),
+    "/regions/overview": (_region_overview, CACHE_TTLS[Endpoints.REGION_OVERVIEW]),
+    "/spots/forecast": (_spot_forecast, CACHE_TTLS[Endpoints.SPOT_FORECAST]),
+    "/spots/report": (_spot_report, CACHE_TTLS[Endpoints.KBYG_BASE]),
+}
+
+
+class ResponseMemo:
+    """Thread-safe, size-bounded map of request targets to encoded bodies."""
+
+    def __init__(self, max_entries: int = MEMO_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, target: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(target)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[target]
+                return None
+            self._entries.move_to_end(target)
+            return entry[1]
+
+    def set(self, target: str, body: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[target] = (time.monotonic() + ttl, body)
+            self._entries.move_to_end(target)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """Answers ``GET <route>?<params>`` with the JSON of the API result."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        started = time.perf_counter()
+        target = self.path
+        server = cast(DaemonHTTPServer, self.server)
+        status, body, content_type = server.handle_target(target)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        logger.debug(
+            "Served %s (%d) in %.1fms",
+            target,
+            status,
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def address_string(self) -> str:
+        # Unix socket peers have no address.
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class DaemonHTTPServer:
+    """Request dispatch shared by the Unix socket and TCP servers."""
+
+    api: LookupClient
+    memo: ResponseMemo
+
+    def handle_target(self, target: str) -> Tuple[int, bytes, str]:
+        """
+        Return the status, body and content type answering ``target``.
+
+        Routes answer JSON, except ``/metrics`` which answers the Prometheus
+        text format. Failed lookups, for which handlers return None, answer
+        404 and are not memoised, so the next request tries again.
+        """
+        parts = urlsplit(target)
+        route = ROUTES.get(parts.path)
+        if route is None:
+            return 404, b'{"error": "unknown route"}', JSON_TYPE
+        body = self.memo.get(target)
+        if body is not None:
+            return 200, body, JSON_TYPE
+
+        handler, ttl = route
+        try:
+            data = handler(self.api, dict(parse_qsl(parts.query)))
+        except (KeyError, ValueError) as e:
+            error = json.dumps({"error": f"bad parameters: {e}"}).encode()
+            return 400, error, JSON_TYPE
+        if data is None:
+            return 404, b'{"error": "no data"}', JSON_TYPE
+        if isinstance(data, str):
+            return 200, data.encode("utf-8"), PROMETHEUS_TYPE
+        if isinstance(data, Uncached):
+            data, ttl = data.value, 0
+        body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        if ttl:
+            self.memo.set(target, body, ttl)
+        return 200, body, JSON_TYPE
+
+
+class UnixDaemonServer(
+    DaemonHTTPServer, socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+    def __init__(self, path: Path, api: LookupClient, memo: ResponseMemo):
+        self.api = api
+        self.memo = memo
+        self.socket_path = path
+        super().__init__(str(path), DaemonRequestHandler)
+        os.chmod(path, 0o600)
+
+    @property
+    def endpoint(self) -> str:
+        return str(self.socket_path)
+
+
+class TCPDaemonServer(DaemonHTTPServer, ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], api: LookupClient, memo: ResponseMemo):
+        self.api = api
+        self.memo = memo
+        super().__init__(address, DaemonRequestHandler)
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def build_server(
+    api: LookupClient,
+    socket_path: Optional[Path] = None,
+    port: Optional[int] = None,
+):
+    """
+    Bind a daemon server for ``api``.
+
+    Args:
+        api (LookupClient): The warm client every request is served from.
+        socket_path (Path, optional): Unix socket to listen on. Defaults to
+            ``daemon_socket_path()``.
+        port (int, optional): Listen on ``127.0.0.1:port`` instead.
+
+    Raises:
+        RuntimeError: If another daemon already answers on the socket.
+    """
+    memo = ResponseMemo()
+    if port is not None:
+        return TCPDaemonServer(("127.0.0.1", port), api, memo)
+
+    path = Path(socket_path or daemon_socket_path())
+    if path.exists():
+        running = connect(path)
+        if running is not None:
+            running.close()
+            raise RuntimeError(f"A surfreport daemon is already serving {path}")
+        path.unlink()  # left behind by a daemon that did not shut down cleanly
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return UnixDaemonServer(path, api, memo)
+
+
+def serve(server) -> None:
+    """Serve until interrupted, then release the socket."""
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if isinstance(server, UnixDaemonServer):
+            server.socket_path.unlink(missing_ok=True)
@@ -0,0 +1,153 @@
+"""
+Client for the local forecast daemon started by ``surfreport serve``.
+
+Kept apart from the server so the CLI can talk to a running daemon without
+importing the HTTP stack.
+"""
+
+import http.client
+import json
+import socket
+import threading
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from surf_report.providers.surfline.models import (
+    Region,
+    SpotForecast,
+    SpotReport,
+    SurflineSearchResult,
+)
+from surf_report.utils.logger import logger
+from surf_report.utils.paths import daemon_socket_path
+
+DEFAULT_CONNECT_TIMEOUT = 0.5
+DEFAULT_TIMEOUT = 30.0
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """``HTTPConnection`` over a Unix domain socket."""
+
+    def __init__(self, path: Path, timeout: float = DEFAULT_TIMEOUT):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = str(path)
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class DaemonClient:
+    """
+    Client for a running daemon, offering the ``SurflineAPI`` lookups used by
+    the interactive CLI. Failed lookups return None (or an empty list), as
+    they do on ``SurflineAPI``.
+    """
+
+    # The daemon owns the search index; assigning one here has no effect.
+    search_index = None
+
+    def __init__(self, connection: http.client.HTTPConnection):
+        self._connection = connection
+        self._lock = threading.Lock()
+
+    def _send(self, target: str) -> Tuple[int, bytes]:
+        with self._lock:
+            try:
+                self._connection.request("GET", target)
+                response = self._connection.getresponse()
+                return response.status, response.read()
+            except (OSError, http.client.HTTPException):
+                self._connection.close()
+                raise
+
+    def _request(self, route: str, **params: Any) -> Optional[Any]:
+        target = f"{route}?{urlencode(params)}" if params else route
+        try:
+            status, body = self._send(target)
+        except (OSError, http.client.HTTPException) as e:
+            logger.error("Daemon request %s failed: %s", target, e)
+            return None
+        if status != 200:
+            logger.debug("Daemon answered %s with %d", target, status)
+            return None
+        return json.loads(body)
+
+    def ping(self) -> bool:
+        """Return whether the daemon answers its health check."""
+        try:
+            return self._send("/health")[0] == 200
+        except (OSError, http.client.HTTPException) as e:
+            logger.debug("No daemon answering: %s", e)
+            return False
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def search_surfline(self, query: str) -> List[SurflineSearchResult]:
+        results = self._request("/search", q=query) or []
+        return [SurflineSearchResult(**result) for result in results]
+
+    def get_taxonomy(self, taxonomy_id: str, max_depth: int = 0) -> Optional[dict]:
+        return self._request("/taxonomy", id=taxonomy_id, maxDepth=max_depth)
+
+    def get_region_list(self, taxonomy_id: str, max_depth: int = 0) -> List[Region]:
+        regions = self._request("/regions", id=taxonomy_id, maxDepth=max_depth) or []
+        return [Region(**region) for region in regions]
+
+    def get_region_overview(self, region_id: str) -> Optional[dict]:
+        return self._request("/regions/overview", id=region_id)
+
+    def get_spot_forecast(self, spot_id: str, days: int = 5) -> Optional[SpotForecast]:
+        data = self._request("/spots/forecast", spotId=spot_id, days=days)
+        if data is None:
+            return None
+        return SpotForecast(spot_id=spot_id, days=days, forecast_data=data)
+
+    def get_spot_report(
+        self,
+        spot_id: str,
+        days: int = 3,
+        interval_hours: int = 6,
+        columnar: bool = False,
+        sections: Optional[Iterable[str]] = None,
+    ) -> Optional[SpotReport]:
+        params: dict = {"spotId": spot_id, "days": days, "intervalHours": interval_hours}
+        if sections is not None:
+            sections = list(sections)
+            params["sections"] = ",".join(sections)
+        data = self._request("/spots/report", **params)
+        if data is None:
+            return None
+        report = SpotReport(spot_id=spot_id, days=days, report_data=data)
+        return report.to_columnar(sections) if columnar else report
+
+
+def connect(
+    socket_path: Optional[Path] = None, timeout: float = DEFAULT_CONNECT_TIMEOUT
+) -> Optional[DaemonClient]:
+    """
+    Return a client for the daemon on ``socket_path``, or None when no
+    daemon answers there.
+    """
+    path = Path(socket_path or daemon_socket_path())
+    if not path.exists():
+        return None
+    connection = UnixHTTPConnection(path, timeout=timeout)
+    client = DaemonClient(connection)
+    if not client.ping():
+        client.close()
+        return None
+    # Probe quickly, but give real lookups time to reach Surfline.
+    connection.timeout = DEFAULT_TIMEOUT
+    if connection.sock is not None:
+        connection.sock.settimeout(DEFAULT_TIMEOUT)
+    logger.debug("Using surfreport daemon at %s", path)
+    return client
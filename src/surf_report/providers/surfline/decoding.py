@@ -0,0 +1,99 @@
+"""
+Selective decoding of KBYG response bodies.
+
+Report endpoints return far more than the report sections read: units,
+location metadata, per-row probabilities, raw heights and so on. With a
+projection, only the keys named by the ``TimeSeries`` field specs survive
+decoding, so the rest never becomes long-lived Python objects.
+
+``orjson`` is used when installed (``pip install "surfreport[fast]"``);
+otherwise the standard library decoder drops unwanted keys as each object
+is parsed.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional, Union
+
+from surf_report.providers.surfline.timeseries import (
+    SUNLIGHT_FIELDS,
+    SURF_FIELDS,
+    SWELL_FIELDS,
+    TIDE_FIELDS,
+    WEATHER_FIELDS,
+    WIND_FIELDS,
+    FieldSpec,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+ROW_KEYS = frozenset({"data", "timestamp", "utcOffset"})
+
+
+def _keys(*specs: FieldSpec) -> FrozenSet[str]:
+    return frozenset(key for spec in specs for path in spec.values() for key in path)
+
+
+# KBYG endpoint name -> keys kept anywhere in its response.
+PROJECTIONS: Dict[str, FrozenSet[str]] = {
+    "wave": ROW_KEYS | {"wave", "swells"} | _keys(SURF_FIELDS, SWELL_FIELDS),
+    "surf": ROW_KEYS | {"surf"} | _keys(SURF_FIELDS),
+    "swells": ROW_KEYS | {"swells"} | _keys(SWELL_FIELDS),
+    "weather": ROW_KEYS | {"weather"} | _keys(WEATHER_FIELDS),
+    "tides": ROW_KEYS | {"tides"} | _keys(TIDE_FIELDS),
+    "wind": ROW_KEYS | {"wind"} | _keys(WIND_FIELDS),
+    "sunlight": ROW_KEYS | {"sunlight"} | _keys(SUNLIGHT_FIELDS),
+}
+
+
+def projection_for(endpoint: str) -> Optional[FrozenSet[str]]:
+    """Return the keys to keep for a KBYG endpoint such as ``/wave``."""
+    return PROJECTIONS.get(endpoint.strip("/"))
+
+
+def project(value: Any, keys: FrozenSet[str]) -> Any:
+    """Return a copy of ``value`` without object entries whose key is not in ``keys``.
+
+    Copying, rather than deleting in place, lets the dropped objects and the
+    oversized original dicts be freed together.
+    """
+    if type(value) is dict:
+        return {k: project(v, keys) for k, v in value.items() if k in keys}
+    if type(value) is list:
+        return [project(item, keys) for item in value]
+    return value
+
+
+@lru_cache(maxsize=None)
+def _projecting_decoder(keys: FrozenSet[str]) -> json.JSONDecoder:
+    def keep_selected(pairs):
+        return {key: value for key, value in pairs if key in keys}
+
+    return json.JSONDecoder(object_pairs_hook=keep_selected)
+
+
+def decode_json(body: Union[bytes, str], keys: Optional[FrozenSet[str]] = None) -> Any:
+    """
+    Decode a JSON document, keeping only ``keys`` when given.
+
+    Args:
+        body (bytes | str): The raw response body.
+        keys (frozenset, optional): Object keys to keep at any depth.
+
+    Returns:
+        The decoded document.
+
+    Raises:
+        ValueError: If ``body`` is not valid JSON.
+    """
+    if orjson is not None:
+        data = orjson.loads(body)
+        return project(data, keys) if keys is not None else data
+    if isinstance(body, bytes):
+        body = body.decode("utf-8")
+    if keys is None:
+        return json.loads(body)
+    return _projecting_decoder(keys).decode(body)
@@ -0,0 +1,242 @@
+"""
+Machine-readable exports of grouped spot reports.
+
+Writers take one spot at a time (the output of ``group_report``) and write
+it out day by day, so a batch of any size is never held in memory at once:
+
+* ``jsonl``: one JSON object per spot and day, with a list per section.
+* ``csv``: one row per section entry, in a long layout with a fixed header.
+* ``parquet``: the same long layout as typed Arrow columns, one row group
+  per spot. Requires the optional ``parquet`` extra.
+"""
+
+import csv
+import importlib
+import json
+from datetime import date, time
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from surf_report.providers.surfline.processing import SECTIONS
+from surf_report.providers.surfline.timeseries import (
+    SUNLIGHT_EVENTS,
+    SURF_FIELDS,
+    SWELL_FIELDS,
+    TEXT_FIELDS,
+    TIDE_FIELDS,
+    WEATHER_FIELDS,
+    WIND_FIELDS,
+    row_values,
+)
+
+FORMATS = ("jsonl", "csv", "parquet")
+
+# Section -> exported value fields. Sunlight values are local times.
+SECTION_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "surf": tuple(SURF_FIELDS),
+    "swells": tuple(SWELL_FIELDS),
+    "weather": tuple(WEATHER_FIELDS),
+    "tides": tuple(TIDE_FIELDS),
+    "wind": tuple(WIND_FIELDS),
+    "sunlight": SUNLIGHT_EVENTS,
+}
+
+KEY_COLUMNS = ("spot_id", "date", "section", "time")
+# Every value field once, in section order; sections share e.g. ``height``.
+VALUE_COLUMNS = tuple(
+    dict.fromkeys(field for section in SECTIONS for field in SECTION_FIELDS[section])
+)
+COLUMNS = KEY_COLUMNS + VALUE_COLUMNS
+
+
+def iter_section_rows(
+    grouped_data: dict,
+) -> Iterator[Tuple[str, str, Tuple[str, ...], List[List[Any]]]]:
+    """
+    Yield ``(day, section, fields, columns)`` for each non-empty section,
+    day by day. ``columns`` holds the ``time`` column followed by one list
+    per field; sunlight has no ``time`` of its own, so that column is None.
+    """
+    for day in sorted(grouped_data):
+        data = grouped_data[day]
+        for section in SECTIONS:
+            rows = data.get(section)
+            if not rows:
+                continue
+            fields = SECTION_FIELDS[section]
+            if section == "sunlight":
+                columns = [[None] * len(rows), *row_values(rows, fields)]
+            else:
+                columns = row_values(rows, ("time", *fields))
+            yield day, section, fields, columns
+
+
+class ReportWriter:
+    """Base class for streaming report exporters."""
+
+    def __init__(self, output: IO):
+        """
+        Args:
+            output: Stream the export is written to. It is not closed by the
+                writer.
+        """
+        self.output = output
+
+    def write(self, spot_id: str, grouped_data: dict) -> None:
+        """Write one spot's grouped report."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flush anything buffered by the writer."""
+        self.output.flush()
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class JsonLinesWriter(ReportWriter):
+    """Writes one JSON object per spot and day."""
+
+    def write(self, spot_id: str, grouped_data: dict) -> None:
+        record: Optional[Dict[str, Any]] = None
+        for day, section, fields, columns in iter_section_rows(grouped_data):
+            if record is None or record["date"] != day:
+                if record is not None:
+                    self._dump(record)
+                record = {"spot_id": spot_id, "date": day}
+                record.update({name: [] for name in SECTIONS})
+            if section == "sunlight":
+                names, columns = fields, columns[1:]
+            else:
+                names = ("time", *fields)
+            record[section] = [dict(zip(names, row)) for row in zip(*columns)]
+        if record is not None:
+            self._dump(record)
+
+    def _dump(self, record: dict) -> None:
+        self.output.write(json.dumps(record, separators=(",", ":")))
+        self.output.write("\n")
+
+
+class CsvWriter(ReportWriter):
+    """Writes one row per section entry under a fixed header."""
+
+    def __init__(self, output: IO, header: bool = True):
+        super().__init__(output)
+        self._writer = csv.writer(output)
+        if header:
+            self._writer.writerow(COLUMNS)
+        self._positions = {name: i for i, name in enumerate(COLUMNS)}
+
+    def write(self, spot_id: str, grouped_data: dict) -> None:
+        width = len(COLUMNS)
+        for day, section, fields, columns in iter_section_rows(grouped_data):
+            positions = [self._positions[field] for field in fields]
+            rows = []
+            for values in zip(*columns):
+                row: List[Any] = [None] * width
+                row[0], row[1], row[2], row[3] = spot_id, day, section, values[0]
+                for position, value in zip(positions, values[1:]):
+                    row[position] = value
+                rows.append(row)
+            self._writer.writerows(rows)
+
+
+def _import_pyarrow():
+    # Imported by name: pyarrow is an optional extra that type checkers
+    # may not have installed.
+    try:
+        pyarrow = importlib.import_module("pyarrow")
+        importlib.import_module("pyarrow.parquet")
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError(
+            "Parquet export requires pyarrow. "
+            'Install it with: pip install "surfreport[parquet]"'
+        ) from exc
+    return pyarrow
+
+
+def parquet_schema(pa):
+    """Arrow schema of the long export layout."""
+    fields = [
+        pa.field("spot_id", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("date", pa.date32()),
+        pa.field("section", pa.dictionary(pa.int8(), pa.string())),
+        pa.field("time", pa.time32("s")),
+    ]
+    for name in VALUE_COLUMNS:
+        if name in SUNLIGHT_EVENTS:
+            fields.append(pa.field(name, pa.time32("s")))
+        elif name in TEXT_FIELDS:
+            fields.append(pa.field(name, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            fields.append(pa.field(name, pa.float64()))
+    return pa.schema(fields)
+
+
+def _parse_time(value: Optional[str]) -> Optional[time]:
+    return time.fromisoformat(value) if value else None
+
+
+class ParquetWriter(ReportWriter):
+    """Writes the long layout as typed columns, one row group per spot."""
+
+    def __init__(self, output: IO):
+        super().__init__(output)
+        self._pa = _import_pyarrow()
+        self.schema = parquet_schema(self._pa)
+        self._writer = self._pa.parquet.ParquetWriter(output, self.schema)
+
+    def write(self, spot_id: str, grouped_data: dict) -> None:
+        columns: Dict[str, List[Any]] = {name: [] for name in COLUMNS}
+        length = 0
+        for day, section, fields, values in iter_section_rows(grouped_data):
+            count = len(values[0])
+            columns["spot_id"].extend([spot_id] * count)
+            columns["date"].extend([date.fromisoformat(day)] * count)
+            columns["section"].extend([section] * count)
+            columns["time"].extend(map(_parse_time, values[0]))
+            present = dict(zip(fields, values[1:]))
+            for name in VALUE_COLUMNS:
+                column = present.get(name)
+                if column is None:
+                    columns[name].extend([None] * count)
+                elif name in SUNLIGHT_EVENTS:
+                    columns[name].extend(map(_parse_time, column))
+                else:
+                    columns[name].extend(column)
+            length += count
+        if length:
+            table = self._pa.table(columns, schema=self.schema)
+            self._writer.write_table(table)
+
+    def close(self) -> None:
+        self._writer.close()
+        super().close()
+
+
+WRITERS = {
+    "jsonl": JsonLinesWriter,
+    "csv": CsvWriter,
+    "parquet": ParquetWriter,
+}
+
+
+def open_writer(fmt: str, output: IO) -> ReportWriter:
+    """
+    Create the writer for an export format.
+
+    Args:
+        fmt (str): One of ``FORMATS``.
+        output: Stream to write to; binary for ``parquet``, text otherwise.
+
+    Raises:
+        ValueError: If ``fmt`` is not a known format.
+    """
+    try:
+        writer_class = WRITERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unknown export format: {fmt}") from None
+    return writer_class(output)
@@ -0,0 +1,386 @@
+"""
+Local stand-in for the Surfline API.
+
+``FakeSurflineServer`` answers every ``Endpoints`` route (taxonomy, search,
+region overview, spot conditions and each KBYG report endpoint) over plain
+HTTP on localhost, from recorded payloads or the synthetic ones built by
+``synthetic``. Point a client at it with ``SurflineAPI(base_url=...)`` or
+the SURFREPORT_BASE_URL environment variable to exercise the real session,
+connection pool, retries, cache and decoding without network access.
+
+Each route can be given latency, jitter, a rate of server errors, a rate
+of ``429 Too Many Requests`` answers and a slow body that trickles out over
+a set time. Random choices come from one seeded generator, so a run with
+the same seed and request order injects the same faults.
+
+Run it on its own with ``python -m surf_report.providers.surfline.fake_server``.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union, cast
+from urllib.parse import parse_qsl, urlsplit
+
+from surf_report.providers.surfline.surfline import KBYG_ENDPOINTS, Endpoints
+from surf_report.providers.surfline.synthetic import (
+    make_conditions,
+    make_kbyg_payload,
+    make_region_overview,
+    make_search_results,
+    make_taxonomy,
+)
+from surf_report.providers.surfline.taxonomy import ROOT_TAXONOMY_ID
+from surf_report.utils.logger import logger
+
+# A recorded payload, or a function building one from the query parameters.
+Payload = Union[Any, Callable[[Dict[str, str]], Any]]
+
+# Chunks a slow body is written in.
+SLOW_BODY_CHUNKS = 8
+
+KBYG_NAMES = tuple(endpoint.lstrip("/") for endpoint in KBYG_ENDPOINTS)
+
+
+def _kbyg(name: str) -> Callable[[Dict[str, str]], Any]:
+    def build(params: Dict[str, str]) -> Any:
+        return make_kbyg_payload(
+            name, int(params.get("days", 3)), int(params.get("intervalHours", 6))
+        )
+
+    return build
+
+
+# Route name -> synthetic payload for the query parameters.
+SYNTHETIC: Dict[str, Callable[[Dict[str, str]], Any]] = {
+    "taxonomy": lambda params: make_taxonomy(
+        params.get("id", ROOT_TAXONOMY_ID), int(params.get("maxDepth", 0))
+    ),
+    "search": lambda params: make_search_results(params.get("q", "")),
+    "overview": lambda params: make_region_overview(params.get("subregionId", "")),
+    "conditions": lambda params: make_conditions(int(params.get("days", 5))),
+    **{name: _kbyg(name) for name in KBYG_NAMES},
+}
+
+# URL path -> route name.
+ROUTES: Dict[str, str] = {
+    urlsplit(Endpoints.TAXONOMY.value).path: "taxonomy",
+    urlsplit(Endpoints.SEARCH.value).path: "search",
+    urlsplit(Endpoints.REGION_OVERVIEW.value).path: "overview",
+    urlsplit(Endpoints.SPOT_FORECAST.value).path: "conditions",
+    **{
+        f"{urlsplit(Endpoints.KBYG_BASE.value).path}/{name}": name
+        for name in KBYG_NAMES
+    },
+}
+
+
+@dataclass(frozen=True)
+class RouteFaults:
+    """
+    Faults injected into the answers of one route.
+
+    Attributes:
+        latency (float): Seconds to wait before sending the headers.
+        jitter (float): Up to this many extra seconds, drawn uniformly.
+        error_rate (float): Fraction of requests answered ``error_status``.
+        error_status (int): Status of injected server errors.
+        throttle_rate (float): Fraction of requests answered ``429``.
+        retry_after (int): ``Retry-After`` seconds sent with a 429.
+        slow_body (float): Seconds spent writing the body, in chunks.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    throttle_rate: float = 0.0
+    retry_after: int = 0
+    slow_body: float = 0.0
+
+
+def load_recorded(path: Path) -> Dict[str, Any]:
+    """
+    Load recorded payloads keyed by route name.
+
+    ``path`` is either a JSON object mapping route names to payloads (like
+    ``SpotReport.report_data``) or a directory of ``<route>.json`` files.
+    """
+    if path.is_dir():
+        payloads = {}
+        for file in sorted(path.glob("*.json")):
+            with file.open(encoding="utf-8") as f:
+                payloads[file.stem] = json.load(f)
+        return payloads
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+class FakeRequestHandler(BaseHTTPRequestHandler):
+    """Answers ``GET`` requests for the Surfline routes, injecting faults."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle's
+    # algorithm and delayed ACKs add ~40ms to every keep-alive response.
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        cast(FakeSurflineServer, self.server).connection_opened()
+
+    def do_GET(self):
+        server = cast(FakeSurflineServer, self.server)
+        split = urlsplit(self.path)
+        route = ROUTES.get(split.path)
+        params = dict(parse_qsl(split.query))
+        server.request_started()
+        try:
+            self._answer(server, route, params)
+        finally:
+            server.request_finished()
+
+    def _answer(
+        self, server: "FakeSurflineServer", route: Optional[str], params: Dict[str, str]
+    ) -> None:
+        if route is None:
+            self._send(server, route, 404, b'{"message":"Not found"}')
+            return
+        faults = server.faults_for(route)
+        delay, status = server.draw(faults)
+        if delay:
+            time.sleep(delay)
+        if status == 429:
+            headers = {"Retry-After": str(faults.retry_after)}
+            self._send(server, route, 429, b'{"message":"Too many requests"}', headers)
+            return
+        if status is not None:
+            self._send(server, route, status, b'{"message":"Injected error"}')
+            return
+
+        body, etag = server.body(route, params)
+        if self.headers.get("If-None-Match") == etag:
+            self._send(server, route, 304, b"", {"ETag": etag})
+            return
+        self._send(server, route, 200, body, {"ETag": etag}, faults.slow_body)
+
+    def _send(
+        self,
+        server: "FakeSurflineServer",
+        route: Optional[str],
+        status: int,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        slow_body: float = 0.0,
+    ) -> None:
+        server.count(route, status)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if not slow_body or not body:
+            self.wfile.write(body)
+            return
+        size = -(-len(body) // SLOW_BODY_CHUNKS)
+        for start in range(0, len(body), size):
+            self.wfile.write(body[start : start + size])
+            self.wfile.flush()
+            time.sleep(slow_body / SLOW_BODY_CHUNKS)
+
+    def log_message(self, format, *args):
+        logger.debug("fake surfline - %s", format % args)
+
+
+class FakeSurflineServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server standing in for ``services.surfline.com``.
+
+    Counts connections, requests per route and status, and the most
+    requests ever handled at once, so tests can check how a client used
+    its connection pool.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int] = ("127.0.0.1", 0),
+        payloads: Optional[Dict[str, Payload]] = None,
+        faults: Optional[Dict[str, RouteFaults]] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            address (tuple): Host and port to listen on; port 0 picks a free one.
+            payloads (dict, optional): Recorded payloads by route name, each
+                a JSON value or a function of the query parameters. Routes
+                without one get synthetic payloads.
+            faults (dict, optional): ``RouteFaults`` by route name. The
+                ``"*"`` entry applies to routes without their own.
+            seed (int, optional): Seed of the generator behind jitter and
+                injected errors.
+        """
+        super().__init__(address, FakeRequestHandler)
+        self.payloads: Dict[str, Payload] = dict(payloads or {})
+        self.faults: Dict[str, RouteFaults] = dict(faults or {})
+        self.random = random.Random(seed)
+        self.connections = 0
+        self.requests: Counter = Counter()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._bodies: Dict[
+            Tuple[str, Tuple[Tuple[str, str], ...]], Tuple[bytes, str]
+        ] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """URL to pass as ``SurflineAPI(base_url=...)``."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def faults_for(self, route: str) -> RouteFaults:
+        return self.faults.get(route) or self.faults.get("*") or RouteFaults()
+
+    def set_faults(self, route: str = "*", **changes: Any) -> None:
+        """Change some fault settings of ``route`` (``"*"`` for the default)."""
+        with self._lock:
+            self.faults[route] = replace(
+                self.faults.get(route, RouteFaults()), **changes
+            )
+
+    def draw(self, faults: RouteFaults) -> Tuple[float, Optional[int]]:
+        """Pick the delay and any injected status for one request."""
+        with self._lock:
+            delay = faults.latency
+            if faults.jitter:
+                delay += self.random.uniform(0, faults.jitter)
+            roll = self.random.random()
+        if roll < faults.throttle_rate:
+            return delay, 429
+        if roll < faults.throttle_rate + faults.error_rate:
+            return delay, faults.error_status
+        return delay, None
+
+    def body(self, route: str, params: Dict[str, str]) -> Tuple[bytes, str]:
+        """Encoded payload of ``route`` for ``params`` and its ``ETag``."""
+        key = (route, tuple(sorted(params.items())))
+        with self._lock:
+            cached = self._bodies.get(key)
+        if cached is not None:
+            return cached
+        payload = self.payloads.get(route, SYNTHETIC[route])
+        if callable(payload):
+            payload = payload(params)
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        with self._lock:
+            self._bodies[key] = (body, etag)
+        return body, etag
+
+    def connection_opened(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def request_started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def request_finished(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def count(self, route: Optional[str], status: int) -> None:
+        with self._lock:
+            self.requests[(route or "unknown", status)] += 1
+
+    def route_count(self, route: str) -> int:
+        """Requests answered on ``route``, whatever their status."""
+        with self._lock:
+            return sum(n for (name, _), n in self.requests.items() if name == route)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.connections = 0
+            self.requests.clear()
+            self.peak_in_flight = self.in_flight
+
+    def start(self) -> "FakeSurflineServer":
+        """Serve from a background daemon thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="fake-surfline",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self) -> "FakeSurflineServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Serve a local stand-in for the Surfline API."
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--payloads",
+        type=Path,
+        help="JSON file or directory of recorded payloads by route name",
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="ms per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra ms, random")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--slow-body", type=float, default=0.0, help="ms per body")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    faults = RouteFaults(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        slow_body=args.slow_body / 1000,
+    )
+    server = FakeSurflineServer(
+        ("127.0.0.1", args.port),
+        payloads=load_recorded(args.payloads) if args.payloads else None,
+        faults={"*": faults},
+        seed=args.seed,
+    )
+    print(f"Serving the Surfline API on {server.base_url}")
+    print(f"Use it with: SURFREPORT_BASE_URL={server.base_url} surfreport ...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
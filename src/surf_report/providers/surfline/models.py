@@ -1,5 +1,14 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+from surf_report.providers.surfline.timeseries import (
+    TimeSeries,
+    build_report_series,
+    section_endpoints,
+)
+
+# Fetches KBYG endpoint payloads by endpoint name, e.g. ["wind", "tides"].
+EndpointLoader = Callable[[List[str]], Dict[str, Optional[dict]]]
 
 
 @dataclass
@@ -13,6 +22,17 @@ class Region:
     spot: Optional[str] = None
 
 
+def parse_region(item: dict) -> Region:
+    """Convert a single taxonomy item into a region."""
+    return Region(
+        id=item["_id"],
+        name=item["name"],
+        type=item["type"],
+        subregion=item.get("subregion"),
+        spot=item.get("spot"),
+    )
+
+
 @dataclass
 class SpotForecast:
     """Represents a surf spot forecast."""
@@ -24,11 +44,54 @@ class SpotForecast:
 
 @dataclass
 class SpotReport:
-    """Represents a detailed surf spot report."""
+    """
+    Represents a detailed surf spot report.
+
+    ``report_data`` maps KBYG endpoint names to their payloads. A report
+    with a ``loader`` may hold only some of them; the rest are fetched the
+    first time ``load`` asks for them.
+    """
 
     spot_id: str
     days: int
     report_data: dict
+    series: Optional[Dict[str, TimeSeries]] = None
+    # KBYG endpoint name -> conditional request headers for its last response.
+    validators: Optional[Dict[str, Dict[str, str]]] = None
+    loader: Optional[EndpointLoader] = field(default=None, repr=False, compare=False)
+
+    def load(self, endpoints: Iterable[str]) -> dict:
+        """
+        Return ``report_data`` after fetching any of ``endpoints`` it lacks.
+
+        Endpoints are fetched at most once, even if they failed.
+        """
+        missing = [name for name in endpoints if name not in self.report_data]
+        if missing and self.loader is not None:
+            self.report_data.update(self.loader(missing))
+        return self.report_data
+
+    def to_columnar(self, sections: Optional[Iterable[str]] = None) -> "SpotReport":
+        """
+        Return a copy holding one ``TimeSeries`` per report section in place
+        of the raw endpoint payloads, which take several times the memory.
+
+        Args:
+            sections (Iterable[str], optional): Build only these sections,
+                loading only the endpoints they need. Defaults to all.
+        """
+        if sections is not None:
+            sections = list(sections)
+        series = self.series or build_report_series(
+            self.load(section_endpoints(sections)), sections
+        )
+        return SpotReport(
+            spot_id=self.spot_id,
+            days=self.days,
+            report_data={},
+            series=series,
+            validators=self.validators,
+        )
 
 
 @dataclass
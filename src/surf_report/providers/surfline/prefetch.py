@@ -0,0 +1,329 @@
+"""
+Background prefetching of favourite spots.
+
+The scheduler keeps the response cache warm for a list of favourite spots
+by fetching each spot's forecast and report on an interval, so a later
+``surfreport`` run for one of them is answered from the cache. First
+refreshes are staggered across the interval rather than sent in a burst,
+every delay carries some random jitter, requests go through the client's
+rate limiter, and a spot that fails is retried sooner with backoff.
+
+Per-spot refresh times and failure counts are saved next to the cache so
+``surfreport prefetch --status`` can report them from any process.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from surf_report.providers.surfline.protocols import ForecastClient
+from surf_report.providers.surfline.surfline import SurflineAPI
+from surf_report.utils.cache import ResponseCache
+from surf_report.utils.helpers import read_spot_ids
+from surf_report.utils.logger import logger
+from surf_report.utils.paths import user_cache_dir, user_config_dir
+from surf_report.utils.transport import TransportPolicy
+
+FAVOURITES_FILENAME = "favourites.txt"
+STATE_FILENAME = "prefetch.json"
+STATE_VERSION = 1
+DEFAULT_INTERVAL = 15 * 60
+DEFAULT_JITTER = 0.1
+DEFAULT_RATE_LIMIT = 2.0
+RETRY_DELAY = 60
+
+
+def default_favourites_path() -> Path:
+    """Location of the favourites list inside the user config directory."""
+    return user_config_dir() / FAVOURITES_FILENAME
+
+
+def default_state_path() -> Path:
+    """Location of the saved prefetch status inside the user cache directory."""
+    return user_cache_dir() / STATE_FILENAME
+
+
+def load_favourites(path: Optional[Path] = None) -> List[str]:
+    """
+    Read favourite spot IDs, one per line with # comments allowed.
+
+    Returns:
+        List[str]: The spot IDs in file order without duplicates; empty if
+        the file does not exist.
+    """
+    path = path or default_favourites_path()
+    try:
+        with path.open(encoding="utf-8") as file:
+            return list(dict.fromkeys(read_spot_ids(file)))
+    except FileNotFoundError:
+        return []
+
+
+@dataclass
+class SpotStatus:
+    """
+    Prefetch history of one spot. Times are Unix timestamps.
+
+    Attributes:
+        spot_id (str): The spot being kept warm.
+        last_refresh (float, optional): When the forecast and every report
+            endpoint last came back successfully.
+        last_attempt (float, optional): When a refresh last finished.
+        failures (int): Failed attempts since the last successful one.
+        total_failures (int): Failed attempts overall.
+        last_error (str, optional): Why the latest attempt failed.
+        next_due (float): When the scheduler refreshes the spot next. Not saved.
+    """
+
+    spot_id: str
+    last_refresh: Optional[float] = None
+    last_attempt: Optional[float] = None
+    failures: int = 0
+    total_failures: int = 0
+    last_error: Optional[str] = None
+    next_due: float = field(default=0.0, compare=False)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        del data["next_due"]
+        return data
+
+
+def load_state(path: Optional[Path] = None) -> Dict[str, SpotStatus]:
+    """Load saved spot statuses from ``path``. Returns {} if none are usable."""
+    path = path or default_state_path()
+    try:
+        with path.open(encoding="utf-8") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable prefetch state %s: %s", path, e)
+        return {}
+    if data.get("version") != STATE_VERSION:
+        logger.info("Ignoring prefetch state with old version")
+        return {}
+    return {spot_id: SpotStatus(**status) for spot_id, status in data["spots"].items()}
+
+
+def save_state(statuses: Iterable[SpotStatus], path: Optional[Path] = None) -> Path:
+    """Atomically write spot statuses to ``path``."""
+    path = path or default_state_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "version": STATE_VERSION,
+        "spots": {status.spot_id: status.to_dict() for status in statuses},
+    }
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as file:
+        json.dump(data, file, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    return path
+
+
+def describe_status(status: SpotStatus, now: Optional[float] = None) -> str:
+    """One line summarising ``status`` for ``surfreport prefetch --status``."""
+    now = time.time() if now is None else now
+
+    def ago(timestamp: Optional[float]) -> str:
+        if timestamp is None:
+            return "never"
+        minutes = max(0, round((now - timestamp) / 60))
+        if minutes < 120:
+            return f"{minutes}m ago"
+        return f"{minutes / 60:.1f}h ago"
+
+    line = (
+        f"{status.spot_id}  refreshed {ago(status.last_refresh)}  "
+        f"failures {status.failures} (total {status.total_failures})"
+    )
+    if status.last_error:
+        line += f"  last error: {status.last_error}"
+    return line
+
+
+def prefetch_client(
+    cache: ResponseCache,
+    rate_limit: float = DEFAULT_RATE_LIMIT,
+    interval: float = DEFAULT_INTERVAL,
+    jitter: float = DEFAULT_JITTER,
+) -> SurflineAPI:
+    """
+    Build the client a scheduler refreshes through.
+
+    It has its own session and rate limit, so prefetching never holds up
+    interactive requests, and it revalidates cached entries that would
+    expire before the spot's next refresh instead of treating them as hits.
+    """
+    return SurflineAPI(
+        cache=cache,
+        transport=TransportPolicy(rate_limit=rate_limit),
+        refresh_ahead=interval * (1 + jitter),
+    )
+
+
+class PrefetchScheduler:
+    """Refreshes a fixed set of spots into the response cache on an interval."""
+
+    def __init__(
+        self,
+        api: ForecastClient,
+        spot_ids: Iterable[str],
+        days: int = 3,
+        interval: float = DEFAULT_INTERVAL,
+        jitter: float = DEFAULT_JITTER,
+        state_path: Optional[Path] = None,
+    ):
+        """
+        Args:
+            api (ForecastClient): Client whose cache is kept warm; see
+                ``prefetch_client``.
+            spot_ids (Iterable[str]): The favourite spots.
+            days (int): Forecast length fetched, matching the ``--days``
+                of the runs that should hit the cache.
+            interval (float): Seconds between refreshes of one spot.
+            jitter (float): Fraction of each delay added or removed at random.
+            state_path (Path, optional): Where statuses are saved. Defaults
+                to ``prefetch.json`` in the user cache directory.
+        """
+        self.api = api
+        self.days = days
+        self.interval = interval
+        self.jitter = jitter
+        self.state_path = state_path or default_state_path()
+        saved = load_state(self.state_path)
+        self.statuses: Dict[str, SpotStatus] = {
+            spot_id: saved.get(spot_id) or SpotStatus(spot_id)
+            for spot_id in dict.fromkeys(spot_ids)
+        }
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _jittered(self, delay: float) -> float:
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def stagger(self, now: Optional[float] = None) -> None:
+        """Spread the next refresh of every spot evenly over one interval."""
+        now = time.time() if now is None else now
+        step = self.interval / max(1, len(self.statuses))
+        with self._lock:
+            for i, status in enumerate(self.statuses.values()):
+                status.next_due = now + i * step + random.uniform(0, step * self.jitter)
+
+    def _fetch(self, spot_id: str) -> List[str]:
+        """Fetch the spot's forecast and report; return the parts that failed."""
+        missing = []
+        if self.api.get_spot_forecast(spot_id, self.days) is None:
+            missing.append("forecast")
+        report = self.api.get_spot_report(spot_id, self.days)
+        if report is None:
+            missing.append("report")
+        else:
+            missing.extend(
+                name for name, data in report.report_data.items() if data is None
+            )
+        return missing
+
+    def refresh(self, spot_id: str, now: Optional[float] = None) -> bool:
+        """
+        Refresh one spot now and schedule its next refresh.
+
+        A failed spot is retried after ``RETRY_DELAY`` seconds, doubling
+        with each consecutive failure up to the normal interval.
+
+        Returns:
+            bool: Whether the forecast and every report endpoint succeeded.
+        """
+        try:
+            missing = self._fetch(spot_id)
+            error = f"no data for {', '.join(missing)}" if missing else None
+        except Exception as e:  # a refresh must never stop the scheduler
+            logger.exception("Prefetch of %s raised", spot_id)
+            error = str(e) or type(e).__name__
+
+        now = time.time() if now is None else now
+        with self._lock:
+            status = self.statuses[spot_id]
+            status.last_attempt = now
+            if error is None:
+                status.last_refresh = now
+                status.failures = 0
+                status.last_error = None
+                delay = self.interval
+            else:
+                status.failures += 1
+                status.total_failures += 1
+                status.last_error = error
+                delay = min(self.interval, RETRY_DELAY * 2 ** (status.failures - 1))
+                logger.warning("Prefetch of %s failed: %s", spot_id, error)
+            status.next_due = now + self._jittered(delay)
+        return error is None
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """Spots whose refresh is due, most overdue first."""
+        now = time.time() if now is None else now
+        with self._lock:
+            pending = [s for s in self.statuses.values() if s.next_due <= now]
+        return [s.spot_id for s in sorted(pending, key=lambda s: s.next_due)]
+
+    def run_pending(self, now: Optional[float] = None) -> int:
+        """Refresh every spot that is due and save the statuses.
+
+        Returns the number of spots refreshed.
+        """
+        spot_ids = self.due(now)
+        for spot_id in spot_ids:
+            self.refresh(spot_id, now)
+        if spot_ids:
+            self.save()
+        return len(spot_ids)
+
+    def run_once(self) -> int:
+        """Refresh every spot once, in order. Returns the number that failed."""
+        failed = sum(not self.refresh(spot_id) for spot_id in list(self.statuses))
+        self.save()
+        return failed
+
+    def seconds_until_due(self) -> float:
+        """Seconds until the next spot falls due (0 if one already has)."""
+        with self._lock:
+            next_due = min((s.next_due for s in self.statuses.values()), default=None)
+        if next_due is None:
+            return self.interval
+        return max(0.0, next_due - time.time())
+
+    def run(self) -> None:
+        """Refresh spots as they fall due until ``stop`` is called."""
+        self.stagger()
+        while not self._stop.is_set():
+            self.run_pending()
+            self._stop.wait(self.seconds_until_due())
+
+    def start(self) -> threading.Thread:
+        """Run the scheduler in a background daemon thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="prefetch", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the scheduler after the refresh in progress, if any."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def status(self) -> List[SpotStatus]:
+        """Snapshot of every spot's status, in favourites order."""
+        with self._lock:
+            return [replace(status) for status in self.statuses.values()]
+
+    def save(self) -> Path:
+        """Write the current statuses to ``state_path``."""
+        return save_state(self.status(), self.state_path)
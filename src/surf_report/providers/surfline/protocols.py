@@ -0,0 +1,76 @@
+"""
+Interfaces of the Surfline clients, as used by the code built on them.
+
+``SurflineAPI`` satisfies all of them. ``DaemonClient`` offers the
+interactive lookups, so it can stand in wherever only those are needed,
+e.g. to browse the taxonomy. Kept free of the HTTP stack so annotating
+with them costs no imports.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Protocol
+
+from surf_report.providers.surfline.models import (
+    Region,
+    SpotForecast,
+    SpotReport,
+    SurflineSearchResult,
+)
+from surf_report.utils.metrics import RequestMetrics
+
+
+class TaxonomyClient(Protocol):
+    """Fetches taxonomy documents one node at a time."""
+
+    def get_taxonomy(self, taxonomy_id: str, max_depth: int = 0) -> Optional[dict]: ...
+
+
+class ConcurrentTaxonomyClient(TaxonomyClient, Protocol):
+    """A taxonomy client that may be called from ``max_workers`` threads."""
+
+    max_workers: int
+
+
+class ForecastClient(Protocol):
+    """Fetches the forecast and report of a single spot."""
+
+    def get_spot_forecast(
+        self, spot_id: str, days: int = 5
+    ) -> Optional[SpotForecast]: ...
+
+    def get_spot_report(self, spot_id: str, days: int = 3) -> Optional[SpotReport]: ...
+
+
+class BatchReportClient(Protocol):
+    """Fetches reports for many spots, yielding them as they complete."""
+
+    def get_spot_reports(
+        self,
+        spot_ids: Iterable[str],
+        *,
+        days: int = 3,
+        interval_hours: int = 6,
+        max_concurrency: Optional[int] = None,
+        columnar: bool = False,
+        sections: Optional[Iterable[str]] = None,
+    ) -> Iterator[SpotReport]: ...
+
+
+class LookupClient(TaxonomyClient, ForecastClient, Protocol):
+    """Every lookup the daemon serves, with the metrics it exports."""
+
+    metrics: RequestMetrics
+
+    def search_surfline(self, query: str) -> List[SurflineSearchResult]: ...
+
+    def get_region_list(self, taxonomy_id: str, max_depth: int = 0) -> List[Region]: ...
+
+    def get_region_overview(self, region_id: str) -> Optional[dict]: ...
+
+    def get_spot_report(
+        self,
+        spot_id: str,
+        days: int = 3,
+        interval_hours: int = 6,
+        *,
+        sections: Optional[Iterable[str]] = None,
+    ) -> Optional[SpotReport]: ...
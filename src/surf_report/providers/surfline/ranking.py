@@ -0,0 +1,341 @@
+"""
+Region-wide ranking of spots by their forecast conditions.
+
+``rank_spots`` answers "where should we surf in this region today?". It
+fetches the surf, wind and tide sections of every spot below a taxonomy
+node in one concurrent batch, scores every forecast window of each spot
+and keeps the best ``top`` spots in a bounded min-heap while reports
+arrive, so each report is dropped as soon as it is scored and only the
+final ``top`` entries are ever sorted.
+
+Windows are scored a column at a time straight from the ``TimeSeries``
+arrays of a columnar report: one pass per input column, with the wind
+and tide rows aligned to the surf timestamps by bisection. The score is
+a weighted sum of three parts between 0 and 1:
+
+- surf: the midpoint of the surf ``min`` and ``max``, relative to
+  ``IDEAL_SURF_HEIGHT`` and capped at 1;
+- wind: ``DIRECTION_WEIGHTS`` for the wind's ``directionType``, with
+  anything but offshore wind counting for less the stronger it blows;
+- tide: highest at mid tide, relative to the spot's tide range over the
+  fetched days.
+"""
+
+import heapq
+import math
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, cast
+
+from surf_report.providers.surfline.models import Region, SpotReport
+from surf_report.providers.surfline.protocols import (
+    BatchReportClient,
+    ConcurrentTaxonomyClient,
+)
+from surf_report.providers.surfline.taxonomy import DEFAULT_MAX_AGE, TaxonomyIndex
+from surf_report.providers.surfline.timeseries import TimeSeries
+
+RANK_SECTIONS = ("surf", "wind", "tides")
+DEFAULT_TOP = 10
+DEFAULT_INTERVAL_HOURS = 3
+
+# Surf height, in the report's units, that scores full marks.
+IDEAL_SURF_HEIGHT = 6.0
+# Wind speed at which a wind's direction fully decides its score.
+STRONG_WIND_SPEED = 20.0
+DIRECTION_WEIGHTS = {"Offshore": 1.0, "Cross-shore": 0.5, "Onshore": 0.0}
+# Used for a missing wind or tide row, and unknown wind directions.
+NEUTRAL_SCORE = 0.5
+SURF_WEIGHT = 0.6
+WIND_WEIGHT = 0.3
+TIDE_WEIGHT = 0.1
+
+
+@dataclass
+class SpotRanking:
+    """The best forecast window of one spot."""
+
+    spot_id: str
+    name: str
+    score: float
+    timestamp: int
+    utc_offset: float
+    surf_min: Optional[float] = None
+    surf_max: Optional[float] = None
+    wind_speed: Optional[float] = None
+    wind_direction_type: Optional[str] = None
+    tide_height: Optional[float] = None
+
+
+def _align(timestamps: Sequence[int], targets: Sequence[int]) -> List[int]:
+    """
+    Index of the last row of ``timestamps`` at or before each target, or -1
+    if there is none. ``timestamps`` must be sorted.
+    """
+    return [bisect_right(timestamps, target) - 1 for target in targets]
+
+
+def _numbers(series: TimeSeries, name: str) -> "array[float]":
+    return cast("array[float]", series.column(name))
+
+
+def surf_scores(surf: TimeSeries) -> List[float]:
+    """Score every surf row; NaN where the height is missing."""
+    mins = _numbers(surf, "min")
+    maxs = _numbers(surf, "max")
+    return [
+        min((low + high) / 2 / IDEAL_SURF_HEIGHT, 1.0) for low, high in zip(mins, maxs)
+    ]
+
+
+def wind_scores(wind: Optional[TimeSeries], targets: Sequence[int]) -> List[float]:
+    """Score the wind in effect at each of ``targets``."""
+    if not wind:
+        return [NEUTRAL_SCORE] * len(targets)
+    rows = _align(wind.timestamps, targets)
+    weights = [
+        DIRECTION_WEIGHTS.get(label, NEUTRAL_SCORE)  # type: ignore[arg-type]
+        for label in wind.column("directionType")
+    ]
+    speeds = _numbers(wind, "speed")
+    scores = []
+    for row in rows:
+        if row < 0:
+            scores.append(NEUTRAL_SCORE)
+            continue
+        strength = speeds[row] / STRONG_WIND_SPEED
+        # NaN fails the comparison: an unknown speed counts as strong.
+        strength = strength if strength < 1.0 else 1.0
+        scores.append(1.0 - (1.0 - weights[row]) * strength)
+    return scores
+
+
+def tide_scores(tides: Optional[TimeSeries], targets: Sequence[int]) -> List[float]:
+    """Score the tide height at each of ``targets``, best at mid tide."""
+    if not tides:
+        return [NEUTRAL_SCORE] * len(targets)
+    heights = _numbers(tides, "height")
+    known = [height for height in heights if not math.isnan(height)]
+    if not known or max(known) - min(known) <= 0:
+        return [NEUTRAL_SCORE] * len(targets)
+    low = min(known)
+    span = max(known) - low
+    scores = []
+    for row in _align(tides.timestamps, targets):
+        height = heights[row] if row >= 0 else math.nan
+        if math.isnan(height):
+            scores.append(NEUTRAL_SCORE)
+        else:
+            scores.append(1.0 - abs(2.0 * (height - low) / span - 1.0))
+    return scores
+
+
+def score_windows(series: Dict[str, TimeSeries]) -> List[float]:
+    """
+    Score every forecast window of a columnar report.
+
+    Args:
+        series (dict): The report's sections; only ``surf``, ``wind`` and
+            ``tides`` are read, and only ``surf`` is required.
+
+    Returns:
+        list: One score between 0 and 10 per row of the ``surf`` section,
+        NaN for windows without a surf height.
+    """
+    surf = series.get("surf")
+    if not surf:
+        return []
+    targets = surf.timestamps
+    return [
+        10.0 * (SURF_WEIGHT * s + WIND_WEIGHT * w + TIDE_WEIGHT * t)
+        for s, w, t in zip(
+            surf_scores(surf),
+            wind_scores(series.get("wind"), targets),
+            tide_scores(series.get("tides"), targets),
+        )
+    ]
+
+
+def _value(series: Optional[TimeSeries], name: str, row: int):
+    if series is None or row < 0:
+        return None
+    return series.values(name, [row])[0]
+
+
+def best_window(
+    report: SpotReport,
+    name: str = "",
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+) -> Optional[SpotRanking]:
+    """
+    Return the highest-scoring window of ``report`` that starts in
+    ``[start, end)``, or None if it has none with a surf height.
+
+    Args:
+        report (SpotReport): A columnar report with a ``surf`` section.
+        name (str): Spot name to show in the ranking.
+        start (int, optional): Earliest window start, as a Unix timestamp.
+        end (int, optional): Window starts from here on are ignored.
+    """
+    series = report.series or {}
+    scores = score_windows(series)
+    surf = series.get("surf")
+    if surf is None:
+        return None
+    best = -1
+    for i, (timestamp, score) in enumerate(zip(surf.timestamps, scores)):
+        if start is not None and timestamp < start:
+            continue
+        if end is not None and timestamp >= end:
+            continue
+        # NaN scores fail the comparison and are skipped.
+        if score > (scores[best] if best >= 0 else -1.0):
+            best = i
+    if best < 0:
+        return None
+
+    timestamp = surf.timestamps[best]
+    wind = series.get("wind")
+    tides = series.get("tides")
+    wind_row = _align(wind.timestamps, [timestamp])[0] if wind else -1
+    tide_row = _align(tides.timestamps, [timestamp])[0] if tides else -1
+    return SpotRanking(
+        spot_id=report.spot_id,
+        name=name,
+        score=scores[best],
+        timestamp=timestamp,
+        utc_offset=surf.utc_offsets[best],
+        surf_min=_value(surf, "min", best),
+        surf_max=_value(surf, "max", best),
+        wind_speed=_value(wind, "speed", wind_row),
+        wind_direction_type=_value(wind, "directionType", wind_row),
+        tide_height=_value(tides, "height", tide_row),
+    )
+
+
+def top_rankings(
+    rankings: Iterable[Optional[SpotRanking]], top: int
+) -> List[SpotRanking]:
+    """
+    Return the ``top`` best of ``rankings``, best first, without sorting
+    the whole stream. None entries are skipped; ties go to the higher
+    spot ID so the result does not depend on arrival order.
+    """
+    if top < 1:
+        raise ValueError("top must be at least 1")
+    # The sequence number is unique, so rankings themselves are never
+    # compared, even for a spot that appears twice.
+    heap: List[Tuple[float, str, int, SpotRanking]] = []
+    for seq, ranking in enumerate(rankings):
+        if ranking is None:
+            continue
+        if len(heap) < top:
+            heapq.heappush(heap, (ranking.score, ranking.spot_id, -seq, ranking))
+        # Most rankings lose to the current k-th best on their score alone.
+        elif ranking.score >= heap[0][0]:
+            entry = (ranking.score, ranking.spot_id, -seq, ranking)
+            if entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+    return [entry[3] for entry in sorted(heap, reverse=True)]
+
+
+def resolve_region(taxonomy: TaxonomyIndex, query: str) -> str:
+    """
+    Return the taxonomy ID ``query`` refers to: an ID, or the name of a
+    node in the snapshot, ignoring case. Unknown queries are returned as
+    they are, to be looked up as IDs.
+
+    Raises:
+        ValueError: If the name matches more than one node.
+    """
+    if query in taxonomy:
+        return query
+    folded = query.casefold()
+    matches = [
+        region.id
+        for region in taxonomy.nodes.values()
+        if region.name.casefold() == folded
+    ]
+    if len(matches) > 1:
+        raise ValueError(
+            f"{query!r} matches {len(matches)} regions; use one of their IDs: "
+            + ", ".join(matches)
+        )
+    return matches[0] if matches else query
+
+
+def region_spots(
+    api: ConcurrentTaxonomyClient,
+    taxonomy: TaxonomyIndex,
+    taxonomy_id: str,
+    max_age: float = DEFAULT_MAX_AGE,
+) -> List[Region]:
+    """
+    Return every spot below ``taxonomy_id``, or the spot itself.
+
+    The subtree is read from the snapshot and downloaded with
+    ``TaxonomyIndex.sync`` first if any level of it is missing or older
+    than ``max_age`` seconds.
+    """
+    region = taxonomy.get(taxonomy_id)
+    if region is not None and region.type == "spot":
+        return [region]
+    levels = [taxonomy_id] + [
+        node.id for node in taxonomy.descendants(taxonomy_id) if node.type != "spot"
+    ]
+    if any(taxonomy.is_stale(node_id, max_age) for node_id in levels):
+        taxonomy.sync(api, taxonomy_id)
+    return [node for node in taxonomy.descendants(taxonomy_id) if node.type == "spot"]
+
+
+def rank_spots(
+    api: BatchReportClient,
+    spots: Iterable[Region],
+    top: int = DEFAULT_TOP,
+    days: int = 1,
+    interval_hours: int = DEFAULT_INTERVAL_HOURS,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+) -> List[SpotRanking]:
+    """
+    Rank ``spots`` by their best forecast window.
+
+    Reports for all spots are fetched through ``get_spot_reports``, so
+    every request shares one pool of ``max_concurrency`` threads, and each
+    report is scored as soon as it is complete.
+
+    Args:
+        api (BatchReportClient): The client to fetch reports with.
+        spots (Iterable[Region]): Spots to rank, e.g. from ``region_spots``.
+        top (int): Number of spots to return.
+        days (int): Forecast days to fetch; 1 covers today.
+        interval_hours (int): Length of a forecast window.
+        start (int, optional): Ignore windows starting before this time.
+        end (int, optional): Ignore windows starting at or after this time.
+        max_concurrency (int, optional): Requests in flight at once.
+
+    Returns:
+        list: Up to ``top`` rankings, best first. Spots whose surf forecast
+        could not be fetched are left out.
+    """
+    names: Dict[str, str] = {}
+    for region in spots:
+        names.setdefault(region.spot or region.id, region.name)
+    reports = api.get_spot_reports(
+        names,
+        days=days,
+        interval_hours=interval_hours,
+        max_concurrency=max_concurrency,
+        columnar=True,
+        sections=RANK_SECTIONS,
+    )
+    return top_rankings(
+        (
+            best_window(report, names.get(report.spot_id, ""), start, end)
+            for report in reports
+        ),
+        top,
+    )
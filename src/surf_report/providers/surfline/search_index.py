@@ -0,0 +1,188 @@
+"""
+Local full-text search over the spots in a taxonomy snapshot.
+
+Spot names and breadcrumbs are tokenised into a sorted token table for
+prefix lookups and a trigram table for typo-tolerant matching, so queries
+are answered in memory without touching the network.
+"""
+
+import heapq
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from surf_report.providers.surfline.models import SurflineSearchResult
+
+if TYPE_CHECKING:
+    from surf_report.providers.surfline.taxonomy import TaxonomyIndex
+
+DEFAULT_LIMIT = 5
+MIN_TRIGRAM_SIMILARITY = 0.35
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip accents and collapse punctuation to single spaces."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    ascii_text = decomposed.encode("ascii", "ignore").decode("ascii").lower()
+    return _NON_ALNUM.sub(" ", ascii_text).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the set of character trigrams of a normalised string."""
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class _TokenTable:
+    """Sorted token list with posting sets, supporting prefix lookups."""
+
+    def __init__(self, postings: Dict[str, Set[int]]):
+        self.tokens = sorted(postings)
+        self.postings = [postings[token] for token in self.tokens]
+
+    def prefix_matches(self, prefix: str) -> Set[int]:
+        matches: Set[int] = set()
+        start = bisect_left(self.tokens, prefix)
+        for i in range(start, len(self.tokens)):
+            if not self.tokens[i].startswith(prefix):
+                break
+            matches |= self.postings[i]
+        return matches
+
+    def match_all(self, prefixes: List[str]) -> Set[int]:
+        """Return positions where every prefix matches some token."""
+        candidates = self.prefix_matches(prefixes[0])
+        for prefix in prefixes[1:]:
+            if not candidates:
+                break
+            candidates &= self.prefix_matches(prefix)
+        return candidates
+
+
+class SpotSearchIndex:
+    """In-memory search index returning ``SurflineSearchResult`` objects."""
+
+    def __init__(self, spots: Iterable[Tuple[str, str, Sequence[str]]]):
+        """
+        Args:
+            spots: ``(spot_id, name, breadcrumbs)`` tuples. Breadcrumbs run from
+                the outermost region down to the spot itself.
+        """
+        self._results: List[SurflineSearchResult] = []
+        self._names: List[str] = []
+        name_postings: Dict[str, Set[int]] = defaultdict(set)
+        crumb_postings: Dict[str, Set[int]] = defaultdict(set)
+
+        for position, (spot_id, name, breadcrumbs) in enumerate(spots):
+            self._results.append(
+                SurflineSearchResult(
+                    id=spot_id, name=name, breadcrumbs=list(breadcrumbs), type="spot"
+                )
+            )
+            normalized_name = normalize(name)
+            self._names.append(normalized_name)
+            for token in normalized_name.split():
+                name_postings[token].add(position)
+                crumb_postings[token].add(position)
+            for crumb in breadcrumbs:
+                for token in normalize(crumb).split():
+                    crumb_postings[token].add(position)
+
+        self._name_lengths = [len(name) for name in self._names]
+        self._name_tokens = _TokenTable(name_postings)
+        self._all_tokens = _TokenTable(crumb_postings)
+        # Built on the first fuzzy lookup; most queries never need it. The
+        # daemon searches from several threads, so the build is locked.
+        self._trigram_postings: Optional[Dict[str, List[int]]] = None
+        self._trigram_counts: List[int] = []
+        self._trigram_lock = threading.Lock()
+
+    @classmethod
+    def from_taxonomy(cls, taxonomy: "TaxonomyIndex") -> "SpotSearchIndex":
+        """Build an index over every spot in a taxonomy snapshot."""
+        return cls(
+            (
+                spot.id,
+                spot.name,
+                [region.name for region in taxonomy.ancestors(spot.id)] + [spot.name],
+            )
+            for spot in taxonomy.spots()
+        )
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def _score(self, position: int, query: str) -> float:
+        name = self._names[position]
+        score = 0.0
+        if name == query:
+            score += 100
+        elif name.startswith(query):
+            score += 50
+        # Shorter names are closer matches for the same prefix.
+        return score - self._name_lengths[position] / 100
+
+    def _trigram_table(self) -> Dict[str, List[int]]:
+        with self._trigram_lock:
+            if self._trigram_postings is None:
+                postings: Dict[str, List[int]] = defaultdict(list)
+                counts = []
+                for position, name in enumerate(self._names):
+                    name_trigrams = trigrams(name)
+                    counts.append(len(name_trigrams))
+                    for trigram in name_trigrams:
+                        postings[trigram].append(position)
+                self._trigram_counts = counts
+                self._trigram_postings = dict(postings)
+            return self._trigram_postings
+
+    def _fuzzy_matches(self, query: str) -> Dict[int, float]:
+        trigram_postings = self._trigram_table()
+        query_trigrams = trigrams(query)
+        shared: Dict[int, int] = defaultdict(int)
+        for trigram in query_trigrams:
+            for position in trigram_postings.get(trigram, ()):
+                shared[position] += 1
+        similarities = {}
+        for position, count in shared.items():
+            union = len(query_trigrams) + self._trigram_counts[position] - count
+            similarity = count / union
+            if similarity >= MIN_TRIGRAM_SIMILARITY:
+                similarities[position] = similarity
+        return similarities
+
+    def search(
+        self, query: str, limit: int = DEFAULT_LIMIT
+    ) -> List[SurflineSearchResult]:
+        """
+        Return up to ``limit`` spots matching ``query``, best first.
+
+        Spots whose name matches every query word (by prefix) rank first,
+        followed by spots where some words only match the breadcrumbs. If
+        nothing matches, spot names are compared by trigram similarity
+        instead to tolerate typos.
+        """
+        normalized = normalize(query)
+        query_tokens = normalized.split()
+        if not query_tokens:
+            return []
+
+        name_matches = self._name_tokens.match_all(query_tokens)
+        ranked = heapq.nlargest(
+            limit,
+            name_matches,
+            key=lambda position: (self._score(position, normalized), -position),
+        )
+        if len(ranked) < limit:
+            crumb_matches = self._all_tokens.match_all(query_tokens) - name_matches
+            ranked += heapq.nsmallest(
+                limit - len(ranked), crumb_matches, key=self._name_lengths.__getitem__
+            )
+        if not ranked:
+            similarities = self._fuzzy_matches(normalized)
+            ranked = heapq.nlargest(limit, similarities, key=similarities.__getitem__)
+        return [self._results[position] for position in ranked]
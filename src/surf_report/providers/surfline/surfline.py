@@ -1,17 +1,61 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import requests
 
+from surf_report.providers.surfline.decoding import decode_json, projection_for
 from surf_report.providers.surfline.models import (
     Region,
     SpotForecast,
     SpotReport,
     SurflineSearchResult,
+    parse_region,
+)
+from surf_report.providers.surfline.timeseries import (
+    SECTION_ENDPOINTS,
+    build_report_series,
+    section_endpoints,
+)
+from surf_report.utils.cache import (
+    ResponseCache,
+    RevalidationStats,
+    make_cache_key,
+    validator_headers,
 )
 from surf_report.utils.logger import logger
+from surf_report.utils.metrics import RequestMetrics, RequestSample
+from surf_report.utils.transport import (
+    HostRateLimiter,
+    SingleFlight,
+    TransportPolicy,
+)
 from surf_report.utils.user_agent import get_user_agent
 
+if TYPE_CHECKING:
+    from surf_report.providers.surfline.search_index import SpotSearchIndex
+
+
+DEFAULT_BASE_URL = "https://services.surfline.com"
+# Points the client at another server speaking the Surfline API, such as
+# the local stand-in in ``fake_server``.
+ENV_BASE_URL = "SURFREPORT_BASE_URL"
+
 
 class Endpoints(Enum):
     TAXONOMY = "https://services.surfline.com/taxonomy"
@@ -21,6 +65,28 @@ class Endpoints(Enum):
     KBYG_BASE = "https://services.surfline.com/kbyg/spots/forecasts"
 
 
+MINUTE = 60
+DAY = 24 * 60 * MINUTE
+
+# How long cached responses stay fresh, per endpoint.
+CACHE_TTLS = {
+    Endpoints.TAXONOMY: 7 * DAY,
+    Endpoints.SEARCH: 1 * DAY,
+    Endpoints.REGION_OVERVIEW: 30 * MINUTE,
+    Endpoints.SPOT_FORECAST: 30 * MINUTE,
+    Endpoints.KBYG_BASE: 20 * MINUTE,
+}
+
+KBYG_ENDPOINTS = (
+    "/wave",
+    "/weather",
+    "/tides",
+    "/surf",
+    "/sunlight",
+    "/wind",
+    "/swells",
+)
+
 DEFAULT_HEADERS = {
     "Accept": "application/json, text/plain, */*",
     "Accept-Language": "en-US,en;q=0.9",
@@ -31,82 +97,365 @@ DEFAULT_HEADERS = {
 }
 
 
+def parse_search_results(data: list) -> List[SurflineSearchResult]:
+    """Convert a raw search response into a list of search results."""
+    # Find the first valid result with "hits"
+    valid_hits = []
+    for entry in data:
+        if "hits" in entry and "hits" in entry["hits"] and entry["hits"]["total"] > 0:
+            valid_hits = entry["hits"]["hits"]
+            break  # Stop after finding the first valid result
+
+    if not valid_hits:
+        logger.info("No matching surf spots found.")
+        return []
+
+    return [
+        SurflineSearchResult(
+            id=item["_id"],
+            name=item["_source"]["name"],
+            breadcrumbs=item["_source"].get("breadCrumbs", []),
+            type=item["_type"],
+        )
+        for item in valid_hits
+    ]
+
+
+def parse_region_list(data: dict) -> List[Region]:
+    """Convert a raw taxonomy response into a list of regions."""
+    return [parse_region(item) for item in data["contains"]]
+
+
+@lru_cache(maxsize=256)
+def endpoint_for_url(url: str) -> Optional[Endpoints]:
+    """Return the most specific endpoint whose base URL prefixes ``url``."""
+    matches = [endpoint for endpoint in Endpoints if url.startswith(endpoint.value)]
+    return max(matches, key=lambda endpoint: len(endpoint.value), default=None)
+
+
+@lru_cache(maxsize=256)
+def endpoint_label(url: str) -> str:
+    """Metrics label for ``url``: the endpoint name, or ``kbyg/<section>``."""
+    endpoint = endpoint_for_url(url)
+    if endpoint is None:
+        return "other"
+    if endpoint is Endpoints.KBYG_BASE:
+        return "kbyg" + url[len(endpoint.value) :]
+    return endpoint.name.lower()
+
+
+def resolve_base_url(base_url: Optional[str] = None) -> str:
+    """Return ``base_url``, else SURFREPORT_BASE_URL, else ``DEFAULT_BASE_URL``."""
+    return (base_url or os.environ.get(ENV_BASE_URL) or DEFAULT_BASE_URL).rstrip("/")
+
+
+def rebase_url(url: str, base_url: str) -> str:
+    """Move an ``Endpoints`` URL onto ``base_url``, keeping its path."""
+    if base_url == DEFAULT_BASE_URL or not url.startswith(DEFAULT_BASE_URL):
+        return url
+    return base_url + url[len(DEFAULT_BASE_URL) :]
+
+
+def kbyg_params(spot_id: str, days: int, interval_hours: int) -> dict:
+    """Query parameters shared by every KBYG report endpoint."""
+    return {"spotId": spot_id, "days": days, "intervalHours": interval_hours}
+
+
 class SurflineAPI:
-    def __init__(self, session: Optional[requests.Session] = None):
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        max_workers: int = len(KBYG_ENDPOINTS),
+        cache: Optional[ResponseCache] = None,
+        search_index: Optional["SpotSearchIndex"] = None,
+        transport: Optional[TransportPolicy] = None,
+        selective_decode: bool = False,
+        refresh_ahead: float = 0.0,
+        base_url: Optional[str] = None,
+    ):
+        """
+        Args:
+            session (requests.Session, optional): Session shared by every request.
+            max_workers (int): Number of threads used to fetch report endpoints
+                concurrently. A value of 1 fetches them one after another.
+            cache (ResponseCache, optional): On-disk cache consulted before any
+                network request. Responses are not cached when omitted.
+            search_index (SpotSearchIndex, optional): Local index searched before
+                falling back to the remote search endpoint.
+            transport (TransportPolicy, optional): Timeouts, pool size, retry
+                and rate limit settings. Defaults to ``TransportPolicy()``.
+            selective_decode (bool): Decode only the fields the report
+                sections read from KBYG responses, dropping the rest of
+                the payload while it is parsed.
+            refresh_ahead (float): Seconds before expiry at which cached
+                entries are already revalidated, so a client refreshing on
+                a schedule never lets them lapse.
+            base_url (str, optional): Scheme and host requests are sent to
+                instead of ``DEFAULT_BASE_URL``. Defaults to the
+                SURFREPORT_BASE_URL environment variable, if set.
+        """
         logger.info("Initializing SurflineAPI")
         self.session = session or requests.Session()
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
+        self.search_index = search_index
+        self.transport = transport or TransportPolicy()
+        self.selective_decode = selective_decode
+        self.refresh_ahead = refresh_ahead
+        self.base_url = resolve_base_url(base_url)
+        self.revalidation = RevalidationStats()
+        self.metrics = RequestMetrics()
+        self._inflight = SingleFlight()
+        self.rate_limiter = (
+            HostRateLimiter(self.transport.rate_limit, self.transport.rate_burst)
+            if self.transport.rate_limit
+            else None
+        )
+        self._pool_size = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._configure_session_headers()
+        self._ensure_pool_size(self.max_workers)
 
     def _configure_session_headers(self) -> None:
         headers = DEFAULT_HEADERS.copy()
         headers["User-Agent"] = get_user_agent()
         self.session.headers.update(headers)
 
+    def _ensure_pool_size(self, concurrency: int) -> None:
+        """Grow the connection pool so ``concurrency`` threads never queue on it."""
+        if not isinstance(self.session, requests.Session):
+            return
+        if concurrency <= self._pool_size:
+            return
+        self.transport.mount(self.session, pool_maxsize=concurrency)
+        self._pool_size = max(self.transport.pool_maxsize, concurrency)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the thread pool used for concurrent endpoint fetches."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="surfline"
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool and close the underlying session."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.session.close()
+
     def _get(self, url: str, params: dict) -> Optional[dict]:
-        """A generic GET request handler."""
+        """
+        A generic GET request handler backed by the response cache.
+
+        Concurrent calls for the same URL and parameters share one lookup,
+        one network request and one decoded result, so callers must not
+        mutate what they get back.
+
+        Expired entries that carry an ``ETag`` or ``Last-Modified`` validator
+        are revalidated with a conditional request; a ``304 Not Modified``
+        renews the entry without downloading or decoding a new body.
+        """
+        # Projected payloads are cached apart from full ones, and responses
+        # from another base URL apart from Surfline's.
+        suffix = "" if self._projection(url) is None else "#selected"
+        key = make_cache_key(rebase_url(url, self.base_url) + suffix, params)
+        return self._inflight.do(key, lambda: self._load(key, url, params))
+
+    def _load(self, key: str, url: str, params: dict) -> Optional[dict]:
+        """Serve ``url`` from the cache, revalidating or fetching as needed."""
+        sample = RequestSample(endpoint_label(url))
+        try:
+            return self._load_sampled(sample, key, url, params)
+        finally:
+            self._record(sample)
+
+    def _load_sampled(
+        self, sample: RequestSample, key: str, url: str, params: dict
+    ) -> Optional[dict]:
+        if self.cache is None:
+            return self._fetch(url, params, sample)
+
+        entry = self.cache.get_entry(key)
+        if entry is not None and entry.fresh_for(self.refresh_ahead):
+            logger.debug("Cache hit for %s", url)
+            sample.cache = "hit"
+            return self._timed_parse(sample, lambda: entry.value)
+
+        headers = entry.conditional_headers() if entry is not None else None
+        response = self._send(url, params, sample, headers)
+        if response is None:
+            return None
+        endpoint = endpoint_for_url(url)
+        ttl = CACHE_TTLS.get(endpoint) if endpoint is not None else None
+        if response.status_code == 304 and entry is not None:
+            sample.cache = "revalidated"
+            if ttl is not None:
+                self.cache.renew(key, ttl)
+            return self._timed_parse(sample, lambda: entry.value)
+
+        sample.cache = "miss"
+        data = self._decode(url, response, sample)
+        if data is not None and ttl is not None:
+            self.cache.set(
+                key,
+                url,
+                data,
+                ttl=ttl,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return data
+
+    def _projection(self, url: str) -> Optional[FrozenSet[str]]:
+        """Keys to keep when decoding ``url``, or None to decode everything."""
+        if not self.selective_decode or not url.startswith(Endpoints.KBYG_BASE.value):
+            return None
+        return projection_for(url[len(Endpoints.KBYG_BASE.value) :])
+
+    def _record(self, sample: RequestSample) -> None:
+        self.metrics.record(sample)
+        logger.debug(
+            "%s: cache %s, status %s, %.1fms, %d bytes",
+            sample.endpoint,
+            sample.cache,
+            sample.status,
+            (sample.total or 0.0) * 1000,
+            sample.bytes,
+        )
+
+    @staticmethod
+    def _timed_parse(sample: RequestSample, decode: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return decode()
+        finally:
+            sample.parse = time.perf_counter() - started
+
+    def _fetch(self, url: str, params: dict, sample: RequestSample) -> Optional[dict]:
+        """Request ``url`` from the network and decode the JSON body."""
+        response = self._send(url, params, sample)
+        if response is None:
+            return None
+        return self._decode(url, response, sample)
+
+    def _send(
+        self,
+        url: str,
+        params: dict,
+        sample: RequestSample,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[requests.Response]:
+        """
+        Request ``url`` from ``base_url``, returning the response or None
+        on failure.
+
+        Args:
+            sample (RequestSample): Filled in with the rate limiter wait,
+                status, size, retries and network timings.
+            headers (dict, optional): Conditional request headers. A
+                ``304 Not Modified`` answer is returned like any success.
+        """
+        url = rebase_url(url, self.base_url)
         try:
-            full_url = requests.Request("GET", url, params=params).prepare().url
-            logger.debug(f"Requesting {full_url}")
-            response = self.session.get(url, params=params)
+            logger.debug("Requesting %s with params %s", url, params)
+            if self.rate_limiter is not None:
+                sample.wait = self.rate_limiter.acquire(url)
+            started = time.perf_counter()
+            response = self.session.get(
+                url, params=params, headers=headers, timeout=self.transport.timeout
+            )
+            self._time_response(sample, response, time.perf_counter() - started)
             response.raise_for_status()
-            logger.info(f"Successful API response from {url}")
-            return response.json()
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching from {url} with params {params}: {e}")
+            logger.error("Error fetching from %s with params %s: %s", url, params, e)
             return None
+        not_modified = response.status_code == 304
+        self.revalidation.record(bool(headers), not_modified)
+        if not_modified:
+            logger.info("Not modified since last fetch: %s", url)
+        else:
+            logger.info("Successful API response from %s", url)
+        return response
+
+    @staticmethod
+    def _time_response(
+        sample: RequestSample, response: requests.Response, fetched: float
+    ) -> None:
+        """
+        Split the time ``session.get`` took into time to first byte and
+        download. ``Response.elapsed`` stops when the headers are parsed, and
+        the body is read after that.
+        """
+        sample.status = response.status_code
+        sample.bytes = len(response.content or b"")
+        elapsed = getattr(response, "elapsed", None)
+        ttfb = min(elapsed.total_seconds(), fetched) if elapsed is not None else fetched
+        sample.ttfb = ttfb
+        sample.download = fetched - ttfb
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        sample.retries = len(getattr(retries, "history", None) or ())
+
+    def _decode(
+        self,
+        url: str,
+        response: requests.Response,
+        sample: RequestSample,
+    ) -> Optional[dict]:
+        """Decode a response body, applying the selective projection if any."""
+        started = time.perf_counter()
+        try:
+            projection = self._projection(url)
+            if projection is None:
+                return response.json()
+            return decode_json(response.content, projection)
+        except ValueError as e:
+            logger.error("Error decoding response from %s: %s", url, e)
+            return None
+        finally:
+            sample.parse = time.perf_counter() - started
 
     def search_surfline(self, query: str) -> List[SurflineSearchResult]:
-        """Search for a query on the Surfline API and return structured data."""
+        """
+        Search for a spot and return structured data.
+
+        The local search index is consulted first when one is configured, and
+        the Surfline search endpoint is only queried when it has no matches.
+        """
+        if self.search_index is not None:
+            results = self.search_index.search(query)
+            if results:
+                logger.debug("Local search index matched %r", query)
+                return results
+
         params = {"q": query, "querySize": 5, "suggestionSize": 5}
         data = self._get(Endpoints.SEARCH.value, params)
         if not data or not isinstance(data, list):
             logger.error("Unexpected response format for search_surfline.")
             return []
+        return parse_search_results(data)
 
-        # Find the first valid result with "hits"
-        valid_hits = []
-        for entry in data:
-            if (
-                "hits" in entry
-                and "hits" in entry["hits"]
-                and entry["hits"]["total"] > 0
-            ):
-                valid_hits = entry["hits"]["hits"]
-                break  # Stop after finding the first valid result
-
-        if not valid_hits:
-            logger.info("No matching surf spots found.")
-            return []
-
-        return [
-            SurflineSearchResult(
-                id=item["_id"],
-                name=item["_source"]["name"],
-                breadcrumbs=item["_source"].get("breadCrumbs", []),
-                type=item["_type"],
-            )
-            for item in valid_hits
-        ]
+    def get_taxonomy(self, taxonomy_id: str, max_depth: int = 0) -> Optional[dict]:
+        """
+        Fetch the raw taxonomy document for ``taxonomy_id``.
 
-    def get_region_list(self, taxonomy_id: str, max_depth: int = 0) -> List[Region]:
-        """Get a list of regions from the Surfline API and return structured data."""
+        Descendants up to ``max_depth`` levels below the node are listed in
+        the ``contains`` array. Returns None if the response is invalid.
+        """
         params = {"type": "taxonomy", "id": taxonomy_id, "maxDepth": max_depth}
         data = self._get(Endpoints.TAXONOMY.value, params)
         if not data or "contains" not in data:
-            logger.error(f"Invalid response data for taxonomy ID {taxonomy_id}")
-            return []
+            logger.error("Invalid response data for taxonomy ID %s", taxonomy_id)
+            return None
+        return data
 
-        raw_data = data["contains"]
-        return [
-            Region(
-                id=item["_id"],
-                name=item["name"],
-                type=item["type"],
-                subregion=item.get("subregion"),
-                spot=item.get("spot"),
-            )
-            for item in raw_data
-        ]
+    def get_region_list(self, taxonomy_id: str, max_depth: int = 0) -> List[Region]:
+        """Get a list of regions from the Surfline API and return structured data."""
+        data = self.get_taxonomy(taxonomy_id, max_depth)
+        if data is None:
+            return []
+        return parse_region_list(data)
 
     def get_region_overview(self, region_id: str) -> Optional[dict]:
         """Get the overview of a region."""
@@ -121,27 +470,187 @@ class SurflineAPI:
             return SpotForecast(spot_id=spot_id, days=days, forecast_data=data)
         return None
 
+    def _get_endpoints(
+        self, names: List[str], params: dict
+    ) -> Dict[str, Optional[dict]]:
+        """Fetch KBYG endpoints by name, concurrently when ``max_workers`` > 1."""
+        urls = [f"{Endpoints.KBYG_BASE.value}/{name}" for name in names]
+        if self.max_workers > 1 and len(urls) > 1:
+            results = self._get_executor().map(lambda url: self._get(url, params), urls)
+        else:
+            results = (self._get(url, params) for url in urls)
+        return dict(zip(names, results))
+
     def get_spot_report(
-        self, spot_id: str, days: int = 3, interval_hours: int = 6
+        self,
+        spot_id: str,
+        days: int = 3,
+        interval_hours: int = 6,
+        columnar: bool = False,
+        sections: Optional[Iterable[str]] = None,
+        lazy: bool = False,
     ) -> Optional[SpotReport]:
         """
-        Fetch and return a structured spot report by iterating over several endpoints.
-        """
-        endpoints = [
-            "/wave",
-            "/weather",
-            "/tides",
-            "/surf",
-            "/sunlight",
-            "/wind",
-            "/swells",
-        ]
-        params = {"spotId": spot_id, "days": days, "intervalHours": interval_hours}
-        report_data = {}
-
-        for endpoint in endpoints:
-            url = Endpoints.KBYG_BASE.value + endpoint
-            data = self._get(url, params)
-            report_data[endpoint.lstrip("/")] = data
-
-        return SpotReport(spot_id=spot_id, days=days, report_data=report_data)
+        Fetch and return a structured spot report from the KBYG endpoints.
+
+        Only the endpoints the report sections are built from are requested:
+        ``/wave``, ``/weather``, ``/tides``, ``/wind`` and ``/sunlight`` by
+        default, or just those behind ``sections``. When ``max_workers`` is
+        greater than one they are requested concurrently, so the report
+        costs roughly the slowest single request. Endpoints that fail are
+        stored as ``None``. With ``columnar`` the report holds
+        ``TimeSeries`` sections instead of the raw payloads.
+
+        Any other KBYG endpoint, such as ``/surf`` or ``/swells``, is fetched
+        on demand by ``SpotReport.load``. With ``lazy`` nothing is fetched
+        up front and every endpoint is loaded on first use.
+        """
+        params = kbyg_params(spot_id, days, interval_hours)
+        sections = list(sections) if sections is not None else None
+        names = [] if lazy else section_endpoints(sections)
+
+        report = SpotReport(
+            spot_id=spot_id,
+            days=days,
+            report_data=self._get_endpoints(names, params),
+            loader=lambda missing: self._get_endpoints(missing, params),
+        )
+        return report.to_columnar(sections) if columnar else report
+
+    def refresh_spot_report(
+        self, report: SpotReport, interval_hours: int = 6
+    ) -> SpotReport:
+        """
+        Bring a report up to date, transferring and parsing only what changed.
+
+        Every endpoint the report sections are built from is requested with
+        the validators stored on ``report``. Endpoints answered with
+        ``304 Not Modified``, or that fail, keep their previous series.
+        Changed endpoints are decoded and merged into the previous series by
+        timestamp (see ``TimeSeries.merge``), so steps that have left the
+        API's window are kept. The on-disk cache is not consulted.
+
+        Start a refresh job from ``SpotReport(spot_id, days, report_data={})``;
+        the first refresh fetches everything.
+
+        Returns:
+            SpotReport: A columnar report carrying the new validators.
+        """
+        previous = report.to_columnar()
+        assert previous.series is not None
+        validators = dict(previous.validators or {})
+        params = kbyg_params(report.spot_id, report.days, interval_hours)
+        names = list(dict.fromkeys(SECTION_ENDPOINTS.values()))
+        sent_headers = {name: validators.get(name) for name in names}
+
+        def fetch(name: str):
+            url = f"{Endpoints.KBYG_BASE.value}/{name}"
+            sample = RequestSample(endpoint_label(url))
+            try:
+                response = self._send(url, params, sample, sent_headers[name])
+                if response is None or response.status_code == 304:
+                    return name, None, None
+                return name, response, self._decode(url, response, sample)
+            finally:
+                self._record(sample)
+
+        if self.max_workers > 1:
+            results = list(self._get_executor().map(fetch, names))
+        else:
+            results = [fetch(name) for name in names]
+
+        changed = {}
+        for name, response, data in results:
+            if response is None or data is None:
+                continue
+            changed[name] = data
+            validators[name] = validator_headers(
+                response.headers.get("ETag"), response.headers.get("Last-Modified")
+            )
+
+        series = dict(previous.series)
+        if changed:
+            fresh = build_report_series(changed)
+            for section, name in SECTION_ENDPOINTS.items():
+                if name in changed:
+                    series[section] = series[section].merge(fresh[section])
+        logger.debug(
+            "Refreshed %s: %d of %d endpoints changed",
+            report.spot_id,
+            len(changed),
+            len(names),
+        )
+        return SpotReport(
+            spot_id=report.spot_id,
+            days=report.days,
+            report_data={},
+            series=series,
+            validators=validators,
+        )
+
+    def get_spot_reports(
+        self,
+        spot_ids: Iterable[str],
+        days: int = 3,
+        interval_hours: int = 6,
+        max_concurrency: Optional[int] = None,
+        columnar: bool = False,
+        sections: Optional[Iterable[str]] = None,
+    ) -> Iterator[SpotReport]:
+        """
+        Fetch reports for many spots, yielding each one as soon as all of its
+        endpoints have returned. Only the endpoints behind ``sections`` (all
+        sections by default) are requested, as in ``get_spot_report``.
+
+        Every endpoint request for every spot goes through one pool of
+        ``max_concurrency`` threads (``max_workers`` by default) that shares
+        this client's session. Spots are submitted lazily, with at most twice
+        that many spots in flight: a new spot is submitted whenever one
+        completes, so a slow consumer holds back fetching instead of letting
+        finished reports pile up. Endpoints that fail are stored as ``None``,
+        as in ``get_spot_report``. With ``columnar`` each raw payload is
+        released as soon as its spot is converted to ``TimeSeries`` sections,
+        keeping memory flat over large batches.
+        """
+        sections = list(sections) if sections is not None else None
+        names = section_endpoints(sections)
+        workers = max(1, max_concurrency or self.max_workers)
+        self._ensure_pool_size(workers)
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="surfline-batch"
+        )
+        pending = iter(dict.fromkeys(spot_ids))
+        futures: Dict[Future, Tuple[str, str]] = {}
+        remaining: Dict[str, int] = {}
+        collected: Dict[str, dict] = {}
+
+        def submit(spot_id: str) -> None:
+            params = kbyg_params(spot_id, days, interval_hours)
+            remaining[spot_id] = len(names)
+            collected[spot_id] = {}
+            for name in names:
+                url = f"{Endpoints.KBYG_BASE.value}/{name}"
+                futures[executor.submit(self._get, url, params)] = (spot_id, name)
+
+        try:
+            for spot_id in islice(pending, 2 * workers):
+                submit(spot_id)
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    spot_id, name = futures.pop(future)
+                    collected[spot_id][name] = future.result()
+                    remaining[spot_id] -= 1
+                    if remaining[spot_id]:
+                        continue
+                    del remaining[spot_id]
+                    for next_spot in islice(pending, 1):
+                        submit(next_spot)
+                    results = collected.pop(spot_id)
+                    report_data = {name: results[name] for name in names}
+                    report = SpotReport(
+                        spot_id=spot_id, days=days, report_data=report_data
+                    )
+                    yield report.to_columnar(sections) if columnar else report
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,268 @@
+"""
+Synthetic Surfline payloads.
+
+Deterministic responses shaped like those of every ``Endpoints`` route,
+used by the benchmark scripts and served by the local stand-in server in
+``fake_server``. The same arguments always build the same payload.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from surf_report.providers.surfline.taxonomy import ROOT_TAXONOMY_ID
+
+START_TIMESTAMP = 1717225200  # 2024-06-01 00:00 in UTC-7
+UTC_OFFSET = -7
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+
+def _series(days: int, interval_hours: int) -> List[int]:
+    return list(
+        range(START_TIMESTAMP, START_TIMESTAMP + days * DAY, interval_hours * HOUR)
+    )
+
+
+def make_report_data(days: int = 16, interval_hours: int = 1) -> Dict[str, Any]:
+    """
+    Build ``SpotReport.report_data`` shaped like the KBYG endpoints return it.
+
+    Args:
+        days (int): Forecast length.
+        interval_hours (int): Spacing between rows of the hourly series.
+    """
+    timestamps = _series(days, interval_hours)
+    wave = [
+        {
+            "timestamp": ts,
+            "probability": 100,
+            "utcOffset": UTC_OFFSET,
+            "surf": {
+                "min": 2 + i % 3,
+                "max": 4 + i % 3,
+                "plus": False,
+                "humanRelation": "Waist to chest",
+                "raw": {"min": 2.1, "max": 3.9},
+                "optimalScore": i % 3,
+            },
+            "power": 120.5 + i % 7,
+            "swells": [
+                {
+                    "height": (i + n) % 4 * 0.8,
+                    "period": 8 + n * 3,
+                    "impact": 0.3,
+                    "power": 40.0 + n,
+                    "direction": 200 + n * 30,
+                    "directionMin": 190 + n * 30,
+                    "optimalScore": n % 3,
+                }
+                for n in range(6)
+            ],
+        }
+        for i, ts in enumerate(timestamps)
+    ]
+    weather = [
+        {
+            "timestamp": ts,
+            "utcOffset": UTC_OFFSET,
+            "temperature": 60 + i % 10,
+            "condition": "NIGHT_CLEAR" if i % 24 < 6 else "MOSTLY_CLOUDY",
+            "pressure": 1013,
+        }
+        for i, ts in enumerate(timestamps)
+    ]
+    wind = [
+        {
+            "timestamp": ts,
+            "utcOffset": UTC_OFFSET,
+            "speed": 5 + i % 12,
+            "direction": 280 + i % 40,
+            "directionType": "Onshore" if i % 2 else "Cross-shore",
+            "gust": 9 + i % 12,
+            "optimalScore": i % 3,
+        }
+        for i, ts in enumerate(timestamps)
+    ]
+    tides = [
+        {
+            "timestamp": ts,
+            "utcOffset": UTC_OFFSET,
+            "type": ("HIGH", "NORMAL", "LOW", "NORMAL")[i % 4]
+            if i % 3 == 0
+            else "NORMAL",
+            "height": 1.5 + (i % 6) * 0.5,
+        }
+        for i, ts in enumerate(timestamps)
+    ]
+    sunlight = [
+        {
+            "midnight": start,
+            "midnightUTCOffset": UTC_OFFSET,
+            "dawn": start + 5 * HOUR + 1200,
+            "dawnUTCOffset": UTC_OFFSET,
+            "sunrise": start + 5 * HOUR + 3000,
+            "sunriseUTCOffset": UTC_OFFSET,
+            "sunset": start + 20 * HOUR + 600,
+            "sunsetUTCOffset": UTC_OFFSET,
+            "dusk": start + 20 * HOUR + 2400,
+            "duskUTCOffset": UTC_OFFSET,
+        }
+        for start in _series(days, 24)
+    ]
+    return {
+        "wave": {"data": {"wave": wave}},
+        "weather": {"data": {"weather": weather}},
+        "tides": {"data": {"tides": tides}},
+        "wind": {"data": {"wind": wind}},
+        "sunlight": {"data": {"sunlight": sunlight}},
+    }
+
+
+def make_kbyg_payload(
+    name: str, days: int = 16, interval_hours: int = 1
+) -> Optional[dict]:
+    """
+    Build the response of one KBYG report endpoint, or None if ``name`` is
+    not one. Covers the ``surf`` and ``swells`` endpoints as well as the five
+    ``make_report_data`` returns.
+    """
+    report_data = make_report_data(days, interval_hours)
+    if name in report_data:
+        return report_data[name]
+    wave = report_data["wave"]["data"]["wave"]
+    if name == "surf":
+        rows = [
+            {"timestamp": row["timestamp"], "utcOffset": UTC_OFFSET, **row["surf"]}
+            for row in wave
+        ]
+        return {"data": {"surf": rows}}
+    if name == "swells":
+        rows = [
+            {
+                "timestamp": row["timestamp"],
+                "utcOffset": UTC_OFFSET,
+                "swells": row["swells"],
+            }
+            for row in wave
+        ]
+        return {"data": {"swells": rows}}
+    return None
+
+
+# Node type at each depth below the root of the synthetic taxonomy.
+TAXONOMY_LEVELS = ("geoname", "geoname", "subregion", "spot")
+TAXONOMY_FANOUT = 4
+
+
+def _taxonomy_depth(taxonomy_id: str) -> int:
+    if taxonomy_id == ROOT_TAXONOMY_ID:
+        return 0
+    return taxonomy_id.count("-") if taxonomy_id.startswith("node-") else -1
+
+
+def _taxonomy_item(node_id: str, parent_id: str, level: int, depth: int) -> dict:
+    node_type = TAXONOMY_LEVELS[level - 1]
+    return {
+        "_id": node_id,
+        "name": f"{node_type.title()} {node_id[5:]}",
+        "type": node_type,
+        "depth": depth,
+        "liesIn": [parent_id],
+        "subregion": node_id if node_type == "subregion" else None,
+        "spot": node_id if node_type == "spot" else None,
+    }
+
+
+def make_taxonomy(
+    taxonomy_id: str = ROOT_TAXONOMY_ID,
+    max_depth: int = 0,
+    fanout: int = TAXONOMY_FANOUT,
+) -> dict:
+    """
+    Build a taxonomy response for ``taxonomy_id`` in a synthetic tree.
+
+    The tree under ``ROOT_TAXONOMY_ID`` has ``len(TAXONOMY_LEVELS)`` levels
+    of ``fanout`` children each, ending in spots. Node IDs spell out their
+    path (``node-2-0-1``), so any ID can be expanded without storing the
+    tree. Unknown IDs contain nothing.
+
+    Args:
+        taxonomy_id (str): The node whose descendants are listed.
+        max_depth (int): Levels below the direct children also listed,
+            as with the API's ``maxDepth`` parameter.
+        fanout (int): Children of every node above the spot level.
+    """
+    level = _taxonomy_depth(taxonomy_id)
+    prefix = "node" if taxonomy_id == ROOT_TAXONOMY_ID else taxonomy_id
+    contains: List[dict] = []
+    frontier = [(taxonomy_id, prefix)] if 0 <= level < len(TAXONOMY_LEVELS) else []
+    for depth in range(max_depth + 1):
+        level += 1
+        if level > len(TAXONOMY_LEVELS):
+            break
+        next_frontier = []
+        for parent_id, parent_prefix in frontier:
+            for i in range(fanout):
+                node_id = f"{parent_prefix}-{i}"
+                contains.append(_taxonomy_item(node_id, parent_id, level, depth))
+                next_frontier.append((node_id, node_id))
+        frontier = next_frontier
+    return {"_id": taxonomy_id, "contains": contains}
+
+
+def make_search_results(query: str, hits: int = 5) -> list:
+    """Build a site search response with ``hits`` synthetic spots for ``query``."""
+    spots = [
+        {
+            "_id": f"node-0-0-0-{i}",
+            "_type": "spot",
+            "_source": {
+                "name": f"{query.title()} {i}",
+                "breadCrumbs": [
+                    "Geoname 0",
+                    "Geoname 0-0",
+                    "Subregion 0-0-0",
+                    f"{query.title()} {i}",
+                ],
+            },
+        }
+        for i in range(hits)
+    ]
+    return [
+        {"hits": {"total": 0, "hits": []}},
+        {"hits": {"total": len(spots), "hits": spots}},
+    ]
+
+
+def make_region_overview(region_id: str) -> dict:
+    """Build a subregion overview response."""
+    return {
+        "data": {
+            "_id": region_id,
+            "forecastSummary": {
+                "highlights": [
+                    "Overlapping WNW and SSW swells.",
+                    "Light offshore wind early, onshore by noon.",
+                ],
+                "forecastStatus": {"status": "active"},
+            },
+        }
+    }
+
+
+def make_conditions(days: int = 5) -> dict:
+    """Build a spot forecast (``conditions``) response covering ``days``."""
+    return {
+        "data": {
+            "conditions": [
+                {
+                    "forecastDay": time.strftime(
+                        "%Y-%m-%d", time.gmtime(START_TIMESTAMP + day * DAY)
+                    ),
+                    "headline": "Fun combo swell with light morning wind.",
+                    "observation": "Waist to chest high sets, cleanest early.",
+                }
+                for day in range(days)
+            ]
+        }
+    }
@@ -0,0 +1,301 @@
+"""
+Offline snapshot of the Surfline taxonomy tree.
+
+The snapshot stores every known node together with its parent/child
+adjacency, so region menus can be navigated without a network round-trip
+per level. Nodes remember when their children were fetched, allowing stale
+subtrees to be refreshed on their own.
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from surf_report.providers.surfline.models import Region, parse_region
+from surf_report.providers.surfline.protocols import (
+    ConcurrentTaxonomyClient,
+    TaxonomyClient,
+)
+from surf_report.utils.logger import logger
+from surf_report.utils.paths import user_cache_dir
+
+ROOT_TAXONOMY_ID = "58f7ed51dadb30820bb38782"
+SNAPSHOT_FILENAME = "taxonomy.json"
+SNAPSHOT_VERSION = 1
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+DEFAULT_SYNC_DEPTH = 2
+
+
+def default_snapshot_path() -> Path:
+    """Location of the taxonomy snapshot inside the user cache directory."""
+    return user_cache_dir() / SNAPSHOT_FILENAME
+
+
+class TaxonomyIndex:
+    """Indexed, serialisable view of the taxonomy tree."""
+
+    def __init__(self, root_id: str = ROOT_TAXONOMY_ID):
+        self.root_id = root_id
+        self.nodes: Dict[str, Region] = {}
+        self.children: Dict[str, List[str]] = {}
+        self.parents: Dict[str, str] = {}
+        self.fetched_at: Dict[str, float] = {}
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, taxonomy_id: str) -> bool:
+        return taxonomy_id in self.nodes
+
+    def get(self, taxonomy_id: str) -> Optional[Region]:
+        """Return the region for ``taxonomy_id`` if it is in the snapshot."""
+        return self.nodes.get(taxonomy_id)
+
+    def children_of(self, taxonomy_id: str) -> List[Region]:
+        """Return the known children of ``taxonomy_id``."""
+        return [self.nodes[child] for child in self.children.get(taxonomy_id, [])]
+
+    def parent_of(self, taxonomy_id: str) -> Optional[str]:
+        """Return the parent id of ``taxonomy_id``, or None for the root."""
+        return self.parents.get(taxonomy_id)
+
+    def ancestors(self, taxonomy_id: str) -> List[Region]:
+        """Return the known ancestors of ``taxonomy_id``, outermost first."""
+        chain = []
+        parent = self.parents.get(taxonomy_id)
+        while parent is not None and parent in self.nodes:
+            chain.append(self.nodes[parent])
+            parent = self.parents.get(parent)
+        chain.reverse()
+        return chain
+
+    def descendants(self, taxonomy_id: str) -> Iterator[Region]:
+        """Iterate over every known node below ``taxonomy_id``, depth first."""
+        stack = list(reversed(self.children.get(taxonomy_id, [])))
+        seen = {taxonomy_id}
+        while stack:
+            node_id = stack.pop()
+            # Spots can lie in several regions; yield each once.
+            if node_id in seen or node_id not in self.nodes:
+                continue
+            seen.add(node_id)
+            yield self.nodes[node_id]
+            stack.extend(reversed(self.children.get(node_id, [])))
+
+    def spots(self) -> Iterator[Region]:
+        """Iterate over every spot in the snapshot."""
+        return (region for region in self.nodes.values() if region.type == "spot")
+
+    def is_stale(self, taxonomy_id: str, max_age: float) -> bool:
+        """Return True if the children of ``taxonomy_id`` are missing or old."""
+        fetched_at = self.fetched_at.get(taxonomy_id)
+        return fetched_at is None or time.time() - fetched_at > max_age
+
+    def add_document(
+        self, taxonomy_id: str, data: dict, max_depth: int = 0
+    ) -> List[str]:
+        """
+        Merge a taxonomy response for ``taxonomy_id`` into the index.
+
+        Items at depths below ``max_depth`` have all of their children listed
+        in the response, so their child lists are replaced, and children that
+        are no longer listed anywhere are dropped with their subtrees. Returns
+        the ids of non-spot items on the last level, whose children are still
+        unknown.
+        """
+        items = data.get("contains", [])
+        ids_in_document = {item["_id"] for item in items}
+        complete = {taxonomy_id}
+        frontier = []
+        new_children: Dict[str, List[str]] = {taxonomy_id: []}
+
+        for item in items:
+            depth = item.get("depth", 0)
+            if depth < max_depth:
+                complete.add(item["_id"])
+                new_children.setdefault(item["_id"], [])
+            elif item.get("type") != "spot":
+                frontier.append(item["_id"])
+
+        for item in items:
+            region = parse_region(item)
+            self.nodes[region.id] = region
+            parent = taxonomy_id
+            if item.get("depth", 0) > 0:
+                parent = next(
+                    (p for p in item.get("liesIn", []) if p in ids_in_document),
+                    taxonomy_id,
+                )
+            siblings = new_children.setdefault(parent, [])
+            if region.id not in siblings:
+                siblings.append(region.id)
+            self.parents.setdefault(region.id, parent)
+
+        now = time.time()
+        removed = []
+        for node_id in complete:
+            children = new_children.get(node_id, [])
+            kept = set(children)
+            removed.extend(
+                child for child in self.children.get(node_id, []) if child not in kept
+            )
+            self.children[node_id] = children
+            self.fetched_at[node_id] = now
+        if removed:
+            self._drop_orphans(removed)
+        self.dirty = True
+        return frontier
+
+    def _drop_orphans(self, candidates: List[str]) -> None:
+        """Remove ``candidates`` no other node lists, and their subtrees."""
+        references = Counter(
+            child for children in self.children.values() for child in children
+        )
+        stack = list(candidates)
+        dropped = 0
+        while stack:
+            node_id = stack.pop()
+            # Spots can lie in several regions; keep those still listed.
+            if references[node_id] or node_id == self.root_id:
+                continue
+            if self.nodes.pop(node_id, None) is None:
+                continue
+            dropped += 1
+            self.parents.pop(node_id, None)
+            self.fetched_at.pop(node_id, None)
+            for child in self.children.pop(node_id, []):
+                references[child] -= 1
+                stack.append(child)
+        logger.debug("Dropped %d taxonomy nodes no longer listed", dropped)
+
+    def ensure_children(
+        self, api: TaxonomyClient, taxonomy_id: str, max_age: float = DEFAULT_MAX_AGE
+    ) -> List[Region]:
+        """
+        Return the children of ``taxonomy_id``, fetching them only when the
+        snapshot has none or they are older than ``max_age`` seconds. Stale
+        children are still returned if the refresh fails, e.g. while offline.
+        """
+        if not self.is_stale(taxonomy_id, max_age):
+            return self.children_of(taxonomy_id)
+
+        data = api.get_taxonomy(taxonomy_id)
+        if data is not None:
+            self.add_document(taxonomy_id, data)
+        elif taxonomy_id in self.children:
+            logger.warning("Using stale taxonomy snapshot for %s", taxonomy_id)
+        return self.children_of(taxonomy_id)
+
+    def sync(
+        self,
+        api: ConcurrentTaxonomyClient,
+        taxonomy_id: Optional[str] = None,
+        depth: int = DEFAULT_SYNC_DEPTH,
+    ) -> int:
+        """
+        Download the whole tree below ``taxonomy_id`` (the root by default).
+
+        Each request asks for ``depth`` levels at once, and the nodes left on
+        the last level are expanded concurrently until only spots remain.
+        Returns the number of taxonomy requests made.
+        """
+        frontier = [taxonomy_id or self.root_id]
+        expanded = set()
+        requests_made = 0
+        with ThreadPoolExecutor(max_workers=api.max_workers) as executor:
+            while frontier:
+                # Nodes reachable through several parents are expanded once.
+                frontier = [
+                    node_id
+                    for node_id in dict.fromkeys(frontier)
+                    if node_id not in expanded
+                ]
+                expanded.update(frontier)
+                documents = executor.map(
+                    lambda node_id: api.get_taxonomy(node_id, depth), frontier
+                )
+                next_frontier = []
+                for node_id, data in zip(frontier, documents):
+                    requests_made += 1
+                    if data is None:
+                        continue
+                    next_frontier.extend(self.add_document(node_id, data, depth))
+                logger.debug("Taxonomy sync expanding %d nodes", len(next_frontier))
+                frontier = next_frontier
+        return requests_made
+
+    def refresh_stale(
+        self, api: ConcurrentTaxonomyClient, max_age: float = DEFAULT_MAX_AGE
+    ) -> int:
+        """Re-fetch every level whose children are older than ``max_age``."""
+        stale = [
+            node_id for node_id in self.fetched_at if self.is_stale(node_id, max_age)
+        ]
+        with ThreadPoolExecutor(max_workers=api.max_workers) as executor:
+            documents = executor.map(api.get_taxonomy, stale)
+            refreshed = 0
+            for node_id, data in zip(stale, documents):
+                if data is not None:
+                    self.add_document(node_id, data)
+                    refreshed += 1
+        return refreshed
+
+    def to_dict(self) -> dict:
+        """Serialise the index into a compact JSON-friendly dict."""
+        return {
+            "version": SNAPSHOT_VERSION,
+            "root": self.root_id,
+            "nodes": {
+                node_id: [region.name, region.type, region.subregion, region.spot]
+                for node_id, region in self.nodes.items()
+            },
+            "children": self.children,
+            "parents": self.parents,
+            "fetched_at": self.fetched_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TaxonomyIndex":
+        """Rebuild an index serialised with ``to_dict``."""
+        index = cls(root_id=data["root"])
+        index.nodes = {
+            node_id: Region(id=node_id, name=name, type=type_, subregion=sub, spot=spot)
+            for node_id, (name, type_, sub, spot) in data["nodes"].items()
+        }
+        index.children = data["children"]
+        index.parents = data["parents"]
+        index.fetched_at = data["fetched_at"]
+        return index
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        """Atomically write the snapshot to ``path``."""
+        path = path or default_snapshot_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        self.dirty = False
+        return path
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> Optional["TaxonomyIndex"]:
+        """Load a snapshot from ``path``. Returns None if none is usable."""
+        path = path or default_snapshot_path()
+        try:
+            with path.open(encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable taxonomy snapshot %s: %s", path, e)
+            return None
+        if data.get("version") != SNAPSHOT_VERSION:
+            logger.info("Ignoring taxonomy snapshot with old version")
+            return None
+        return cls.from_dict(data)
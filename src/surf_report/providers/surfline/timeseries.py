@@ -0,0 +1,467 @@
+"""
+Columnar storage for the KBYG time series.
+
+Each report section (surf, swells, wind, ...) is held as parallel typed
+columns instead of a list of nested dicts: numbers live in ``array('d')``
+buffers and labels in lists of interned strings. ``RowView`` objects give
+dict-style access to a single row without copying it, so code written
+against the raw JSON rows keeps working.
+"""
+
+import math
+import sys
+from array import array
+from itertools import groupby
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from surf_report.utils.helpers import convert_timestamps_to_day_time
+
+Column = Union["array[float]", List[Optional[str]]]
+FieldSpec = Dict[str, Tuple[str, ...]]
+
+# Columns holding labels rather than numbers.
+TEXT_FIELDS = frozenset({"humanRelation", "condition", "directionType", "type"})
+
+# Column name -> path to the value inside one row of the endpoint's JSON.
+SURF_FIELDS: FieldSpec = {
+    "min": ("surf", "min"),
+    "max": ("surf", "max"),
+    "humanRelation": ("surf", "humanRelation"),
+    "optimalScore": ("surf", "optimalScore"),
+}
+SWELL_FIELDS: FieldSpec = {
+    "height": ("height",),
+    "period": ("period",),
+    "direction": ("direction",),
+    "power": ("power",),
+    "optimalScore": ("optimalScore",),
+}
+WEATHER_FIELDS: FieldSpec = {
+    "temperature": ("temperature",),
+    "condition": ("condition",),
+}
+TIDE_FIELDS: FieldSpec = {
+    "height": ("height",),
+    "type": ("type",),
+}
+WIND_FIELDS: FieldSpec = {
+    "speed": ("speed",),
+    "direction": ("direction",),
+    "directionType": ("directionType",),
+    "gust": ("gust",),
+    "optimalScore": ("optimalScore",),
+}
+SUNLIGHT_EVENTS = ("dawn", "sunrise", "sunset", "dusk")
+SUNLIGHT_FIELDS: FieldSpec = {
+    name: (name,) for event in SUNLIGHT_EVENTS for name in (event, f"{event}UTCOffset")
+}
+
+
+def _number(value: Any) -> float:
+    if value is None or isinstance(value, bool):
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _number_column(values: List[Any]) -> "array[float]":
+    try:
+        return array("d", values)
+    except TypeError:  # missing or non-numeric values
+        return array("d", map(_number, values))
+
+
+def _column_values(records: List[dict], path: Tuple[str, ...]) -> List[Any]:
+    """Resolve ``path`` in every record, yielding None where it is missing."""
+    first, *rest = path
+    values = [record.get(first) for record in records]
+    for key in rest:
+        values = [value.get(key) if type(value) is dict else None for value in values]
+    return values
+
+
+class RowView:
+    """Read-only, dict-like view of one row of a ``TimeSeries``."""
+
+    __slots__ = ("_series", "_index")
+
+    def __init__(self, series: "TimeSeries", index: int):
+        self._series = series
+        self._index = index
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return the value of column ``name`` for this row.
+
+        ``time`` is the local ``%H:%M:%S`` time of the row's timestamp.
+        """
+        series = self._series
+        if name == "time":
+            return series.day_times()[1][self._index]
+        if name == "timestamp":
+            return series.timestamps[self._index]
+        column = series.columns.get(name)
+        if column is None:
+            return default
+        value = column[self._index]
+        if isinstance(value, float):
+            if math.isnan(value):
+                return default
+            # Numbers come back as they were decoded: whole numbers as ints
+            # unless the column held floats such as ``2.0``.
+            if value.is_integer() and name not in series.float_columns:
+                return int(value)
+        return value
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._series.columns and name not in ("time", "timestamp"):
+            raise KeyError(name)
+        return self.get(name)
+
+    def keys(self) -> List[str]:
+        return ["timestamp", "time", *self._series.columns]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy the row into a plain dict."""
+        return {name: self.get(name) for name in self.keys()}
+
+    def __repr__(self) -> str:
+        return f"RowView({self.to_dict()!r})"
+
+
+class TimeSeries:
+    """
+    A report section stored as parallel columns keyed by timestamp.
+
+    Rows are ordered as they came from the API. Timestamps may repeat, for
+    example when a single wave forecast step has several swells.
+    """
+
+    __slots__ = ("timestamps", "utc_offsets", "columns", "float_columns", "_day_times")
+
+    def __init__(
+        self,
+        timestamps: "array[int]",
+        utc_offsets: "array[float]",
+        columns: Dict[str, Column],
+        float_columns: FrozenSet[str] = frozenset(),
+    ):
+        """
+        Args:
+            timestamps (array): Unix timestamps, one per row.
+            utc_offsets (array): UTC offsets in hours, one per row.
+            columns (dict): Column name to ``array('d')`` or list of labels.
+            float_columns (frozenset): Numeric columns whose whole numbers
+                were decoded as floats and should be read back as floats.
+        """
+        self.timestamps = timestamps
+        self.utc_offsets = utc_offsets
+        self.columns = columns
+        self.float_columns = float_columns
+        self._day_times: Optional[Tuple[List[str], List[str]]] = None
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Tuple[Any, Any, Any]],
+        fields: FieldSpec,
+    ) -> "TimeSeries":
+        """
+        Build a series from ``(timestamp, utc_offset, record)`` tuples.
+
+        Args:
+            records: One tuple per row; ``record`` is the JSON object the
+                field paths are resolved against.
+            fields (dict): Column name to the path of its value in a record.
+        """
+        records = list(records)
+        timestamps = array("q", [int(record[0]) for record in records])
+        utc_offsets = _number_column([record[1] for record in records])
+        objects = [record[2] for record in records]
+
+        # Build one column at a time so each pass is a tight comprehension.
+        columns: Dict[str, Column] = {}
+        float_columns = set()
+        for name, path in fields.items():
+            values = _column_values(objects, path)
+            if name in TEXT_FIELDS:
+                columns[name] = [
+                    sys.intern(value) if type(value) is str else value
+                    for value in values
+                ]
+                continue
+            columns[name] = _number_column(values)
+            if any(type(value) is float and value.is_integer() for value in values):
+                float_columns.add(name)
+        return cls(timestamps, utc_offsets, columns, frozenset(float_columns))
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[dict],
+        fields: FieldSpec,
+        timestamp_key: str = "timestamp",
+        offset_key: str = "utcOffset",
+    ) -> "TimeSeries":
+        """Build a series from JSON rows, skipping rows without a timestamp."""
+        return cls.from_records(
+            (
+                (row[timestamp_key], row.get(offset_key), row)
+                for row in rows
+                if row.get(timestamp_key)
+            ),
+            fields,
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index: int) -> RowView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return RowView(self, index)
+
+    def __iter__(self) -> Iterator[RowView]:
+        return (RowView(self, i) for i in range(len(self)))
+
+    def column(self, name: str) -> Column:
+        """Return the raw column ``name``."""
+        return self.columns[name]
+
+    def day_times(self) -> Tuple[List[str], List[str]]:
+        """Local ``(dates, times)`` strings for every row, computed once."""
+        if self._day_times is None:
+            self._day_times = convert_timestamps_to_day_time(
+                self.timestamps, self.utc_offsets
+            )
+        return self._day_times
+
+    def select(self, indices: Sequence[int]) -> "TimeSeries":
+        """Return a new series holding only the rows at ``indices``."""
+        columns: Dict[str, Column] = {}
+        for name, column in self.columns.items():
+            if isinstance(column, array):
+                columns[name] = array(column.typecode, [column[i] for i in indices])
+            else:
+                columns[name] = [column[i] for i in indices]
+        return TimeSeries(
+            array("q", [self.timestamps[i] for i in indices]),
+            array("d", [self.utc_offsets[i] for i in indices]),
+            columns,
+            self.float_columns,
+        )
+
+    def values(self, name: str, indices: Sequence[int]) -> List[Any]:
+        """
+        Return the values of column ``name`` at ``indices`` as ``RowView.get``
+        would, converting the whole selection in one pass.
+        """
+        if name == "time":
+            times = self.day_times()[1]
+            return [times[i] for i in indices]
+        if name == "timestamp":
+            return [self.timestamps[i] for i in indices]
+        column = self.columns.get(name)
+        if column is None:
+            return [None] * len(indices)
+        if not isinstance(column, array):
+            return [column[i] for i in indices]
+        numbers: List[float] = [column[i] for i in indices]
+        # NaN marks a missing value.
+        if name in self.float_columns:
+            return [None if math.isnan(value) else value for value in numbers]
+        return [
+            None if math.isnan(value) else int(value) if value.is_integer() else value
+            for value in numbers
+        ]
+
+    def merge(self, newer: "TimeSeries") -> "TimeSeries":
+        """
+        Return the rows of both series ordered by timestamp, with ``newer``
+        replacing every row of this series that shares one of its timestamps.
+
+        Used to fold a refreshed forecast window into a previously fetched
+        one: steps the API no longer returns are kept, updated steps win.
+        """
+        if not len(self):
+            return newer
+        if not len(newer):
+            return self
+        replaced = set(newer.timestamps)
+        kept = [i for i, ts in enumerate(self.timestamps) if ts not in replaced]
+        older = self.select(kept)
+        timestamps = older.timestamps + newer.timestamps
+        combined = TimeSeries(
+            timestamps,
+            older.utc_offsets + newer.utc_offsets,
+            {
+                name: _concat(older, newer, name)
+                for name in dict.fromkeys([*older.columns, *newer.columns])
+            },
+            older.float_columns | newer.float_columns,
+        )
+        if all(a <= b for a, b in zip(timestamps, timestamps[1:])):
+            return combined
+        # A stable sort keeps several rows per timestamp (swells) in order.
+        return combined.select(
+            sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        )
+
+    def indices_where(self, name: str, predicate: Callable[[Any], bool]) -> List[int]:
+        """Return the positions whose value in column ``name`` satisfies ``predicate``."""
+        return [i for i, value in enumerate(self.columns[name]) if predicate(value)]
+
+    def where(self, name: str, predicate: Callable[[Any], bool]) -> "TimeSeries":
+        """Return the rows whose value in column ``name`` satisfies ``predicate``."""
+        return self.select(self.indices_where(name, predicate))
+
+    def rows_by_day(
+        self, indices: Optional[Iterable[int]] = None
+    ) -> Dict[str, List[RowView]]:
+        """
+        Group row views by their local date, keeping row order.
+
+        Args:
+            indices (Iterable[int], optional): Only group these rows.
+        """
+        days = self.day_times()[0]
+        grouped: Dict[str, List[RowView]] = {}
+        # Rows arrive in time order, so each day is one contiguous run.
+        for day, run in groupby(
+            range(len(self)) if indices is None else indices, days.__getitem__
+        ):
+            rows = grouped.get(day)
+            if rows is None:
+                rows = grouped[day] = []
+            rows.extend([RowView(self, i) for i in run])
+        return grouped
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the series, in bytes."""
+        total = sys.getsizeof(self.timestamps) + sys.getsizeof(self.utc_offsets)
+        for column in self.columns.values():
+            total += sys.getsizeof(column)
+        return total
+
+
+def _concat(first: TimeSeries, second: TimeSeries, name: str) -> Column:
+    """Column ``name`` of ``first`` followed by that of ``second``."""
+    parts = []
+    for series in (first, second):
+        column = series.columns.get(name)
+        if column is None:
+            missing = [None] if name in TEXT_FIELDS else array("d", [math.nan])
+            column = missing * len(series)
+        parts.append(column)
+    return parts[0] + parts[1]
+
+
+def row_values(rows: Sequence[Any], names: Sequence[str]) -> List[List[Any]]:
+    """
+    Return one list of values per name for ``rows``.
+
+    Rows that are views over a single ``TimeSeries`` are read column by
+    column; any other dict-like rows fall back to ``row.get``.
+    """
+    if rows and type(rows[0]) is RowView:
+        series = rows[0]._series
+        indices = [row._index for row in rows if row._series is series]
+        if len(indices) == len(rows):
+            return [series.values(name, indices) for name in names]
+    return [[row.get(name) for row in rows] for name in names]
+
+
+# Report section -> KBYG endpoint its rows come from.
+SECTION_ENDPOINTS = {
+    "surf": "wave",
+    "swells": "wave",
+    "weather": "weather",
+    "tides": "tides",
+    "wind": "wind",
+    "sunlight": "sunlight",
+}
+
+
+def section_endpoints(sections: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    KBYG endpoints the given report sections are built from, without
+    duplicates. All sections when ``sections`` is None; unknown names are
+    ignored.
+    """
+    names = SECTION_ENDPOINTS if sections is None else sections
+    return list(
+        dict.fromkeys(
+            SECTION_ENDPOINTS[name] for name in names if name in SECTION_ENDPOINTS
+        )
+    )
+
+
+def build_report_series(
+    report_data: dict, sections: Optional[Iterable[str]] = None
+) -> Dict[str, TimeSeries]:
+    """
+    Convert raw KBYG endpoint payloads into one ``TimeSeries`` per section.
+
+    Sections are keyed like the report sections: ``surf`` and ``swells``
+    (both from ``/wave``), ``weather``, ``tides``, ``wind`` and
+    ``sunlight``. Endpoints that failed produce empty series. With
+    ``sections`` only those sections are built, and only their endpoints
+    are read from ``report_data``.
+    """
+
+    def rows(endpoint: str) -> List[dict]:
+        return (report_data.get(endpoint) or {}).get("data", {}).get(endpoint, [])
+
+    wanted = SECTION_ENDPOINTS if sections is None else set(sections)
+    series: Dict[str, TimeSeries] = {}
+    if "surf" in wanted or "swells" in wanted:
+        wave_rows = [wave for wave in rows("wave") if wave.get("timestamp")]
+        if "surf" in wanted:
+            series["surf"] = TimeSeries.from_records(
+                (
+                    (wave["timestamp"], wave.get("utcOffset"), wave)
+                    for wave in wave_rows
+                    if wave.get("surf")
+                ),
+                SURF_FIELDS,
+            )
+        if "swells" in wanted:
+            series["swells"] = TimeSeries.from_records(
+                (
+                    (wave["timestamp"], wave.get("utcOffset"), swell)
+                    for wave in wave_rows
+                    for swell in wave.get("swells", [])
+                ),
+                SWELL_FIELDS,
+            )
+    for section, fields in (
+        ("weather", WEATHER_FIELDS),
+        ("tides", TIDE_FIELDS),
+        ("wind", WIND_FIELDS),
+    ):
+        if section in wanted:
+            series[section] = TimeSeries.from_rows(rows(section), fields)
+    if "sunlight" in wanted:
+        series["sunlight"] = TimeSeries.from_rows(
+            rows("sunlight"),
+            SUNLIGHT_FIELDS,
+            timestamp_key="sunrise",
+            offset_key="sunriseUTCOffset",
+        )
+    return series
@@ -1,23 +1,25 @@
-import io
 import sys
 import textwrap
 
 from surf_report.providers.surfline.processing import (
-    group_spot_report,
+    group_report,
 )
+from surf_report.providers.surfline.timeseries import row_values
 from surf_report.utils import pager
+from surf_report.utils.helpers import convert_timestamps_to_day_time
 
 
-def _resolve_output_stream(output=None):
+def _emit(text, output=None):
     """
-    Returns a tuple of (output_stream, use_pager) where output_stream is either
-    the provided stream, a StringIO buffer if paging, or stdout otherwise.
+    Writes rendered text to the provided stream, or to the pager when stdout
+    is a terminal, or to stdout otherwise.
     """
     if output is not None:
-        return output, False
-    if pager.should_use_pager():
-        return io.StringIO(), True
-    return sys.stdout, False
+        output.write(text)
+    elif pager.should_use_pager():
+        pager.page_output(text)
+    else:
+        sys.stdout.write(text)
 
 
 def display_regions(regions, verbose=False):
@@ -62,6 +64,36 @@ def display_region_overview(region_overview):
     print(forecast_summary)
 
 
+def _format_number(value):
+    if value is None:
+        return "-"
+    return f"{value:g}"
+
+
+def display_rankings(rankings, output=None):
+    """Displays spot rankings, best first, with their best window."""
+    if not rankings:
+        _emit("No spot has a surf forecast for the selected windows.\n", output)
+        return
+    dates, times = convert_timestamps_to_day_time(
+        [ranking.timestamp for ranking in rankings],
+        [ranking.utc_offset for ranking in rankings],
+    )
+    width = max(len(ranking.name or ranking.spot_id) for ranking in rankings)
+    lines = ["\nBest spots:"]
+    for i, ranking in enumerate(rankings):
+        surf = f"{_format_number(ranking.surf_min)}-{_format_number(ranking.surf_max)}"
+        wind = _format_number(ranking.wind_speed)
+        if ranking.wind_direction_type:
+            wind += f" {ranking.wind_direction_type}"
+        lines.append(
+            f"{i + 1:>3}. {ranking.name or ranking.spot_id:<{width}}  "
+            f"{ranking.score:4.1f}  {dates[i]} {times[i][:5]}  "
+            f"surf {surf}  wind {wind}  tide {_format_number(ranking.tide_height)}"
+        )
+    _emit("\n".join(lines) + "\n", output)
+
+
 def display_spot_forecast(spot_forecast):
     """Displays spot forecast observations."""
     if spot_forecast is None:
@@ -81,81 +113,142 @@ def display_spot_forecast(spot_forecast):
         print("No conditions data available.")
 
 
-# Define individual functions for each section of the spot report.
-def display_surf(surf_list, output=None):
+DEFAULT_SECTIONS = ["surf", "swells", "weather", "tides", "wind", "sunlight"]
+
+# Section name -> (heading, first row shown, line template, template fields,
+# skip midnight rows). Surf, wind and weather skip their first data point,
+# which represents midnight; swells skip every midnight row.
+SECTION_LAYOUTS = {
+    "surf": (
+        "Surf:",
+        1,
+        "  [{}] Min: {} FT, Max: {} FT, Condition: {}",
+        ("time", "min", "max", "humanRelation"),
+        False,
+    ),
+    "wind": (
+        "Wind:",
+        1,
+        "  [{}] Speed: {} KTS, Direction: {}° {}",
+        ("time", "speed", "direction", "directionType"),
+        False,
+    ),
+    "weather": (
+        "Weather:",
+        1,
+        "  [{}] Temperature: {}°F, Condition: {}",
+        ("time", "temperature", "condition"),
+        False,
+    ),
+    "tides": (
+        "Tides:",
+        0,
+        "  [{}] Height: {} FT, Type: {}",
+        ("time", "height", "type"),
+        False,
+    ),
+    "swells": (
+        "Swells:",
+        0,
+        "  [{}] Height: {} FT, Direction: {}°, Power: {}",
+        ("time", "height", "direction", "power"),
+        True,
+    ),
+    "sunlight": (
+        "Sunlight:",
+        0,
+        "  Dawn: {}, Sunrise: {}, Sunset: {}, Dusk: {}",
+        ("dawn", "sunrise", "sunset", "dusk"),
+        False,
+    ),
+}
+
+
+def compile_layout(sections=None):
+    """
+    Resolves the sections to render into a list of
+    ``(name, heading, first_row, line_format, fields, skip_midnight)``
+    entries, so the lookups happen once per report rather than once per day.
+    """
+    if sections is None:
+        sections = DEFAULT_SECTIONS
+    layout = []
+    for section in sections:
+        if section not in SECTION_LAYOUTS:
+            continue
+        heading, first_row, template, fields, skip_midnight = SECTION_LAYOUTS[section]
+        layout.append(
+            (section, heading, first_row, template.format, fields, skip_midnight)
+        )
+    return layout
+
+
+def _render_section(
+    chunks, rows, heading, first_row, line_format, fields, skip_midnight
+):
+    """Appends one section's heading and lines to ``chunks``."""
+    if first_row:
+        rows = rows[first_row:]
+    if skip_midnight:
+        rows = [row for row in rows if row.get("time") != "00:00:00"]
+    chunks.append(heading)
+    chunks.append("\n")
+    if rows:
+        # Values are gathered per column, then every line is formatted in one
+        # map() call instead of a Python-level loop over rows.
+        chunks.append("\n".join(map(line_format, *row_values(rows, fields))))
+        chunks.append("\n")
+
+
+def render_day(chunks, day, data, layout):
+    """Appends the block for one day of grouped data to ``chunks``."""
+    chunks.append(f"\n{day}\n{'-' * 30}\n")
+    for section, *section_layout in layout:
+        rows = data.get(section)
+        if rows:
+            _render_section(chunks, rows, *section_layout)
+
+
+def render_grouped_data(grouped_data, sections=None):
+    """Returns the text for grouped spot report data, one block per day."""
+    layout = compile_layout(sections)
+    chunks = []
+    for day in sorted(grouped_data):
+        render_day(chunks, day, grouped_data[day], layout)
+    return "".join(chunks)
+
+
+def _display_section(section, rows, output=None):
     if output is None:
         output = sys.stdout
-    if surf_list:
-        print("Surf:", file=output)
-        # Optionally skip the first data point if it represents midnight
-        for surf in surf_list[1:]:
-            print(
-                f"  [{surf.get('time')}] Min: {surf.get('min')} FT, Max: {surf.get('max')} FT, Condition: {surf.get('humanRelation')}",
-                file=output,
-            )
+    if rows:
+        chunks = []
+        _render_section(chunks, rows, *compile_layout([section])[0][1:])
+        output.write("".join(chunks))
+
+
+def display_surf(surf_list, output=None):
+    _display_section("surf", surf_list, output)
 
 
 def display_wind(wind_list, output=None):
-    if output is None:
-        output = sys.stdout
-    if wind_list:
-        print("Wind:", file=output)
-        # Optionally skip the first data point if it represents midnight
-        for wind in wind_list[1:]:
-            print(
-                f"  [{wind.get('time')}] Speed: {wind.get('speed')} KTS, Direction: {wind.get('direction')}° {wind.get('directionType')}",
-                file=output,
-            )
+    _display_section("wind", wind_list, output)
 
 
 def display_weather(weather_list, output=None):
-    if output is None:
-        output = sys.stdout
-    if weather_list:
-        print("Weather:", file=output)
-        for weather in weather_list[1:]:
-            print(
-                f"  [{weather.get('time')}] Temperature: {weather.get('temperature')}°F, Condition: {weather.get('condition')}",
-                file=output,
-            )
+    _display_section("weather", weather_list, output)
 
 
 def display_tides(tides_list, output=None):
-    if output is None:
-        output = sys.stdout
-    if tides_list:
-        print("Tides:", file=output)
-        for tide in tides_list:
-            print(
-                f"  [{tide.get('time')}] Height: {tide.get('height')} FT, Type: {tide.get('type')}",
-                file=output,
-            )
+    _display_section("tides", tides_list, output)
 
 
 def display_swells(swells_list, output=None):
-    if output is None:
-        output = sys.stdout
-    if swells_list:
-        print("Swells:", file=output)
-        for swell in swells_list:
-            if swell.get("time") == "00:00:00":
-                continue
-            print(
-                f"  [{swell.get('time')}] Height: {swell.get('height')} FT, Direction: {swell.get('direction')}°, Power: {swell.get('power')}",
-                file=output,
-            )
+    _display_section("swells", swells_list, output)
 
 
 def display_sunlight(sunlight_list, output=None):
-    if output is None:
-        output = sys.stdout
-    if sunlight_list:
-        print("Sunlight:", file=output)
-        for sunlight in sunlight_list:
-            print(
-                f"  Dawn: {sunlight.get('dawn')}, Sunrise: {sunlight.get('sunrise')}, Sunset: {sunlight.get('sunset')}, Dusk: {sunlight.get('dusk')}",
-                file=output,
-            )
+    _display_section("sunlight", sunlight_list, output)
 
 
 def display_grouped_data_modular(grouped_data, sections=None, output=None):
@@ -165,31 +258,9 @@ def display_grouped_data_modular(grouped_data, sections=None, output=None):
     'surf', 'wind', 'weather', 'tides', 'swells', 'sunlight'.
     If sections is None, all sections will be printed.
     """
-    # If no sections specified, print everything.
-    if sections is None:
-        sections = ["surf", "swells", "weather", "tides", "wind", "sunlight"]
-
-    # Map section names to display functions.
-    section_functions = {
-        "surf": display_surf,
-        "wind": display_wind,
-        "weather": display_weather,
-        "tides": display_tides,
-        "swells": display_swells,
-        "sunlight": display_sunlight,
-    }
-
     if output is None:
         output = sys.stdout
-
-    for day in sorted(grouped_data.keys()):
-        data = grouped_data[day]
-        print(f"\n{day}", file=output)
-        print("-" * 30, file=output)
-        for section in sections:
-            # Call the display function for the section if it exists.
-            if section in section_functions and data.get(section):
-                section_functions[section](data[section], output=output)
+    output.write(render_grouped_data(grouped_data, sections))
 
 
 def display_spot_report(spot_report, sections=None, output=None):
@@ -201,27 +272,18 @@ def display_spot_report(spot_report, sections=None, output=None):
         print("\nNo spot report available.", file=target)
         return
 
-    writer, needs_pager = _resolve_output_stream(output)
-    report_data = getattr(spot_report, "report_data", {})
-    grouped_data = group_spot_report(report_data)
-    display_grouped_data_modular(grouped_data, sections, output=writer)
-    if needs_pager:
-        pager.page_output(writer.getvalue())
+    grouped_data = group_report(spot_report, sections)
+    _emit(render_grouped_data(grouped_data, sections), output)
 
 
-def display_combined_spot_report(
-    spot_forecast,
-    spot_report,
-    sections=None,
-    wrap_width: int = 80,
-    output=None,
+def render_combined_spot_report(
+    spot_forecast, spot_report, sections=None, wrap_width: int = 80
 ):
     """
-    Displays a combined spot report where for each day the overview forecast
-    is shown above the detailed report. The sections parameter allows printing only
-    specific parts of the detailed report.
+    Returns the text of a combined spot report, where for each day the
+    overview forecast is shown above the detailed report.
     """
-    writer, needs_pager = _resolve_output_stream(output)
+    chunks = []
     overview_by_day = {}
     if spot_forecast:
         forecast_data = getattr(spot_forecast, "forecast_data", {})
@@ -233,51 +295,56 @@ def display_combined_spot_report(
                 "observation": forecast.get("observation", "No observation found."),
             }
     else:
-        print("\nNo overview forecast available.", file=writer)
+        chunks.append("\nNo overview forecast available.\n")
 
     if not spot_report:
-        print("\nNo detailed spot report available.", file=writer)
-        if needs_pager:
-            pager.page_output(writer.getvalue())
-        return
-
-    report_data = getattr(spot_report, "report_data", {})
-    grouped_data = group_spot_report(report_data)
-    all_days = set(grouped_data.keys()) | set(overview_by_day.keys())
-    for day in sorted(all_days):
-        print(f"\n{day}", file=writer)
-        print("=" * 30, file=writer)
-        if day in overview_by_day:
-            print("Overview Forecast:", file=writer)
+        chunks.append("\nNo detailed spot report available.\n")
+        return "".join(chunks)
+
+    grouped_data = group_report(spot_report, sections)
+    layout = compile_layout(sections)
+    divider = "=" * 30 + "\n"
+    for day in sorted(set(grouped_data) | set(overview_by_day)):
+        chunks.append(f"\n{day}\n")
+        chunks.append(divider)
+        overview = overview_by_day.get(day)
+        if overview is not None:
             # Wrap the headline and observation text
             wrapped_headline = textwrap.fill(
-                f"Headline: {overview_by_day[day]['headline']}",
+                f"Headline: {overview['headline']}",
                 width=wrap_width,
                 subsequent_indent="  ",
             )
             wrapped_observation = textwrap.fill(
-                f"Observation: {overview_by_day[day]['observation']}",
+                f"Observation: {overview['observation']}",
                 width=wrap_width,
                 subsequent_indent="  ",
             )
-            print(wrapped_headline, file=writer)
-            print(wrapped_observation, file=writer)
+            chunks.append(
+                f"Overview Forecast:\n{wrapped_headline}\n{wrapped_observation}\n"
+            )
         else:
-            print("No overview forecast available for this day.", file=writer)
-        print("-" * 30, file=writer)
-        day_data = grouped_data.get(
-            day,
-            {
-                "surf": [],
-                "swells": [],
-                "weather": [],
-                "tides": [],
-                "wind": [],
-                "sunlight": [],
-            },
-        )
-        # Print only the specified sections.
-        display_grouped_data_modular({day: day_data}, sections, output=writer)
-        print("=" * 30, file=writer)
-    if needs_pager:
-        pager.page_output(writer.getvalue())
+            chunks.append("No overview forecast available for this day.\n")
+        chunks.append("-" * 30 + "\n")
+        # Render only the specified sections.
+        render_day(chunks, day, grouped_data.get(day, {}), layout)
+        chunks.append(divider)
+    return "".join(chunks)
+
+
+def display_combined_spot_report(
+    spot_forecast,
+    spot_report,
+    sections=None,
+    wrap_width: int = 80,
+    output=None,
+):
+    """
+    Displays a combined spot report where for each day the overview forecast
+    is shown above the detailed report. The sections parameter allows printing only
+    specific parts of the detailed report.
+    """
+    _emit(
+        render_combined_spot_report(spot_forecast, spot_report, sections, wrap_width),
+        output,
+    )
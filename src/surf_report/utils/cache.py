@@ -0,0 +1,290 @@
+"""
+Persistent on-disk cache for decoded API responses.
+
+Entries live in a single SQLite database under the user cache directory.
+Each entry carries its own expiry, and the database is kept under a size
+budget by evicting the least recently used entries. Expired entries keep the
+response's ``ETag``/``Last-Modified`` validators so they can be revalidated
+with a conditional request instead of downloaded again.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from surf_report.utils.logger import logger
+from surf_report.utils.paths import user_cache_dir
+
+CACHE_FILENAME = "responses.sqlite3"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access);
+"""
+
+# Columns added after the first release, created on databases that lack them.
+_ADDED_COLUMNS = {"etag": "TEXT", "last_modified": "TEXT"}
+
+
+def make_cache_key(url: str, params: Optional[dict] = None) -> str:
+    """Build a stable cache key from a URL and its query parameters."""
+    canonical = json.dumps([url, params or {}], sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def validator_headers(
+    etag: Optional[str] = None, last_modified: Optional[str] = None
+) -> Dict[str, str]:
+    """Conditional request headers for a response's validators."""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body, possibly expired, with its validators."""
+
+    body: str
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    _value: Any = field(default=None, repr=False)
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+    def fresh_for(self, seconds: float) -> bool:
+        """Whether the entry will still be fresh ``seconds`` from now."""
+        return self.expires_at > time.time() + seconds
+
+    @property
+    def value(self) -> Any:
+        """The decoded body, parsed on first access."""
+        if self._value is None:
+            self._value = json.loads(self.body)
+        return self._value
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers revalidating this entry; empty if it has no validators."""
+        return validator_headers(self.etag, self.last_modified)
+
+
+class RevalidationStats:
+    """
+    Thread-safe counts of network requests and of those answered with
+    ``304 Not Modified``.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.conditional = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+
+    def record(self, conditional: bool, not_modified: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.conditional += conditional
+            self.not_modified += not_modified
+
+    @property
+    def unchanged_fraction(self) -> float:
+        """Share of network requests served as unchanged (0.0 when none)."""
+        return self.not_modified / self.requests if self.requests else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.not_modified} of {self.requests} requests unchanged "
+            f"(304, {self.unchanged_fraction:.0%}); "
+            f"{self.conditional} sent with validators"
+        )
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache with per-entry TTLs and LRU eviction.
+
+    The database is opened lazily on first use and may be shared between
+    threads.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            path (Path, optional): Database location. Defaults to
+                ``responses.sqlite3`` inside the user cache directory.
+            max_bytes (int): Total body size kept before evicting entries.
+        """
+        self._path = path
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # Running total of body sizes, so inserts need not sum the table.
+        self._total_bytes = 0
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = user_cache_dir() / CACHE_FILENAME
+        return self._path
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            existing = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(responses)")
+            }
+            for name, kind in _ADDED_COLUMNS.items():
+                if name not in existing:
+                    self._conn.execute(
+                        f"ALTER TABLE responses ADD COLUMN {name} {kind}"
+                    )
+            self._total_bytes = self._stored_bytes(self._conn)
+        return self._conn
+
+    @staticmethod
+    def _stored_bytes(conn: sqlite3.Connection) -> int:
+        (total,) = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return total
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key`` or None if missing or expired."""
+        entry = self.get_entry(key)
+        if entry is None or not entry.fresh:
+            return None
+        return entry.value
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Return the entry for ``key`` even if it has expired, so its
+        validators can be used to revalidate it. The body is not decoded
+        until ``CacheEntry.value`` is read.
+        """
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT body, expires_at, etag, last_modified "
+                    "FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+                )
+            except sqlite3.Error as e:
+                logger.warning("Response cache read failed: %s", e)
+                return None
+        return CacheEntry(*row)
+
+    def renew(self, key: str, ttl: float) -> None:
+        """Mark ``key`` fresh for another ``ttl`` seconds, e.g. after a 304."""
+        now = time.time()
+        with self._lock:
+            try:
+                self._connection().execute(
+                    "UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?",
+                    (now + ttl, now, key),
+                )
+            except sqlite3.Error as e:
+                logger.warning("Response cache write failed: %s", e)
+
+    def set(
+        self,
+        key: str,
+        url: str,
+        value: Any,
+        ttl: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """
+        Store ``value`` under ``key`` for ``ttl`` seconds, with the
+        response's validators when the server sent any.
+        """
+        body = json.dumps(value, separators=(",", ":"))
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                replaced = conn.execute(
+                    "SELECT size FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, url, body, size, "
+                    "expires_at, last_access, etag, last_modified) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, url, body, len(body), now + ttl, now, etag, last_modified),
+                )
+                self._total_bytes += len(body) - (replaced[0] if replaced else 0)
+                if self._total_bytes > self.max_bytes:
+                    self._evict(conn)
+            except sqlite3.Error as e:
+                logger.warning("Response cache write failed: %s", e)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """
+        Drop least recently used entries until the size budget is met.
+
+        Other processes share the database, so the running total is re-read
+        before evicting rather than trusted.
+        """
+        self._total_bytes = self._stored_bytes(conn)
+        excess = self._total_bytes - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access"
+        ):
+            victims.append((key,))
+            self._total_bytes -= size
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        logger.debug("Evicted %d cached responses", len(victims))
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM responses")
+            conn.execute("VACUUM")
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,10 +1,56 @@
 import argparse
-from datetime import datetime, timedelta, timezone
+import sys
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Tuple
 
+COMMANDS = ("batch", "rank", "taxonomy", "serve", "prefetch")
+# Kept in sync with surf_report.providers.surfline.export.FORMATS, which is
+# not imported here to keep `--help` cheap.
+EXPORT_FORMATS = ("jsonl", "csv", "parquet")
+# Kept in sync with surf_report.providers.surfline.processing.SECTIONS.
+REPORT_SECTIONS = ("surf", "weather", "tides", "wind", "swells", "sunlight")
 
-def parse_arguments():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(description="Surf Region Explorer")
+SECONDS_PER_DAY = 24 * 60 * 60
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Formatted strings keyed by days since the epoch and by seconds into the day.
+# Both are small (a forecast spans a few weeks; a day has 86400 seconds), so
+# they are kept for the life of the process.
+_day_strings: Dict[int, str] = {}
+_time_strings: Dict[int, str] = {}
+
+
+def parse_sections(value: str) -> List[str]:
+    """Parse a comma-separated ``--sections`` value, e.g. ``wind,tides``."""
+    sections = [section.strip() for section in value.split(",") if section.strip()]
+    unknown = [section for section in sections if section not in REPORT_SECTIONS]
+    if unknown or not sections:
+        raise argparse.ArgumentTypeError(
+            f"invalid sections {', '.join(unknown) or value!r}; "
+            f"choose from {', '.join(REPORT_SECTIONS)}"
+        )
+    return sections
+
+
+def add_sections_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--sections",
+        type=parse_sections,
+        default=None,
+        metavar="LIST",
+        help=(
+            "Comma-separated report sections to fetch and show "
+            f"({','.join(REPORT_SECTIONS)}); default all."
+        ),
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser for the default browse/search mode."""
+    parser = argparse.ArgumentParser(
+        description="Surf Region Explorer",
+        epilog="commands: batch, rank, taxonomy, serve, prefetch (run `surfreport <command> --help` for details)",
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Increase output verbosity"
     )
@@ -24,7 +70,258 @@ def parse_arguments():
         nargs="?",
         help="Number of days to get surf report for.",
     )
-    return parser.parse_args()
+    add_sections_argument(parser)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk response cache.",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Purge the on-disk response cache and exit.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print per-endpoint request timings to stderr when done.",
+    )
+    return parser
+
+
+def build_command_parser() -> argparse.ArgumentParser:
+    """Build the parser for the named subcommands."""
+    parser = argparse.ArgumentParser(prog="surfreport")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk response cache.",
+    )
+    common.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print per-endpoint request timings to stderr when done.",
+    )
+
+    batch = subparsers.add_parser(
+        "batch", parents=[common], help="Print reports for many spots at once."
+    )
+    batch.add_argument(
+        "--spots-file",
+        required=True,
+        help="File with one spot ID per line ('-' reads stdin).",
+    )
+    batch.add_argument(
+        "--days",
+        "-d",
+        type=int,
+        default=3,
+        help="Number of days to get surf report for.",
+    )
+    batch.add_argument(
+        "--concurrency",
+        "-j",
+        type=int,
+        default=16,
+        help="Maximum number of requests in flight across all spots.",
+    )
+    batch.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="Maximum requests per second sent to the Surfline API.",
+    )
+    add_sections_argument(batch)
+    batch.add_argument(
+        "--format",
+        "-f",
+        choices=("text",) + EXPORT_FORMATS,
+        default="text",
+        help="Output format; parquet requires the 'parquet' extra and --output.",
+    )
+    batch.add_argument(
+        "--output",
+        "-o",
+        default=None,
+        help="Write output to this file instead of stdout.",
+    )
+    batch.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=0,
+        help=(
+            "Group and format reports in this many worker processes "
+            "(0: in this process). Not used for parquet."
+        ),
+    )
+    batch.add_argument(
+        "--chunk-size",
+        type=int,
+        default=16,
+        help="Reports sent to a worker process at a time.",
+    )
+    batch.add_argument(
+        "--metrics-file",
+        default=None,
+        help="Write request metrics in the Prometheus text format to this file.",
+    )
+
+    rank = subparsers.add_parser(
+        "rank",
+        parents=[common],
+        help="Rank every spot in a region by its best forecast window.",
+    )
+    rank.add_argument(
+        "region",
+        help="Taxonomy ID, or name from the taxonomy snapshot, of the region.",
+    )
+    rank.add_argument(
+        "--top",
+        "-k",
+        type=int,
+        default=10,
+        help="Number of spots to list.",
+    )
+    rank.add_argument(
+        "--days",
+        "-d",
+        type=int,
+        default=1,
+        help="Number of forecast days to consider; 1 is today.",
+    )
+    rank.add_argument(
+        "--hours",
+        type=float,
+        default=None,
+        help="Only consider windows from now until this many hours ahead.",
+    )
+    rank.add_argument(
+        "--interval",
+        type=int,
+        default=3,
+        help="Length of a forecast window in hours.",
+    )
+    rank.add_argument(
+        "--concurrency",
+        "-j",
+        type=int,
+        default=32,
+        help="Maximum number of requests in flight across all spots.",
+    )
+    rank.add_argument(
+        "--max-age",
+        type=float,
+        default=24 * 7,
+        help="Hours after which the region's taxonomy is downloaded again.",
+    )
+
+    taxonomy = subparsers.add_parser(
+        "taxonomy", parents=[common], help="Manage the offline taxonomy snapshot."
+    )
+    taxonomy.add_argument(
+        "action",
+        choices=["sync", "refresh", "info"],
+        help="sync downloads the full tree, refresh re-fetches stale levels.",
+    )
+    taxonomy.add_argument(
+        "--depth",
+        type=int,
+        default=2,
+        help="Taxonomy levels requested per call during sync.",
+    )
+    taxonomy.add_argument(
+        "--max-age",
+        type=float,
+        default=24 * 7,
+        help="Hours after which a snapshot level is considered stale.",
+    )
+
+    serve = subparsers.add_parser(
+        "serve",
+        parents=[common],
+        help="Run a local daemon that keeps the client and caches warm.",
+    )
+    serve.add_argument(
+        "--socket",
+        default=None,
+        help="Unix socket to listen on (default: daemon.sock in the cache dir).",
+    )
+    serve.add_argument(
+        "--port",
+        type=int,
+        default=None,
+        help="Serve HTTP on 127.0.0.1:PORT instead of a Unix socket.",
+    )
+    serve.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Also keep favourite spots warm in the background.",
+    )
+
+    prefetch = subparsers.add_parser(
+        "prefetch", help="Keep the cache warm for a list of favourite spots."
+    )
+    prefetch.add_argument(
+        "--favourites",
+        default=None,
+        help="Spot ID list (default: favourites.txt in the config directory).",
+    )
+    prefetch.add_argument(
+        "--days",
+        "-d",
+        type=int,
+        default=3,
+        help="Number of days to prefetch; match the --days you run reports with.",
+    )
+    prefetch.add_argument(
+        "--interval",
+        type=float,
+        default=15,
+        help="Minutes between refreshes of each spot.",
+    )
+    prefetch.add_argument(
+        "--rate-limit",
+        type=float,
+        default=2.0,
+        help="Maximum requests per second sent while prefetching.",
+    )
+    mode = prefetch.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--once",
+        action="store_true",
+        help="Refresh every favourite once and exit, e.g. from cron.",
+    )
+    mode.add_argument(
+        "--status",
+        action="store_true",
+        help="Show when each favourite was last refreshed and its failures.",
+    )
+    prefetch.set_defaults(no_cache=False)
+    return parser
+
+
+def parse_arguments(argv=None):
+    """Parse command line arguments."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in COMMANDS:
+        return build_command_parser().parse_args(argv)
+    args = build_parser().parse_args(argv)
+    args.command = None
+    return args
+
+
+def read_spot_ids(lines):
+    """Return spot IDs from lines of text, skipping blanks and # comments."""
+    spot_ids = []
+    for line in lines:
+        spot_id = line.split("#", 1)[0].strip()
+        if spot_id:
+            spot_ids.append(spot_id)
+    return spot_ids
 
 
 def sort_regions(regions):
@@ -53,3 +350,50 @@ def convert_timestamp_to_datetime(timestamp, utc_offset):
     datetime_str = local_dt.strftime("%a %Y-%m-%d %H:%M:%S")
 
     return datetime_str
+
+
+def convert_timestamps_to_day_time(
+    timestamps: Iterable[float], utc_offsets: Iterable[float]
+) -> Tuple[List[str], List[str]]:
+    """
+    Converts a series of Unix timestamps to local date and time strings.
+
+    Batch counterpart of ``convert_timestamp_to_datetime`` that skips the
+    per-row ``datetime`` construction and formatting: each UTC offset is
+    turned into seconds once, and date and time strings are looked up in
+    shared tables.
+
+    Args:
+        timestamps (Iterable[float]): The Unix timestamps to convert.
+        utc_offsets (Iterable[float]): The UTC offset in hours for each timestamp.
+
+    Returns:
+        Tuple[List[str], List[str]]: Parallel lists of ``%Y-%m-%d`` dates and
+        ``%H:%M:%S`` times.
+    """
+    day_strings = _day_strings
+    time_strings = _time_strings
+    offset_seconds: Dict[float, int] = {}
+    days: List[str] = []
+    times: List[str] = []
+
+    for timestamp, utc_offset in zip(timestamps, utc_offsets):
+        shift = offset_seconds.get(utc_offset)
+        if shift is None:
+            shift = offset_seconds[utc_offset] = round(utc_offset * 3600)
+        day, seconds = divmod(int(timestamp) + shift, SECONDS_PER_DAY)
+
+        day_str = day_strings.get(day)
+        if day_str is None:
+            day_str = date.fromordinal(_EPOCH_ORDINAL + day).isoformat()
+            day_strings[day] = day_str
+        time_str = time_strings.get(seconds)
+        if time_str is None:
+            hours, remainder = divmod(seconds, 3600)
+            minutes, secs = divmod(remainder, 60)
+            time_str = time_strings[seconds] = f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+        days.append(day_str)
+        times.append(time_str)
+
+    return days, times
@@ -1,54 +1,117 @@
+import atexit
 import logging
+import os
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    import logging.handlers
 
 # Constants
-LOG_LEVEL = logging.DEBUG  # Default log level
+LOG_LEVEL = logging.WARNING  # Default log level
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 LOG_FILE = "surf_report.log"
 LOG_FILE_MODE = "a"
 LOG_TO_CONSOLE = False  # Change to `True` to enable console logging
 
+# Environment overrides
+ENV_LOG_LEVEL = "SURFREPORT_LOG_LEVEL"  # e.g. DEBUG, INFO, WARNING
+ENV_LOG_FILE = "SURFREPORT_LOG_FILE"  # path, or empty to disable file logging
+ENV_LOG_QUEUE = "SURFREPORT_LOG_QUEUE"  # "1" to write logs from a background thread
+
+_queue_listener: Optional["logging.handlers.QueueListener"] = None
+
+
+def _level_from_env(default: int) -> int:
+    name = os.environ.get(ENV_LOG_LEVEL, "").strip().upper()
+    if not name:
+        return default
+    level = logging.getLevelName(name)
+    return level if isinstance(level, int) else default
+
+
+def _stop_queue_listener() -> None:
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
 
 def setup_logger(
     name: str = "surf_report",
-    level: int = LOG_LEVEL,
+    level: Optional[int] = None,
     log_to_console: bool = LOG_TO_CONSOLE,
+    log_file: Optional[str] = None,
+    use_queue: Optional[bool] = None,
 ) -> logging.Logger:
     """
     Configures and returns a logger with optional console logging.
 
     Args:
         name (str): Name of the logger.
-        level (int): Logging level.
+        level (int, optional): Logging level. Defaults to SURFREPORT_LOG_LEVEL
+            or WARNING.
         log_to_console (bool): Whether to enable console logging.
+        log_file (str, optional): File to append logs to. Defaults to
+            SURFREPORT_LOG_FILE or ``surf_report.log``; an empty string
+            disables file logging.
+        use_queue (bool, optional): Hand records to a background thread via a
+            ``QueueHandler`` so logging never blocks on I/O. Defaults to
+            SURFREPORT_LOG_QUEUE.
 
     Returns:
         logging.Logger: Configured logger instance.
     """
+    global _queue_listener
+
+    if level is None:
+        level = _level_from_env(LOG_LEVEL)
+    if log_file is None:
+        log_file = os.environ.get(ENV_LOG_FILE, LOG_FILE)
+    if use_queue is None:
+        use_queue = os.environ.get(ENV_LOG_QUEUE, "").strip() in {"1", "true", "True"}
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
     # Prevent duplicate handlers
     if not logger.hasHandlers():
+        formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+        handlers: List[logging.Handler] = []
+
         # File handler (logs to file)
-        file_handler = logging.FileHandler(LOG_FILE, mode=LOG_FILE_MODE)
-        file_handler.setFormatter(
-            logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
-        )
-        file_handler.setLevel(level)
-        logger.addHandler(file_handler)
+        if log_file:
+            file_handler = logging.FileHandler(log_file, mode=LOG_FILE_MODE)
+            handlers.append(file_handler)
 
         # Optional: Console handler (logs to terminal)
         if log_to_console:
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(
-                logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+            handlers.append(logging.StreamHandler())
+
+        for handler in handlers:
+            handler.setFormatter(formatter)
+            handler.setLevel(level)
+
+        if use_queue and handlers:
+            # Imported here: logging.handlers drags in socket and pickle.
+            import queue
+            from logging.handlers import QueueHandler, QueueListener
+
+            _stop_queue_listener()
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            _queue_listener = QueueListener(
+                log_queue, *handlers, respect_handler_level=True
             )
-            console_handler.setLevel(level)
-            logger.addHandler(console_handler)
+            _queue_listener.start()
+            atexit.register(_stop_queue_listener)
+            handlers = [QueueHandler(log_queue)]
+
+        for handler in handlers:
+            logger.addHandler(handler)
 
     return logger
 
 
-# Create a global logger instance with configurable console logging
-logger = setup_logger(log_to_console=LOG_TO_CONSOLE)
+# Package-wide logger. Handlers are attached by setup_logger(), which the CLI
+# calls at startup, so importing the library never creates a log file.
+logger = logging.getLogger("surf_report")
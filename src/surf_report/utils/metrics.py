@@ -0,0 +1,263 @@
+"""
+Per-request timing and metrics instrumentation.
+
+``SurflineAPI`` fills in a ``RequestSample`` for every lookup it serves,
+whether from the cache or the network, and records it in a
+``RequestMetrics`` registry. The registry aggregates samples per endpoint
+into latency histograms and counters, which can be printed as a summary
+table or exported in the Prometheus text format.
+"""
+
+import bisect
+import math
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds of the latency histogram buckets, in seconds.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# Request phases timed for each sample, in the order they happen.
+PHASES = ("wait", "ttfb", "download", "parse", "total")
+
+METRIC_PREFIX = "surfreport"
+
+# Counters exported next to the latency histogram, with their help text.
+COUNTERS = {
+    "requests_total": "Surfline API responses, by HTTP status.",
+    "cache_lookups_total": "Lookups, by response cache outcome.",
+    "response_bytes_total": "Response body bytes received from the network.",
+    "request_retries_total": "Retries made by the HTTP transport.",
+}
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the style of a Prometheus histogram."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        # One count per bucket plus the +Inf overflow bucket, not cumulative.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """``(upper bound, observations at or below it)`` pairs, ending at +Inf."""
+        pairs = []
+        total = 0
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the ``q`` quantile by interpolating inside its bucket, as
+        Prometheus' ``histogram_quantile`` does. Never exceeds ``max``.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        lower = 0.0
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            if count and seen + count >= rank:
+                estimate = lower + (bound - lower) * (rank - seen) / count
+                return min(estimate, self.max)
+            seen += count
+            lower = bound
+        return self.max
+
+
+@dataclass
+class RequestSample:
+    """
+    What one lookup cost. Durations are in seconds and None when the phase
+    did not happen (a cache hit has no network phases).
+
+    Attributes:
+        endpoint (str): Metrics label of the endpoint.
+        cache (str): ``hit`` (served fresh from the cache), ``revalidated``
+            (a 304 renewed the cached copy), ``miss`` (fetched and stored)
+            or ``bypass`` (no cache involved).
+        status (int, optional): HTTP status; None if no response arrived.
+        bytes (int): Size of the response body received from the network.
+        retries (int): Retries made by the transport before the response.
+        wait (float, optional): Time held by the rate limiter.
+        ttfb (float, optional): Time until the response headers arrived.
+            Includes DNS resolution and connecting, which requests does not
+            report separately.
+        download (float, optional): Time reading the body.
+        parse (float, optional): Time decoding the JSON body.
+        total (float, optional): Time for the whole lookup.
+    """
+
+    endpoint: str
+    cache: str = "bypass"
+    status: Optional[int] = None
+    bytes: int = 0
+    retries: int = 0
+    wait: Optional[float] = None
+    ttfb: Optional[float] = None
+    download: Optional[float] = None
+    parse: Optional[float] = None
+    total: Optional[float] = None
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+
+class _EndpointStats:
+    __slots__ = ("histograms", "phases", "statuses", "cache", "bytes", "retries")
+
+    def __init__(self):
+        self.histograms = [Histogram() for _ in PHASES]
+        self.phases: Dict[str, Histogram] = dict(zip(PHASES, self.histograms))
+        self.statuses: Dict[str, int] = defaultdict(int)
+        self.cache: Dict[str, int] = defaultdict(int)
+        self.bytes = 0
+        self.retries = 0
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(bound)
+
+
+class RequestMetrics:
+    """Thread-safe aggregation of ``RequestSample`` records per endpoint."""
+
+    def __init__(self):
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of samples recorded."""
+        with self._lock:
+            return sum(s.phases["total"].count for s in self._endpoints.values())
+
+    def record(self, sample: RequestSample) -> None:
+        """Add ``sample``, closing its ``total`` timing if still open."""
+        if sample.total is None:
+            sample.total = time.perf_counter() - sample.started
+        # Same order as PHASES.
+        values = (sample.wait, sample.ttfb, sample.download, sample.parse, sample.total)
+        status = str(sample.status) if sample.status is not None else "error"
+        with self._lock:
+            stats = self._endpoints.get(sample.endpoint)
+            if stats is None:
+                stats = self._endpoints[sample.endpoint] = _EndpointStats()
+            for histogram, value in zip(stats.histograms, values):
+                if value is not None:
+                    histogram.observe(value)
+            if sample.cache != "hit":
+                stats.statuses[status] += 1
+            stats.cache[sample.cache] += 1
+            stats.bytes += sample.bytes
+            stats.retries += sample.retries
+
+    def summary(self) -> str:
+        """
+        Table of lookups per endpoint, slowest p95 first: counts, cache hits,
+        total latency percentiles and the mean of each network phase.
+        """
+        with self._lock:
+            rows = sorted(
+                self._endpoints.items(),
+                key=lambda item: item[1].phases["total"].quantile(0.95),
+                reverse=True,
+            )
+            lines = [
+                f"{'endpoint':<24}{'calls':>7}{'hits':>6}{'errors':>7}"
+                f"{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}"
+                f"{'ttfb':>8}{'dl':>8}{'parse':>8}{'KiB':>9}{'retries':>8}"
+            ]
+            for name, stats in rows:
+                total = stats.phases["total"]
+                errors = sum(
+                    count
+                    for status, count in stats.statuses.items()
+                    if not status.startswith(("2", "3"))
+                )
+                lines.append(
+                    f"{name:<24}{total.count:>7}{stats.cache.get('hit', 0):>6}"
+                    f"{errors:>7}"
+                    f"{total.quantile(0.5) * 1000:>9.1f}"
+                    f"{total.quantile(0.95) * 1000:>9.1f}"
+                    f"{total.max * 1000:>9.1f}"
+                    f"{stats.phases['ttfb'].mean * 1000:>8.1f}"
+                    f"{stats.phases['download'].mean * 1000:>8.1f}"
+                    f"{stats.phases['parse'].mean * 1000:>8.1f}"
+                    f"{stats.bytes / 1024:>9.1f}{stats.retries:>8}"
+                )
+        return "\n".join(lines)
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        name = f"{METRIC_PREFIX}_request_duration_seconds"
+        lines = [
+            f"# HELP {name} Time spent on Surfline API lookups, by phase.",
+            f"# TYPE {name} histogram",
+        ]
+        counters: Dict[str, List[str]] = {counter: [] for counter in COUNTERS}
+        with self._lock:
+            for endpoint, stats in sorted(self._endpoints.items()):
+                label = f'endpoint="{_label_value(endpoint)}"'
+                for phase, histogram in stats.phases.items():
+                    if not histogram.count:
+                        continue
+                    labels = f'{label},phase="{phase}"'
+                    for bound, count in histogram.cumulative():
+                        lines.append(
+                            f'{name}_bucket{{{labels},le="{_format_bound(bound)}"}} '
+                            f"{count}"
+                        )
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.sum!r}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+                for status, count in sorted(stats.statuses.items()):
+                    counters["requests_total"].append(
+                        f'{{{label},status="{status}"}} {count}'
+                    )
+                for result, count in sorted(stats.cache.items()):
+                    counters["cache_lookups_total"].append(
+                        f'{{{label},result="{result}"}} {count}'
+                    )
+                counters["response_bytes_total"].append(f"{{{label}}} {stats.bytes}")
+                counters["request_retries_total"].append(f"{{{label}}} {stats.retries}")
+
+        for counter, samples in counters.items():
+            metric = f"{METRIC_PREFIX}_{counter}"
+            lines.append(f"# HELP {metric} {COUNTERS[counter]}")
+            lines.append(f"# TYPE {metric} counter")
+            lines.extend(f"{metric}{sample}" for sample in samples)
+        return "\n".join(lines) + "\n"
@@ -2,8 +2,6 @@
 
 import os
 import sys
-from pydoc import pager as pydoc_pager
-
 
 ENV_DISABLE_PAGER = "SURFREPORT_NO_PAGER"
 
@@ -29,6 +27,9 @@ def page_output(text: str) -> None:
     """
     if not text:
         return
+    # pydoc pulls in inspect and friends; only pay for it when paging.
+    from pydoc import pager as pydoc_pager
+
     try:
         pydoc_pager(text)
     except OSError:
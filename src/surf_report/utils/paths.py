@@ -0,0 +1,58 @@
+"""Locations of per-user files written by surfreport."""
+
+import os
+from pathlib import Path
+
+APP_NAME = "surfreport"
+ENV_CACHE_DIR = "SURFREPORT_CACHE_DIR"
+ENV_CONFIG_DIR = "SURFREPORT_CONFIG_DIR"
+ENV_SOCKET = "SURFREPORT_SOCKET"
+SOCKET_FILENAME = "daemon.sock"
+
+
+def user_cache_dir() -> Path:
+    """
+    Return the directory used for cached data.
+
+    Precedence:
+        1. SURFREPORT_CACHE_DIR environment variable
+        2. $XDG_CACHE_HOME/surfreport
+        3. ~/.cache/surfreport
+    """
+    override = os.environ.get(ENV_CACHE_DIR)
+    if override:
+        return Path(override)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / APP_NAME
+
+
+def user_config_dir() -> Path:
+    """
+    Return the directory holding user-edited settings such as favourites.
+
+    Precedence:
+        1. SURFREPORT_CONFIG_DIR environment variable
+        2. $XDG_CONFIG_HOME/surfreport
+        3. ~/.config/surfreport
+    """
+    override = os.environ.get(ENV_CONFIG_DIR)
+    if override:
+        return Path(override)
+    xdg_config = os.environ.get("XDG_CONFIG_HOME")
+    base = Path(xdg_config) if xdg_config else Path.home() / ".config"
+    return base / APP_NAME
+
+
+def daemon_socket_path() -> Path:
+    """
+    Return the Unix socket the ``surfreport serve`` daemon listens on.
+
+    Precedence:
+        1. SURFREPORT_SOCKET environment variable
+        2. daemon.sock inside the user cache directory
+    """
+    override = os.environ.get(ENV_SOCKET)
+    if override:
+        return Path(override)
+    return user_cache_dir() / SOCKET_FILENAME
@@ -0,0 +1,186 @@
+"""
+HTTP transport policy: timeouts, connection pooling, retries, rate limits
+and coalescing of duplicate in-flight requests.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from surf_report.utils.logger import logger
+
+T = TypeVar("T")
+
+
+@dataclass
+class TransportPolicy:
+    """
+    Settings applied to every request made through a ``requests.Session``.
+
+    Attributes:
+        connect_timeout (float): Seconds to wait for a connection.
+        read_timeout (float): Seconds to wait between bytes of the response.
+        pool_maxsize (int): Connections kept open per host. Should be at least
+            the number of threads issuing requests concurrently.
+        max_retries (int): Retries on connection errors and retryable statuses.
+        backoff_factor (float): Base of the exponential backoff, in seconds.
+        backoff_max (float): Upper bound on a single backoff sleep.
+        backoff_jitter (float): Random extra delay added to each backoff.
+        retry_statuses (tuple): Status codes that trigger a retry. A
+            ``Retry-After`` header on these responses is honoured.
+        rate_limit (float, optional): Requests per second allowed per host.
+        rate_burst (int): Requests allowed back to back before limiting.
+    """
+
+    connect_timeout: float = 3.05
+    read_timeout: float = 15.0
+    pool_maxsize: int = 16
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    backoff_jitter: float = 0.25
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    rate_limit: Optional[float] = None
+    rate_burst: int = 5
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """The ``(connect, read)`` timeout tuple passed to requests."""
+        return (self.connect_timeout, self.read_timeout)
+
+    def build_retry(self) -> Retry:
+        """Build the urllib3 retry strategy for this policy."""
+        options: Dict[str, Any] = {
+            "total": self.max_retries,
+            "connect": self.max_retries,
+            "read": self.max_retries,
+            "status": self.max_retries,
+            "status_forcelist": self.retry_statuses,
+            "allowed_methods": frozenset({"GET", "HEAD"}),
+            "backoff_factor": self.backoff_factor,
+            "respect_retry_after_header": True,
+            "raise_on_status": False,
+        }
+        try:
+            return Retry(
+                **options,
+                backoff_max=self.backoff_max,
+                backoff_jitter=self.backoff_jitter,
+            )
+        except TypeError:  # urllib3 < 2 has no jitter or configurable cap
+            return Retry(**options)
+
+    def mount(self, session: requests.Session, pool_maxsize: Optional[int] = None):
+        """Install a pooled, retrying adapter for HTTP(S) on ``session``."""
+        pool_size = max(self.pool_maxsize, pool_maxsize or 0)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=self.build_retry(),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        logger.debug("Mounted HTTP adapter with pool size %d", pool_size)
+        return adapter
+
+
+class HostRateLimiter:
+    """Thread-safe token bucket limiting the request rate to each host."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate (float): Sustained requests per second per host.
+            burst (int): Bucket size, i.e. requests allowed back to back.
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to ``url``'s host is allowed.
+
+        Returns the number of seconds spent waiting.
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(host, (float(self.burst), now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            # Reserve a token now, possibly going negative, then sleep off the debt
+            # outside the lock so other hosts are not held up.
+            tokens -= 1
+            self._buckets[host] = (tokens, now)
+        delay = -tokens / self.rate if tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay + random.uniform(0, delay * 0.1))
+        return delay
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result (or exception).
+    Nothing is remembered once the call completes, so caching stays the job
+    of ``ResponseCache``.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        """Run ``func`` unless a call for ``key`` is in flight, then share it."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def waiting(self, key: str) -> int:
+        """Number of callers currently waiting on ``key``'s in-flight call."""
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call is not None else 0
@@ -5,13 +5,17 @@ Helpers for determining an up-to-date User-Agent string.
 from __future__ import annotations
 
 import html
+import json
 import os
 import re
+import threading
+import time
 from typing import Optional
 
 import requests
 
 from surf_report.utils.logger import logger
+from surf_report.utils.paths import user_cache_dir
 
 UA_SOURCE_URL = "https://www.useragents.me/"
 UA_FETCH_TIMEOUT = 5
@@ -24,8 +28,12 @@ DEFAULT_USER_AGENT = (
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 )
 ENV_USER_AGENT = "SURFREPORT_USER_AGENT"
+UA_CACHE_FILENAME = "user_agent.json"
+UA_CACHE_TTL = 7 * 24 * 60 * 60
 
 _cached_user_agent: Optional[str] = None
+_refresh_thread: Optional[threading.Thread] = None
+_refresh_lock = threading.Lock()
 
 
 def _fetch_latest_user_agent() -> Optional[str]:
@@ -49,14 +57,69 @@ def _fetch_latest_user_agent() -> Optional[str]:
     return re.sub(r"\s+", " ", candidate)
 
 
+def _read_user_agent_cache() -> Optional[tuple]:
+    """Return ``(user_agent, fetched_at)`` from the cache file, if readable."""
+    path = user_cache_dir() / UA_CACHE_FILENAME
+    try:
+        with path.open(encoding="utf-8") as file:
+            data = json.load(file)
+        return str(data["user_agent"]), float(data["fetched_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_user_agent_cache(user_agent: str) -> None:
+    path = user_cache_dir() / UA_CACHE_FILENAME
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as file:
+            json.dump({"user_agent": user_agent, "fetched_at": time.time()}, file)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.debug("Failed to write user agent cache: %s", exc)
+
+
+def refresh_user_agent() -> Optional[str]:
+    """
+    Fetch the latest user agent now and persist it to the cache file.
+
+    Returns the fetched value, or None if the fetch failed.
+    """
+    global _cached_user_agent
+
+    latest = _fetch_latest_user_agent()
+    if latest:
+        logger.debug("Fetched latest user agent from useragents.me.")
+        _cached_user_agent = latest
+        _write_user_agent_cache(latest)
+    return latest
+
+
+def refresh_user_agent_in_background() -> threading.Thread:
+    """Start (at most one) daemon thread running ``refresh_user_agent``."""
+    global _refresh_thread
+
+    with _refresh_lock:
+        if _refresh_thread is None or not _refresh_thread.is_alive():
+            _refresh_thread = threading.Thread(
+                target=refresh_user_agent, name="user-agent-refresh", daemon=True
+            )
+            _refresh_thread.start()
+        return _refresh_thread
+
+
 def get_user_agent() -> str:
     """
-    Return the preferred User-Agent string.
+    Return the preferred User-Agent string without waiting on the network.
 
     Precedence:
         1. SURFREPORT_USER_AGENT environment variable
-        2. Cached value fetched from useragents.me
+        2. Value cached in memory or in the user cache directory
         3. Hard-coded default fallback
+
+    When the cache file is missing or older than ``UA_CACHE_TTL``, a fresh
+    value is fetched from useragents.me in a background thread for later use.
     """
     global _cached_user_agent
 
@@ -68,15 +131,18 @@ def get_user_agent() -> str:
     if _cached_user_agent:
         return _cached_user_agent
 
-    latest = _fetch_latest_user_agent()
-    if latest:
-        logger.debug("Fetched latest user agent from useragents.me.")
-        _cached_user_agent = latest
-    else:
-        logger.debug("Falling back to default user agent.")
-        _cached_user_agent = DEFAULT_USER_AGENT
-
-    return _cached_user_agent
+    cached = _read_user_agent_cache()
+    if cached is not None:
+        user_agent, fetched_at = cached
+        _cached_user_agent = user_agent
+        if time.time() - fetched_at > UA_CACHE_TTL:
+            logger.debug("Cached user agent is stale; refreshing in background.")
+            refresh_user_agent_in_background()
+        return user_agent
+
+    logger.debug("No cached user agent; using default while refreshing.")
+    refresh_user_agent_in_background()
+    return DEFAULT_USER_AGENT
 
 
 def clear_cached_user_agent() -> None:
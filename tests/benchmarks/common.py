@@ -0,0 +1,135 @@
+"""Timing, result storage and comparison helpers shared by the benchmarks."""
+
+import json
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+RESULTS_VERSION = 1
+
+
+def measure(
+    func: Callable[[], object], number: int, repeat: int = 5
+) -> Dict[str, float]:
+    """
+    Time ``func`` called ``number`` times, ``repeat`` times over.
+
+    Returns per-call statistics in microseconds.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return {
+        "best_us": min(samples),
+        "median_us": statistics.median(samples),
+    }
+
+
+def print_comparison(title: str, results: Dict[str, Dict[str, float]]) -> None:
+    """Print timings for several variants, relative to the first one."""
+    print(title)
+    baseline = next(iter(results.values()))["best_us"]
+    for name, stats in results.items():
+        speedup = baseline / stats["best_us"] if stats["best_us"] else float("inf")
+        print(
+            f"  {name:<28} best {stats['best_us']:9.2f} us  "
+            f"median {stats['median_us']:9.2f} us  ({speedup:.2f}x)"
+        )
+
+
+def environment() -> Dict[str, object]:
+    """Describe the machine and interpreter results were measured on."""
+    try:
+        import orjson  # noqa: F401
+
+        fast_json = True
+    except ImportError:
+        fast_json = False
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "orjson": fast_json,
+    }
+
+
+def save_results(path: Path, results: Dict[str, Dict[str, float]]) -> None:
+    """Write ``results`` with a timestamp and the environment to ``path``."""
+    data = {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": environment(),
+        "results": results,
+    }
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def load_results(path: Path) -> dict:
+    """Read results written by ``save_results``."""
+    data = json.loads(path.read_text())
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path} has unsupported results version")
+    return data
+
+
+def compare_results(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[Tuple[str, Optional[float], Optional[float], str]]:
+    """
+    Compare the best time of every benchmark against the baseline, in the
+    order of the current run.
+
+    Returns:
+        List of ``(name, baseline us, current us, verdict)`` where the
+        verdict is ``regression`` or ``improved`` when the time changed by
+        more than ``threshold`` (a fraction), ``ok`` otherwise, and ``new``
+        or ``missing`` for benchmarks only in one of the runs.
+    """
+    rows = []
+    for name in list(current) + [name for name in baseline if name not in current]:
+        before = baseline.get(name, {}).get("best_us")
+        after = current.get(name, {}).get("best_us")
+        if before is None or after is None:
+            verdict = "new" if before is None else "missing"
+        elif after > before * (1 + threshold):
+            verdict = "regression"
+        elif after < before * (1 - threshold):
+            verdict = "improved"
+        else:
+            verdict = "ok"
+        rows.append((name, before, after, verdict))
+    return rows
+
+
+def print_diff(rows: List[Tuple[str, Optional[float], Optional[float], str]]) -> None:
+    """Print the rows of ``compare_results`` grouped by stage."""
+    stage = None
+    for name, before, after, verdict in rows:
+        if name.split("/", 1)[0] != stage:
+            stage = name.split("/", 1)[0]
+            print(stage)
+        change = ""
+        if before and after is not None:
+            change = f"{(after - before) / before:+8.1%}"
+        print(
+            f"  {name:<32} {_format_us(before):>12} -> {_format_us(after):>12} "
+            f"{change:>8}  {verdict}"
+        )
+
+
+def _format_us(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value >= 1000:
+        return f"{value / 1000:.2f} ms"
+    return f"{value:.2f} us"
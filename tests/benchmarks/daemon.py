@@ -0,0 +1,121 @@
+"""
+Cost of a repeated spot report lookup with and without the daemon.
+
+Without the daemon every CLI run builds a new ``SurflineAPI`` and reads the
+report's seven endpoints back from the on-disk cache. With it, the CLI makes
+one request over the Unix socket, which a warm daemon answers from memory.
+Both read a 3-day, 6-hourly report and no request reaches the network.
+Interpreter start-up and import costs are printed separately.
+
+Run with: python -m tests.benchmarks.daemon
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import cast
+
+import requests
+
+from surf_report.providers.surfline.daemon import build_server
+from surf_report.providers.surfline.daemon_client import connect
+from surf_report.providers.surfline.surfline import SurflineAPI
+from surf_report.providers.surfline.synthetic import make_report_data
+from surf_report.utils.cache import ResponseCache
+from tests.benchmarks.common import measure, print_comparison
+
+PAYLOADS = make_report_data(days=3, interval_hours=6)
+
+
+class StubResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, payload):
+        self._payload = payload
+        self.content = json.dumps(payload).encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class StubSession:
+    headers = {}
+
+    def get(self, url, params=None, **kwargs):
+        return StubResponse(PAYLOADS.get(url.rsplit("/", 1)[-1]) or {})
+
+    def close(self):
+        pass
+
+
+def stub_session() -> requests.Session:
+    return cast(requests.Session, StubSession())
+
+
+def import_time_ms(module: str) -> float:
+    """Wall time of a fresh interpreter importing ``module``, best of 3."""
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def run(number: int = 50):
+    directory = Path(tempfile.mkdtemp(prefix="sr-"))
+    cache_path = directory / "cache.sqlite3"
+    try:
+        warm = SurflineAPI(session=stub_session(), cache=ResponseCache(cache_path))
+        warm.get_spot_report("spot")  # fill the disk cache
+
+        def new_client():
+            cache = ResponseCache(cache_path)
+            api = SurflineAPI(session=stub_session(), cache=cache)
+            api.get_spot_report("spot")
+            api.close()
+            cache.close()
+
+        server = build_server(warm, socket_path=directory / "d.sock")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        client = connect(directory / "d.sock")
+        assert client is not None
+        report = client.get_spot_report("spot")
+        assert report is not None and report.report_data["wave"] == PAYLOADS["wave"]
+
+        results = {
+            "new client + disk cache": measure(new_client, number),
+            "daemon round trip": measure(lambda: client.get_spot_report("spot"), number),
+        }
+        client.close()
+        server.shutdown()
+        server.server_close()
+        return results
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    os.environ.setdefault("SURFREPORT_USER_AGENT", "benchmark")
+    print_comparison("Repeated 3-day spot report lookup", run())
+    print("Fresh interpreter importing the client it needs")
+    for module in (
+        "surf_report.providers.surfline.surfline",
+        "surf_report.providers.surfline.daemon_client",
+    ):
+        print(f"  {module:<46} {import_time_ms(module):7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
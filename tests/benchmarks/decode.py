@@ -0,0 +1,77 @@
+"""
+Decoding cost of the KBYG bodies of one 16-day hourly report.
+
+Compares the full decode the client used to do (``json.loads`` on every
+body) with selective decoding, which keeps only the fields the report
+sections read. Each variant is timed, and ``tracemalloc`` records the
+peak and retained memory of decoding all the bodies of one report.
+
+Run with: python -m tests.benchmarks.decode
+"""
+
+import gc
+import json
+import tracemalloc
+
+from surf_report.providers.surfline import decoding
+from surf_report.providers.surfline.decoding import decode_json, projection_for
+from surf_report.providers.surfline.synthetic import make_report_data
+from tests.benchmarks.common import measure, print_comparison
+
+
+def memory_usage(decode):
+    """Return ``(peak, retained)`` bytes for one call of ``decode``."""
+    gc.collect()
+    tracemalloc.start()
+    result = decode()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak, retained
+
+
+def run(number: int = 10):
+    bodies = {
+        endpoint: json.dumps(payload).encode("utf-8")
+        for endpoint, payload in make_report_data(days=16, interval_hours=1).items()
+    }
+    projections = {endpoint: projection_for(endpoint) for endpoint in bodies}
+
+    def full():
+        return [json.loads(body) for body in bodies.values()]
+
+    def selective():
+        return [decode_json(body, projections[name]) for name, body in bodies.items()]
+
+    def selective_stdlib():
+        orjson, decoding.orjson = decoding.orjson, None
+        try:
+            return selective()
+        finally:
+            decoding.orjson = orjson
+
+    variants = {"json.loads (full)": full}
+    if decoding.orjson is not None:
+        variants["selective (orjson)"] = selective
+    variants["selective (json)"] = selective_stdlib
+
+    size = sum(len(body) for body in bodies.values())
+    timings = {name: measure(func, number) for name, func in variants.items()}
+    memory = {name: memory_usage(func) for name, func in variants.items()}
+    return size, timings, memory
+
+
+def main():
+    size, timings, memory = run()
+    print_comparison(f"Decode time ({size / 1024:.0f} KiB of JSON)", timings)
+    print("Memory")
+    for name, (peak, retained) in memory.items():
+        print(
+            f"  {name:<28} peak {peak / 1024:8.1f} KiB  "
+            f"retained {retained / 1024:8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Grouping cost of a 16-day hourly spot report.
+
+Compares converting every timestamp in the report one row at a time with
+``convert_timestamp_to_datetime`` (what ``group_spot_report`` used to do)
+against the batch ``convert_timestamps_to_day_time`` path, and times the
+full ``group_spot_report`` call.
+
+Run with: python -m tests.benchmarks.group_report
+"""
+
+from surf_report.providers.surfline.processing import group_spot_report
+from surf_report.providers.surfline.synthetic import make_report_data
+from surf_report.utils.helpers import (
+    convert_timestamp_to_datetime,
+    convert_timestamps_to_day_time,
+)
+from tests.benchmarks.common import measure, print_comparison
+
+
+def report_timestamps(report_data):
+    """Every (timestamp, utc_offset) pair ``group_spot_report`` converts."""
+    pairs = []
+    for endpoint in ("wave", "weather", "tides", "wind"):
+        for row in report_data[endpoint]["data"][endpoint]:
+            pairs.append((row["timestamp"], row["utcOffset"]))
+    for row in report_data["sunlight"]["data"]["sunlight"]:
+        for event in ("sunrise", "dawn", "sunrise", "sunset", "dusk"):
+            pairs.append((row[event], row[f"{event}UTCOffset"]))
+    return pairs
+
+
+def legacy_convert(pairs):
+    results = []
+    for timestamp, utc_offset in pairs:
+        parts = convert_timestamp_to_datetime(timestamp, utc_offset).split()
+        results.append((parts[1], parts[2]))
+    return results
+
+
+def batch_convert(pairs):
+    timestamps, offsets = zip(*pairs)
+    return convert_timestamps_to_day_time(timestamps, offsets)
+
+
+def run(number: int = 20):
+    report_data = make_report_data(days=16, interval_hours=1)
+    pairs = report_timestamps(report_data)
+    return len(pairs), {
+        "per-row conversion": measure(lambda: legacy_convert(pairs), number),
+        "batch conversion": measure(lambda: batch_convert(pairs), number),
+        "group_spot_report": measure(lambda: group_spot_report(report_data), number),
+    }
+
+
+def main():
+    count, results = run()
+    print_comparison(f"16-day hourly report ({count} timestamps)", results)
+
+
+if __name__ == "__main__":
+    main()
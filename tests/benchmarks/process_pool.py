@@ -0,0 +1,88 @@
+"""
+Scaling of batch rendering across worker processes.
+
+Renders the same batch of 16-day hourly columnar reports as text, once in
+this process as ``surfreport batch`` does by default and then with
+``render_reports`` on 1, 2, 4, ... worker processes, up to the CPU count.
+Fetching is not included. Each worker count is timed once, including
+worker start-up, so the speedup is what a batch run would see.
+
+Also prints the size of one report in the forms it could be sent to a
+worker: the pickled JSON payloads, the pickled ``TimeSeries`` and the
+``pack_report`` wire format. Packing is the only per-report work left in
+the parent, so its cost against the in-process time per report bounds
+how many workers can be kept busy.
+
+Run with: python -m tests.benchmarks.process_pool [spots]
+"""
+
+import io
+import os
+import pickle
+import sys
+import time
+
+from surf_report.main import write_text_reports
+from surf_report.providers.surfline.models import SpotReport
+from surf_report.providers.surfline.parallel import pack_report, render_reports
+from surf_report.providers.surfline.synthetic import make_report_data
+
+SPOTS = 256
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def worker_counts():
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    return counts
+
+
+def run(spots: int = SPOTS):
+    payload = make_report_data(16, 1)
+    reports = [SpotReport(f"spot-{i}", 16, payload).to_columnar() for i in range(spots)]
+
+    report = SpotReport("spot", 16, payload)
+    print("One 16-day hourly report sent to a worker")
+    print(f"  pickled JSON payloads    {len(pickle.dumps(payload)) / 1024:8.1f} KiB")
+    series = pickle.dumps(report.to_columnar().series)
+    print(f"  pickled TimeSeries       {len(series) / 1024:8.1f} KiB")
+    columnar = report.to_columnar()
+    packed = pack_report(columnar)
+    pack_ms = timed(lambda: [pack_report(columnar) for _ in range(100)]) * 10
+    print(
+        f"  pack_report              {len(packed) / 1024:8.1f} KiB  "
+        f"({pack_ms:.2f} ms in the parent)"
+    )
+
+    expected = io.StringIO()
+    baseline = timed(lambda: write_text_reports(reports, expected))
+    print(f"\nRendering {spots} reports as text on {os.cpu_count()} CPUs")
+    print(f"  {'in process':<14} {baseline:7.2f} s")
+    for workers in worker_counts():
+        chunks = []
+        elapsed = timed(
+            lambda chunks=chunks, workers=workers: chunks.extend(
+                render_reports(iter(reports), workers=workers)
+            )
+        )
+        assert "".join(chunks) == expected.getvalue()
+        speedup = baseline / elapsed
+        print(
+            f"  {f'{workers} workers':<14} {elapsed:7.2f} s  {speedup:5.2f}x  "
+            f"({speedup / workers:.0%} per worker)"
+        )
+
+
+def main():
+    os.environ.setdefault("SURFREPORT_USER_AGENT", "benchmark")
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SPOTS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Cost of ranking every spot in a region.
+
+Times the three parts of ``surfreport rank`` separately:
+
+- scoring: ``best_window`` on columnar reports of one day in 3-hour
+  windows, as the command fetches them, and of 16 hourly days;
+- selection: keeping the top 10 of many rankings with ``top_rankings``
+  against sorting them all;
+- end to end: ``region_spots`` and ``rank_spots`` for the 256 spots of the
+  synthetic taxonomy, served by the local Surfline stand-in with injected
+  latency, at several concurrency levels.
+
+Run with: python -m tests.benchmarks.rank [latency_ms]
+"""
+
+import os
+import random
+import sys
+import time
+from functools import partial
+
+from surf_report.providers.surfline.fake_server import FakeSurflineServer, RouteFaults
+from surf_report.providers.surfline.models import SpotReport
+from surf_report.providers.surfline.ranking import (
+    RANK_SECTIONS,
+    SpotRanking,
+    best_window,
+    rank_spots,
+    region_spots,
+    top_rankings,
+)
+from surf_report.providers.surfline.surfline import SurflineAPI
+from surf_report.providers.surfline.synthetic import make_report_data
+from surf_report.providers.surfline.taxonomy import ROOT_TAXONOMY_ID, TaxonomyIndex
+from surf_report.utils.transport import TransportPolicy
+from tests.benchmarks.common import measure, print_comparison
+
+LATENCY = 0.05
+CONCURRENCY = (8, 16, 32, 64)
+RANKINGS = 5000
+TOP = 10
+
+
+def bench_scoring():
+    print("Scoring one report with best_window")
+    for days, interval in ((1, 3), (16, 1)):
+        report = SpotReport("spot", days, make_report_data(days, interval))
+        columnar = report.to_columnar(RANK_SECTIONS)
+        stats = measure(partial(best_window, columnar), 200)
+        print(
+            f"  {f'{days} days, {interval}-hourly':<28} best {stats['best_us']:9.2f} us  "
+            f"median {stats['median_us']:9.2f} us"
+        )
+
+
+def bench_selection():
+    generator = random.Random(0)
+    rankings = [
+        SpotRanking(f"spot-{i}", "", generator.uniform(0, 10), 0, 0)
+        for i in range(RANKINGS)
+    ]
+
+    def full_sort():
+        return sorted(rankings, key=lambda r: (r.score, r.spot_id), reverse=True)[:TOP]
+
+    assert [r.spot_id for r in full_sort()] == [
+        r.spot_id for r in top_rankings(rankings, TOP)
+    ]
+    print_comparison(
+        f"\nTop {TOP} of {RANKINGS} rankings",
+        {
+            "sort everything": measure(full_sort, 20),
+            "top_rankings (heap)": measure(lambda: top_rankings(rankings, TOP), 20),
+        },
+    )
+
+
+def bench_region(latency: float):
+    print(f"\nRanking the whole synthetic region, {latency * 1000:.0f} ms per request")
+    with FakeSurflineServer(faults={"*": RouteFaults(latency=latency)}) as fake:
+        api = SurflineAPI(base_url=fake.base_url)
+        start = time.perf_counter()
+        spots = region_spots(api, TaxonomyIndex(), ROOT_TAXONOMY_ID)
+        elapsed = time.perf_counter() - start
+        print(f"  {'taxonomy sync':<16} {elapsed:6.2f} s  ({len(spots)} spots)")
+        api.close()
+
+        for level in CONCURRENCY:
+            api = SurflineAPI(
+                base_url=fake.base_url, transport=TransportPolicy(pool_maxsize=level)
+            )
+            start = time.perf_counter()
+            top = rank_spots(api, spots, top=TOP, max_concurrency=level)
+            elapsed = time.perf_counter() - start
+            assert len(top) == TOP
+            print(
+                f"  {f'concurrency={level}':<16} {elapsed:6.2f} s  "
+                f"({len(spots) / elapsed:6.1f} spots/s)"
+            )
+            api.close()
+
+
+def main():
+    os.environ.setdefault("SURFREPORT_USER_AGENT", "benchmark")
+    latency = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else LATENCY
+    bench_scoring()
+    bench_selection()
+    bench_region(latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Rendering cost of combined reports for a batch of spots.
+
+Compares the previous renderer, which issued one ``print`` per line into a
+``StringIO`` and rebuilt the section map for every day, with the compiled
+layout that joins each day's lines into a list of chunks. Both render the
+same grouped 16-day hourly reports with every section.
+
+Run with: python -m tests.benchmarks.render
+"""
+
+import io
+
+from surf_report.providers.surfline.models import SpotReport
+from surf_report.providers.surfline.processing import group_report
+from surf_report.providers.surfline.synthetic import make_report_data
+from surf_report.providers.surfline.ui import render_grouped_data
+from tests.benchmarks.common import measure, print_comparison
+
+SPOTS = 20
+
+
+def legacy_render(grouped_data, output):
+    """The per-line renderer as it was before the compiled layout."""
+
+    def display_surf(surf_list, output):
+        if surf_list:
+            print("Surf:", file=output)
+            for surf in surf_list[1:]:
+                print(
+                    f"  [{surf.get('time')}] Min: {surf.get('min')} FT, Max: {surf.get('max')} FT, Condition: {surf.get('humanRelation')}",
+                    file=output,
+                )
+
+    def display_wind(wind_list, output):
+        if wind_list:
+            print("Wind:", file=output)
+            for wind in wind_list[1:]:
+                print(
+                    f"  [{wind.get('time')}] Speed: {wind.get('speed')} KTS, Direction: {wind.get('direction')}° {wind.get('directionType')}",
+                    file=output,
+                )
+
+    def display_weather(weather_list, output):
+        if weather_list:
+            print("Weather:", file=output)
+            for weather in weather_list[1:]:
+                print(
+                    f"  [{weather.get('time')}] Temperature: {weather.get('temperature')}°F, Condition: {weather.get('condition')}",
+                    file=output,
+                )
+
+    def display_tides(tides_list, output):
+        if tides_list:
+            print("Tides:", file=output)
+            for tide in tides_list:
+                print(
+                    f"  [{tide.get('time')}] Height: {tide.get('height')} FT, Type: {tide.get('type')}",
+                    file=output,
+                )
+
+    def display_swells(swells_list, output):
+        if swells_list:
+            print("Swells:", file=output)
+            for swell in swells_list:
+                if swell.get("time") == "00:00:00":
+                    continue
+                print(
+                    f"  [{swell.get('time')}] Height: {swell.get('height')} FT, Direction: {swell.get('direction')}°, Power: {swell.get('power')}",
+                    file=output,
+                )
+
+    def display_sunlight(sunlight_list, output):
+        if sunlight_list:
+            print("Sunlight:", file=output)
+            for sunlight in sunlight_list:
+                print(
+                    f"  Dawn: {sunlight.get('dawn')}, Sunrise: {sunlight.get('sunrise')}, Sunset: {sunlight.get('sunset')}, Dusk: {sunlight.get('dusk')}",
+                    file=output,
+                )
+
+    for day in sorted(grouped_data.keys()):
+        sections = ["surf", "swells", "weather", "tides", "wind", "sunlight"]
+        section_functions = {
+            "surf": display_surf,
+            "wind": display_wind,
+            "weather": display_weather,
+            "tides": display_tides,
+            "swells": display_swells,
+            "sunlight": display_sunlight,
+        }
+        data = grouped_data[day]
+        print(f"\n{day}", file=output)
+        print("-" * 30, file=output)
+        for section in sections:
+            if section in section_functions and data.get(section):
+                section_functions[section]({day: data}[day][section], output=output)
+
+
+def run(number: int = 3):
+    report = SpotReport(
+        spot_id="spot", days=16, report_data=make_report_data(16, 1)
+    ).to_columnar()
+    grouped = [group_report(report) for _ in range(SPOTS)]
+
+    def legacy():
+        buffer = io.StringIO()
+        for grouped_data in grouped:
+            legacy_render(grouped_data, buffer)
+        return buffer.getvalue()
+
+    def compiled():
+        return "".join(render_grouped_data(grouped_data) for grouped_data in grouped)
+
+    assert legacy() == compiled()
+    return {
+        "print per line": measure(legacy, number),
+        "compiled layout": measure(compiled, number),
+    }
+
+
+def main():
+    print_comparison(f"Render {SPOTS} 16-day hourly reports", run())
+
+
+if __name__ == "__main__":
+    main()
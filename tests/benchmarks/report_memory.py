@@ -0,0 +1,63 @@
+"""
+Memory held by one 16-day hourly spot report, raw JSON versus columnar.
+
+Decodes a synthetic payload with ``json.loads`` and measures, with
+``tracemalloc``, how much memory the decoded report keeps alive, then how
+much the ``TimeSeries`` sections keep once the raw payload is dropped.
+Also times grouping each representation by day.
+
+Run with: python -m tests.benchmarks.report_memory
+"""
+
+import gc
+import json
+import tracemalloc
+
+from surf_report.providers.surfline.models import SpotReport
+from surf_report.providers.surfline.processing import group_report
+from surf_report.providers.surfline.synthetic import make_report_data
+from tests.benchmarks.common import measure, print_comparison
+
+
+def retained_bytes(build):
+    """Bytes still allocated after ``build()`` returns, and its result."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def run(number: int = 20):
+    body = json.dumps(make_report_data(days=16, interval_hours=1))
+
+    raw_bytes, raw_report = retained_bytes(
+        lambda: SpotReport(spot_id="spot", days=16, report_data=json.loads(body))
+    )
+    columnar_bytes, columnar_report = retained_bytes(
+        lambda: SpotReport(
+            spot_id="spot", days=16, report_data=json.loads(body)
+        ).to_columnar()
+    )
+    timings = {
+        "group raw report": measure(lambda: group_report(raw_report), number),
+        "group columnar report": measure(lambda: group_report(columnar_report), number),
+    }
+    return raw_bytes, columnar_bytes, timings
+
+
+def main():
+    raw_bytes, columnar_bytes, timings = run()
+    print("Memory retained per 16-day hourly report")
+    print(f"  raw JSON dicts     {raw_bytes / 1024:9.1f} KiB")
+    print(
+        f"  columnar series    {columnar_bytes / 1024:9.1f} KiB  "
+        f"({raw_bytes / columnar_bytes:.1f}x smaller)"
+    )
+    print_comparison("Grouping by day", timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Per-request overhead of ``SurflineAPI._get`` with the network stubbed out.
+
+Compares the original request path (a second prepared ``requests.Request``
+for logging plus eager f-string messages) with the current one, with the
+logger at its default WARNING level.
+
+Run with: python -m tests.benchmarks.request_overhead
+"""
+
+import logging
+from typing import cast
+
+import requests
+
+from surf_report.providers.surfline.surfline import Endpoints, SurflineAPI
+from surf_report.utils.logger import logger
+from tests.benchmarks.common import measure, print_comparison
+
+PARAMS = {"spotId": "5842041f4e65fad6a7708814", "days": 3, "intervalHours": 6}
+PAYLOAD = {"data": {"wave": []}}
+
+
+class StubResponse:
+    status_code = 200
+    headers = {}
+    content = b'{"data": {"wave": []}}'
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return PAYLOAD
+
+
+class StubSession:
+    headers = {}
+
+    def get(self, url, params=None, **kwargs):
+        return StubResponse()
+
+
+def legacy_get(session, url, params):
+    """The request path as it was before lazy logging."""
+    try:
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        logger.debug(f"Requesting {full_url}")
+        response = session.get(url, params=params)
+        response.raise_for_status()
+        logger.info(f"Successful API response from {url}")
+        return response.json()
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Error fetching from {url} with params {params}: {e}")
+        return None
+
+
+def run(number: int = 5000):
+    logger.setLevel(logging.WARNING)
+    session = StubSession()
+    api = SurflineAPI(session=cast(requests.Session, session))
+    url = Endpoints.KBYG_BASE.value + "/wave"
+    return {
+        "legacy _get": measure(lambda: legacy_get(session, url, PARAMS), number),
+        "SurflineAPI._get": measure(lambda: api._get(url, PARAMS), number),
+    }
+
+
+def main():
+    print_comparison("Per-request overhead (network stubbed)", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+End-to-end benchmark suite with regression tracking.
+
+Times each stage of producing a report, on synthetic payloads and against
+the local Surfline stand-in (``fake_server``), so no request reaches the
+network:
+
+- ``fetch``: ``SurflineAPI.get_spot_report`` and ``get_spot_forecast``
+  over HTTP to the stand-in, uncached and from a warm response cache.
+- ``group``: ``group_spot_report`` on 1, 5 and 16-day hourly payloads.
+- ``render``: ``display_combined_spot_report`` of grouped reports of the
+  same sizes, with every section.
+- ``batch``: ``get_spot_reports`` for a batch of spots at several
+  concurrency levels, with latency injected by the stand-in. Throughput is
+  printed in spots per second.
+
+Results can be saved as JSON and compared with a saved baseline. Every
+benchmark whose best time moved by more than ``--threshold`` is listed as
+a regression or an improvement, and the exit status is 1 if any regressed.
+Only compare results measured on the same machine.
+
+Run with:
+    python -m tests.benchmarks.suite --output baseline.json
+    python -m tests.benchmarks.suite --baseline baseline.json
+"""
+
+import argparse
+import io
+import os
+import shutil
+import sys
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterable
+
+from surf_report.providers.surfline.fake_server import FakeSurflineServer, RouteFaults
+from surf_report.providers.surfline.models import SpotForecast, SpotReport
+from surf_report.providers.surfline.processing import group_spot_report
+from surf_report.providers.surfline.surfline import SurflineAPI
+from surf_report.providers.surfline.synthetic import make_conditions, make_report_data
+from surf_report.providers.surfline.ui import display_combined_spot_report
+from surf_report.utils.cache import ResponseCache
+from surf_report.utils.transport import TransportPolicy
+from tests.benchmarks.common import (
+    compare_results,
+    load_results,
+    measure,
+    print_diff,
+    save_results,
+)
+
+Results = Dict[str, Dict[str, float]]
+
+DAYS = (1, 5, 16)
+CONCURRENCY = (1, 4, 16)
+BATCH_SPOTS = 48
+BATCH_LATENCY = 0.02
+
+
+def bench_fetch(fake: FakeSurflineServer, number: int) -> Results:
+    directory = Path(tempfile.mkdtemp(prefix="sr-"))
+    api = SurflineAPI(base_url=fake.base_url)
+    cached = SurflineAPI(
+        base_url=fake.base_url, cache=ResponseCache(directory / "cache.sqlite3")
+    )
+    try:
+        cached.get_spot_report("spot", days=3)
+        cached.get_spot_forecast("spot", days=3)
+        return {
+            "fetch/report": measure(lambda: api.get_spot_report("spot", 3), number),
+            "fetch/forecast": measure(lambda: api.get_spot_forecast("spot", 3), number),
+            "fetch/report-cached": measure(
+                lambda: cached.get_spot_report("spot", 3), number
+            ),
+        }
+    finally:
+        api.close()
+        cached.close()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_group(days: Iterable[int], number: int) -> Results:
+    results = {}
+    for n in days:
+        report_data = make_report_data(n, 1)
+        results[f"group/{n}d"] = measure(
+            partial(group_spot_report, report_data), number
+        )
+    return results
+
+
+def bench_render(days: Iterable[int], number: int) -> Results:
+    results = {}
+    for n in days:
+        forecast = SpotForecast("spot", n, make_conditions(n))
+        report = SpotReport("spot", n, make_report_data(n, 1))
+
+        def render(forecast=forecast, report=report):
+            display_combined_spot_report(forecast, report, output=io.StringIO())
+
+        results[f"render/{n}d"] = measure(render, number)
+    return results
+
+
+def bench_batch(
+    fake: FakeSurflineServer, levels: Iterable[int], spots: int, repeat: int
+) -> Results:
+    fake.set_faults(latency=BATCH_LATENCY)
+    spot_ids = [f"spot-{i}" for i in range(spots)]
+    results = {}
+    try:
+        for level in levels:
+            api = SurflineAPI(
+                base_url=fake.base_url, transport=TransportPolicy(pool_maxsize=level)
+            )
+
+            def batch(api=api, level=level):
+                for _ in api.get_spot_reports(
+                    spot_ids, max_concurrency=level, columnar=True
+                ):
+                    pass
+
+            results[f"batch/concurrency={level}"] = measure(batch, 1, repeat)
+            api.close()
+    finally:
+        fake.set_faults(latency=0.0)
+    return results
+
+
+def run(quick: bool = False) -> Results:
+    number = 3 if quick else 20
+    repeat = 3 if quick else 5
+    days = DAYS[:2] if quick else DAYS
+    spots = BATCH_SPOTS // 4 if quick else BATCH_SPOTS
+
+    stages: Dict[str, Callable[[FakeSurflineServer], Results]] = {
+        "fetch": lambda fake: bench_fetch(fake, number),
+        "group": lambda fake: bench_group(days, number),
+        "render": lambda fake: bench_render(days, number),
+        "batch": lambda fake: bench_batch(fake, CONCURRENCY, spots, repeat),
+    }
+    results: Results = {}
+    with FakeSurflineServer(faults={"*": RouteFaults()}, seed=0) as fake:
+        for stage, bench in stages.items():
+            print(f"Running {stage}...", file=sys.stderr)
+            results.update(bench(fake))
+    for name, stats in results.items():
+        if name.startswith("batch/"):
+            stats["spots_per_s"] = spots / (stats["best_us"] / 1e6)
+    return results
+
+
+def print_results(results: Results) -> None:
+    for name, stats in results.items():
+        line = (
+            f"  {name:<32} best {stats['best_us']:12.1f} us  "
+            f"median {stats['median_us']:12.1f} us"
+        )
+        if "spots_per_s" in stats:
+            line += f"  {stats['spots_per_s']:8.1f} spots/s"
+        print(line)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the end-to-end benchmarks.")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare with these results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="relative change reported as a regression (default: 0.15)",
+    )
+    parser.add_argument("--quick", action="store_true", help="fewer, smaller runs")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SURFREPORT_USER_AGENT", "benchmark")
+    results = run(args.quick)
+    print("End-to-end benchmarks")
+    print_results(results)
+    if args.output:
+        save_results(args.output, results)
+        print(f"Results written to {args.output}")
+    if args.baseline:
+        baseline = load_results(args.baseline)
+        print(f"\nCompared with {args.baseline} ({baseline['created']})")
+        rows = compare_results(baseline["results"], results, args.threshold)
+        print_diff(rows)
+        if any(verdict == "regression" for *_, verdict in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
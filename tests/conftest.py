@@ -41,10 +41,18 @@ def make_args() -> Callable[..., SimpleNamespace]:
 
     def _factory(**overrides: Any) -> SimpleNamespace:
         defaults = {
+            "command": None,
             "search": False,
             "search_string": None,
             "days": 3,
+            "sections": None,
             "verbose": False,
+            "no_cache": False,
+            "clear_cache": False,
+            "stats": False,
+            "metrics_file": None,
+            "workers": 0,
+            "chunk_size": 16,
         }
         defaults.update(overrides)
         return SimpleNamespace(**defaults)
@@ -52,6 +60,14 @@ def make_args() -> Callable[..., SimpleNamespace]:
     return _factory
 
 
+@pytest.fixture(autouse=True)
+def isolate_cache_dir(monkeypatch, tmp_path):
+    """Keep files written during tests out of the user's cache and config dirs."""
+    monkeypatch.setenv("SURFREPORT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SURFREPORT_CONFIG_DIR", str(tmp_path / "config"))
+    monkeypatch.setenv("SURFREPORT_LOG_FILE", "")
+
+
 @pytest.fixture(autouse=True)
 def set_default_user_agent(monkeypatch):
     """
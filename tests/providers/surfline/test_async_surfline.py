@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from surf_report.providers.surfline.async_surfline import (  # noqa: E402
+    AsyncSurflineAPI,
+)
+
+
+def make_api(handler, **kwargs):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncSurflineAPI(client=client, **kwargs)
+
+
+def test_search_surfline_returns_structured_results(load_json_fixture):
+    payload = load_json_fixture("surfline/search_success.json")
+
+    def handler(request):
+        assert request.url.params["q"] == "mavs"
+        assert request.headers["User-Agent"] == "TestAgent/0.1"
+        return httpx.Response(200, json=payload)
+
+    async def run():
+        async with make_api(handler) as api:
+            return await api.search_surfline("mavs")
+
+    results = asyncio.run(run())
+
+    assert [result.name for result in results] == ["Mavericks", "Pleasure Point"]
+
+
+def test_get_region_list_handles_http_error():
+    async def run():
+        async with make_api(lambda request: httpx.Response(500)) as api:
+            return await api.get_region_list("root-id")
+
+    assert asyncio.run(run()) == []
+
+
+def test_get_spot_report_collects_each_endpoint(load_json_fixture):
+    endpoint_payloads = load_json_fixture("surfline/spot_report_endpoints.json")
+
+    def handler(request):
+        slug = request.url.path.rsplit("/", 1)[-1]
+        if slug == "wind":
+            return httpx.Response(503)
+        return httpx.Response(200, json=endpoint_payloads[slug])
+
+    async def run():
+        async with make_api(handler) as api:
+            return await api.get_spot_report("spot-99", days=4)
+
+    report = asyncio.run(run())
+
+    assert report is not None
+    assert report.spot_id == "spot-99"
+    assert report.report_data["wind"] is None
+    assert report.report_data["wave"]["data"]["wave"][0]["surf"]["min"] == 2
+
+
+def test_requests_are_bounded_by_max_concurrency(load_json_fixture):
+    payload = load_json_fixture("surfline/spot_forecast.json")
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=payload)
+
+    async def run():
+        async with make_api(handler, max_concurrency=3) as api:
+            return await asyncio.gather(
+                *(api.get_spot_forecast(f"spot-{i}") for i in range(12))
+            )
+
+    forecasts = asyncio.run(run())
+
+    assert all(forecast is not None for forecast in forecasts)
+    assert peak == 3
+
+
+def test_reports_from_local_stand_in_server():
+    from surf_report.providers.surfline.fake_server import FakeSurflineServer
+
+    async def run(base_url):
+        async with AsyncSurflineAPI(base_url=base_url) as api:
+            return await asyncio.gather(
+                api.get_spot_report("a", days=1), api.get_spot_report("b", days=1)
+            )
+
+    with FakeSurflineServer() as fake:
+        reports = asyncio.run(run(fake.base_url))
+        assert fake.route_count("wave") == 2
+
+    assert [report.spot_id for report in reports if report] == ["a", "b"]
+    assert all(report and report.report_data["wind"] for report in reports)
@@ -0,0 +1,163 @@
+import shutil
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from surf_report.providers.surfline.daemon import build_server
+from surf_report.providers.surfline.daemon_client import connect
+from surf_report.providers.surfline.models import (
+    Region,
+    SpotForecast,
+    SpotReport,
+    SurflineSearchResult,
+)
+from surf_report.utils.metrics import RequestMetrics, RequestSample
+
+
+class FakeAPI:
+    """Records lookups and answers them like ``SurflineAPI``."""
+
+    def __init__(self, report_data):
+        self.report_data = report_data
+        self.calls = []
+        # Answer like SurflineAPI does when its requests fail.
+        self.failing = False
+        self.metrics = RequestMetrics()
+
+    def search_surfline(self, query):
+        self.calls.append(("search", query))
+        if self.failing:
+            return []
+        return [SurflineSearchResult("spot-1", "Mavericks", ["USA", "Mavs"], "spot")]
+
+    def get_region_list(self, taxonomy_id, max_depth=0):
+        self.calls.append(("regions", taxonomy_id))
+        if self.failing:
+            return []
+        return [Region("r-1", "California", "geoname")]
+
+    def get_taxonomy(self, taxonomy_id, max_depth=0):
+        self.calls.append(("taxonomy", taxonomy_id))
+        return {"_id": taxonomy_id, "contains": []}
+
+    def get_region_overview(self, region_id):
+        self.calls.append(("overview", region_id))
+        return {"data": {"name": "California"}}
+
+    def get_spot_forecast(self, spot_id, days=5):
+        self.calls.append(("forecast", spot_id))
+        if spot_id == "missing":
+            return None
+        return SpotForecast(spot_id, days, {"data": {"conditions": []}})
+
+    def get_spot_report(self, spot_id, days=3, interval_hours=6, sections=None):
+        self.calls.append(("report", spot_id, sections))
+        if self.failing:
+            return SpotReport(spot_id, days, {**self.report_data, "wave": None})
+        return SpotReport(spot_id, days, self.report_data)
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 bytes, so avoid pytest's tmp_path.
+    directory = tempfile.mkdtemp(prefix="sr-")
+    yield Path(directory) / "d.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path, load_json_fixture):
+    api = FakeAPI(load_json_fixture("surfline/spot_report_endpoints.json"))
+    server = build_server(api, socket_path=socket_path)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield api
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_round_trips_lookups(daemon, socket_path):
+    client = connect(socket_path)
+    assert client is not None
+
+    results = client.search_surfline("mavs")
+    regions = client.get_region_list("root")
+    forecast = client.get_spot_forecast("spot-1", days=2)
+    report = client.get_spot_report("spot-1", columnar=True)
+
+    assert results == daemon.search_surfline("mavs")
+    assert regions == [Region("r-1", "California", "geoname")]
+    assert forecast == SpotForecast("spot-1", 2, {"data": {"conditions": []}})
+    assert report is not None and report.series is not None
+    assert len(report.series["wind"]) > 0
+    assert client.get_spot_forecast("missing") is None
+    client.get_spot_report("spot-1", sections=["wind", "tides"])
+    assert daemon.calls[-1] == ("report", "spot-1", ["wind", "tides"])
+    client.close()
+
+
+def test_repeated_queries_are_served_from_memory(daemon, socket_path):
+    client = connect(socket_path)
+    assert client is not None
+
+    for _ in range(3):
+        client.get_spot_report("spot-1", days=3)
+
+    assert daemon.calls.count(("report", "spot-1", None)) == 1
+    client.close()
+
+
+def test_failed_lookups_are_not_served_from_memory(daemon, socket_path):
+    client = connect(socket_path)
+    assert client is not None
+
+    daemon.failing = True
+    assert client.search_surfline("mavs") == []
+    assert client.get_region_list("root") == []
+    partial = client.get_spot_report("spot-1")
+    daemon.failing = False
+    results = client.search_surfline("mavs")
+    regions = client.get_region_list("root")
+    report = client.get_spot_report("spot-1")
+
+    assert partial is not None and partial.report_data["wave"] is None
+    assert [result.name for result in results] == ["Mavericks"]
+    assert regions == [Region("r-1", "California", "geoname")]
+    assert report is not None and report.report_data["wave"] is not None
+    assert daemon.calls.count(("search", "mavs")) == 2
+    assert daemon.calls.count(("regions", "root")) == 2
+    assert daemon.calls.count(("report", "spot-1", None)) == 2
+    client.close()
+
+
+def test_metrics_route_exports_prometheus_text(daemon, socket_path):
+    daemon.metrics.record(RequestSample("kbyg/wave", cache="miss", status=200))
+    client = connect(socket_path)
+    assert client is not None
+
+    status, body = client._send("/metrics")
+
+    assert status == 200
+    assert b'surfreport_requests_total{endpoint="kbyg/wave",status="200"} 1' in body
+    client.close()
+
+
+def test_connect_returns_none_without_daemon(socket_path):
+    assert connect(socket_path) is None
+
+    # A socket file left behind by a daemon that died.
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+
+    assert connect(socket_path) is None
+
+
+def test_build_server_refuses_to_replace_running_daemon(daemon, socket_path):
+    with pytest.raises(RuntimeError, match="already serving"):
+        build_server(daemon, socket_path=socket_path)
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from surf_report.providers.surfline import decoding
+from surf_report.providers.surfline.decoding import decode_json, projection_for
+
+BODY = json.dumps(
+    {
+        "associated": {"utcOffset": -7, "units": {"tideHeight": "FT"}},
+        "data": {
+            "tides": [
+                {"timestamp": 1, "utcOffset": -7, "type": "HIGH", "height": 5.1},
+                {"timestamp": 2, "utcOffset": -7, "type": "NORMAL", "height": 3},
+            ]
+        },
+    }
+).encode("utf-8")
+
+EXPECTED = {
+    "data": {
+        "tides": [
+            {"timestamp": 1, "utcOffset": -7, "type": "HIGH", "height": 5.1},
+            {"timestamp": 2, "utcOffset": -7, "type": "NORMAL", "height": 3},
+        ]
+    }
+}
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the json module."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(decoding, "orjson", None)
+    return request.param
+
+
+def test_decode_json_projects_report_fields(backend):
+    assert decode_json(BODY, projection_for("/tides")) == EXPECTED
+
+
+def test_decode_json_without_projection_keeps_everything(backend):
+    assert decode_json(BODY) == json.loads(BODY)
+
+
+def test_decode_json_rejects_invalid_documents(backend):
+    with pytest.raises(ValueError):
+        decode_json(b"{not json", projection_for("/tides"))
+
+
+def test_projection_for_unknown_endpoint_is_none():
+    assert projection_for("/conditions") is None
@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+
+import pytest
+
+from surf_report.providers.surfline.export import COLUMNS, open_writer
+from surf_report.providers.surfline.processing import group_spot_report
+
+
+def make_grouped(load_json_fixture):
+    payload = load_json_fixture("surfline/spot_report_endpoints.json")
+    return group_spot_report(payload)
+
+
+def test_jsonl_writer_emits_one_record_per_spot_day(load_json_fixture):
+    grouped = make_grouped(load_json_fixture)
+    output = io.StringIO()
+
+    with open_writer("jsonl", output) as writer:
+        writer.write("spot-1", grouped)
+        writer.write("spot-2", grouped)
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert len(records) == 2 * len(grouped)
+    assert [record["date"] for record in records[: len(grouped)]] == sorted(grouped)
+    first = records[0]
+    assert first["spot_id"] == "spot-1"
+    assert set(first) == {"spot_id", "date", "surf", "swells", "weather"} | {
+        "tides",
+        "wind",
+        "sunlight",
+    }
+    day = grouped[first["date"]]
+    assert len(first["surf"]) == len(day["surf"])
+    assert first["surf"][0]["time"] == day["surf"][0]["time"]
+    assert first["surf"][0]["max"] == day["surf"][0]["max"]
+
+
+def test_csv_writer_uses_long_layout(load_json_fixture):
+    grouped = make_grouped(load_json_fixture)
+    output = io.StringIO()
+
+    with open_writer("csv", output) as writer:
+        writer.write("spot-1", grouped)
+
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert tuple(rows[0]) == COLUMNS
+    assert {row["spot_id"] for row in rows} == {"spot-1"}
+    expected = sum(
+        len(data.get(section, ()))
+        for data in grouped.values()
+        for section in ("surf", "swells", "weather", "tides", "wind", "sunlight")
+    )
+    assert len(rows) == expected
+    tide = next(row for row in rows if row["section"] == "tides")
+    assert tide["type"] in ("HIGH", "LOW")
+    assert tide["speed"] == ""
+
+
+def test_open_writer_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        open_writer("xml", io.StringIO())
+
+
+def test_parquet_writer_writes_typed_columns(load_json_fixture, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    grouped = make_grouped(load_json_fixture)
+    path = tmp_path / "reports.parquet"
+
+    with open(path, "wb") as output, open_writer("parquet", output) as writer:
+        writer.write("spot-1", grouped)
+        writer.write("spot-2", grouped)
+
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.metadata.num_row_groups == 2
+    table = parquet_file.read()
+    assert table.schema.field("date").type == pa.date32()
+    assert table.schema.field("max").type == pa.float64()
+    assert table.column_names == list(COLUMNS)
@@ -0,0 +1,153 @@
+import pytest
+import requests
+
+from surf_report.providers.surfline.fake_server import (
+    FakeSurflineServer,
+    RouteFaults,
+    load_recorded,
+)
+from surf_report.providers.surfline.models import SpotReport
+from surf_report.providers.surfline.surfline import (
+    DEFAULT_BASE_URL,
+    Endpoints,
+    SurflineAPI,
+    rebase_url,
+)
+from surf_report.providers.surfline.taxonomy import ROOT_TAXONOMY_ID
+from surf_report.utils.cache import ResponseCache
+from surf_report.utils.transport import TransportPolicy
+
+NO_BACKOFF = TransportPolicy(backoff_factor=0, backoff_jitter=0)
+
+
+@pytest.fixture
+def fake():
+    with FakeSurflineServer(seed=1) as server:
+        yield server
+
+
+def make_api(fake, **kwargs):
+    kwargs.setdefault("transport", NO_BACKOFF)
+    return SurflineAPI(base_url=fake.base_url, **kwargs)
+
+
+def test_client_reads_every_route_from_stand_in(fake):
+    api = make_api(fake)
+
+    results = api.search_surfline("pipeline")
+    regions = api.get_region_list(ROOT_TAXONOMY_ID)
+    overview = api.get_region_overview("node-0-0-0")
+    forecast = api.get_spot_forecast("node-0-0-0-0", days=2)
+    report = api.get_spot_report("node-0-0-0-0", days=2, columnar=True)
+
+    assert [r.name for r in results][:2] == ["Pipeline 0", "Pipeline 1"]
+    assert [r.id for r in regions] == ["node-0", "node-1", "node-2", "node-3"]
+    assert overview is not None and overview["data"]["forecastSummary"]
+    assert forecast is not None
+    assert len(forecast.forecast_data["data"]["conditions"]) == 2
+    assert report is not None and report.series is not None
+    assert len(report.series["wind"]) == 8  # 2 days, 6-hourly
+    for route in ("search", "taxonomy", "overview", "conditions", "wave", "wind"):
+        assert fake.route_count(route) == 1
+    api.close()
+
+
+def test_recorded_payloads_replace_synthetic_ones(fixtures_dir, load_json_fixture):
+    path = fixtures_dir / "surfline" / "spot_report_endpoints.json"
+    with FakeSurflineServer(payloads=load_recorded(path)) as server:
+        api = make_api(server)
+        report = api.get_spot_report("spot-1")
+
+    assert report is not None
+    recorded = load_json_fixture("surfline/spot_report_endpoints.json")
+    assert report.report_data == {
+        name: recorded[name] for name in report.report_data
+    }
+    api.close()
+
+
+def test_throttled_and_failing_routes_are_retried(fake):
+    fake.set_faults("wind", throttle_rate=1.0)
+    fake.set_faults("tides", error_rate=1.0)
+    api = make_api(fake)
+
+    report = api.get_spot_report("spot-1")
+
+    assert report is not None
+    assert report.report_data["wind"] is None
+    assert report.report_data["tides"] is None
+    assert report.report_data["wave"] is not None
+    retries = NO_BACKOFF.max_retries
+    assert fake.requests[("wind", 429)] == retries + 1
+    assert fake.requests[("tides", 503)] == retries + 1
+    api.close()
+
+
+def test_latency_and_slow_body_show_in_metrics(fake):
+    fake.set_faults(latency=0.05, slow_body=0.04)
+    api = make_api(fake)
+
+    api.get_spot_forecast("spot-1")
+
+    phases = api.metrics._endpoints["spot_forecast"].phases
+    assert phases["ttfb"].max >= 0.05
+    assert phases["download"].max >= 0.03
+    api.close()
+
+
+def test_unchanged_payloads_revalidate_with_304(fake):
+    api = make_api(fake)
+
+    report = api.refresh_spot_report(SpotReport("spot-1", 3, report_data={}))
+    api.refresh_spot_report(report)
+
+    assert fake.requests[("wave", 200)] == 1
+    assert fake.requests[("wave", 304)] == 1
+    api.close()
+
+
+def test_cached_reports_and_connections_are_reused(fake, tmp_path):
+    api = make_api(fake, max_workers=1, cache=ResponseCache(tmp_path / "c.sqlite3"))
+
+    for spot_id in ("a", "b", "c", "a"):
+        api.get_spot_report(spot_id)
+
+    assert fake.route_count("wave") == 3
+    assert fake.connections == 1
+    assert fake.peak_in_flight == 1
+    api.close()
+
+
+def test_same_seed_injects_same_faults():
+    faults = RouteFaults(jitter=0.01, error_rate=0.3, throttle_rate=0.2)
+    draws = []
+    for _ in range(2):
+        server = FakeSurflineServer(seed=7)
+        draws.append([server.draw(faults) for _ in range(50)])
+        server.server_close()
+
+    assert draws[0] == draws[1]
+    statuses = {status for _, status in draws[0]}
+    assert statuses == {None, 429, 503}
+
+
+def test_unknown_route_is_not_found(fake):
+    response = requests.get(f"{fake.base_url}/nowhere", timeout=5)
+
+    assert response.status_code == 404
+
+
+def test_base_url_comes_from_environment(monkeypatch):
+    monkeypatch.setenv("SURFREPORT_BASE_URL", "http://127.0.0.1:9/")
+
+    api = SurflineAPI()
+
+    assert api.base_url == "http://127.0.0.1:9"
+    assert (
+        rebase_url(Endpoints.SEARCH.value, api.base_url)
+        == "http://127.0.0.1:9/search/site"
+    )
+    assert rebase_url(Endpoints.SEARCH.value, DEFAULT_BASE_URL) == (
+        Endpoints.SEARCH.value
+    )
+    api.close()
@@ -0,0 +1,74 @@
+import io
+import pickle
+
+import pytest
+
+from surf_report.main import export_reports, write_text_reports
+from surf_report.providers.surfline.models import SpotReport
+from surf_report.providers.surfline.parallel import (
+    pack_report,
+    render_reports,
+    unpack_report,
+)
+from surf_report.providers.surfline.processing import group_report
+from surf_report.providers.surfline.synthetic import make_report_data
+from surf_report.providers.surfline.ui import render_grouped_data
+
+
+def make_reports(count=5, days=2):
+    return [
+        SpotReport(f"spot-{i}", days, make_report_data(days, 3)) for i in range(count)
+    ]
+
+
+def test_pack_report_round_trips_series():
+    report = make_reports(1)[0].to_columnar()
+
+    restored = unpack_report(pack_report(report))
+
+    assert restored.spot_id == "spot-0" and restored.days == 2
+    assert restored.series is not None and report.series is not None
+    for name, series in report.series.items():
+        assert restored.series[name].timestamps == series.timestamps
+        assert restored.series[name].columns == series.columns
+    assert render_grouped_data(group_report(restored)) == render_grouped_data(
+        group_report(report)
+    )
+
+
+def test_packed_report_is_smaller_than_pickled_payloads():
+    report = SpotReport("spot", 16, make_report_data(16, 1))
+
+    packed = pack_report(report.to_columnar())
+
+    assert len(packed) < len(pickle.dumps(report.report_data)) * 0.8
+
+
+def test_pack_report_requires_columnar_report():
+    with pytest.raises(ValueError, match="columnar"):
+        pack_report(SpotReport("spot", 1, {}))
+
+
+@pytest.mark.parametrize("fmt", ["text", "jsonl", "csv"])
+def test_render_reports_matches_in_process_output(fmt):
+    reports = make_reports()
+    expected = io.StringIO()
+    if fmt == "text":
+        write_text_reports(reports, expected, sections=["wind", "tides"])
+    else:
+        export_reports(reports, fmt, expected)
+
+    chunks = render_reports(
+        iter(reports),
+        fmt,
+        sections=["wind", "tides"] if fmt == "text" else None,
+        workers=2,
+        chunk_size=2,
+    )
+
+    assert "".join(chunks) == expected.getvalue()
+
+
+def test_render_reports_rejects_parquet():
+    with pytest.raises(ValueError, match="parquet"):
+        list(render_reports([], "parquet"))
@@ -0,0 +1,115 @@
+import pytest
+
+from surf_report.providers.surfline import prefetch
+from surf_report.providers.surfline.models import SpotForecast, SpotReport
+from surf_report.providers.surfline.prefetch import (
+    PrefetchScheduler,
+    SpotStatus,
+    describe_status,
+    load_favourites,
+    load_state,
+)
+
+NOW = 1_700_000_000.0
+
+
+class FakeAPI:
+    """Answers lookups like ``SurflineAPI``; spots in ``failing`` lose wind."""
+
+    def __init__(self):
+        self.calls = []
+        self.failing = set()
+
+    def get_spot_forecast(self, spot_id, days=5):
+        self.calls.append(("forecast", spot_id, days))
+        return SpotForecast(spot_id, days, {"data": {}})
+
+    def get_spot_report(self, spot_id, days=3, interval_hours=6, columnar=False):
+        self.calls.append(("report", spot_id, days))
+        wind = None if spot_id in self.failing else {"data": {}}
+        return SpotReport(spot_id, days, {"wave": {"data": {}}, "wind": wind})
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(prefetch.random, "uniform", lambda low, high: 0.0)
+
+
+def test_load_favourites_skips_comments_and_duplicates(tmp_path):
+    path = tmp_path / "favourites.txt"
+    path.write_text("# home breaks\nspot-a\nspot-b  # reef\n\nspot-a\n")
+
+    assert load_favourites(path) == ["spot-a", "spot-b"]
+    assert load_favourites(tmp_path / "missing.txt") == []
+
+
+def test_stagger_spreads_spots_over_the_interval(no_jitter):
+    scheduler = PrefetchScheduler(FakeAPI(), ["a", "b", "c", "d"], interval=400)
+
+    scheduler.stagger(now=NOW)
+
+    assert [s.next_due - NOW for s in scheduler.status()] == [0, 100, 200, 300]
+    assert scheduler.due(NOW + 150) == ["a", "b"]
+
+
+def test_run_pending_refreshes_only_due_spots(no_jitter):
+    api = FakeAPI()
+    scheduler = PrefetchScheduler(api, ["a", "b"], days=2, interval=600)
+    scheduler.stagger(now=NOW)
+
+    assert scheduler.run_pending(NOW) == 1
+
+    assert api.calls == [("forecast", "a", 2), ("report", "a", 2)]
+    status = scheduler.statuses["a"]
+    assert status.last_refresh == NOW
+    assert status.next_due == NOW + 600
+    assert scheduler.statuses["b"].last_refresh is None
+
+
+def test_failures_back_off_and_are_saved(no_jitter, tmp_path):
+    api = FakeAPI()
+    api.failing.add("a")
+    state_path = tmp_path / "prefetch.json"
+    scheduler = PrefetchScheduler(api, ["a"], interval=3600, state_path=state_path)
+
+    assert not scheduler.refresh("a", now=NOW)
+    assert not scheduler.refresh("a", now=NOW)
+    status = scheduler.statuses["a"]
+    assert status.failures == 2
+    assert status.last_error == "no data for wind"
+    assert status.next_due == NOW + 2 * prefetch.RETRY_DELAY
+
+    api.failing.clear()
+    assert scheduler.refresh("a", now=NOW + 10)
+    scheduler.save()
+
+    saved = load_state(state_path)["a"]
+    assert saved == SpotStatus(
+        "a", last_refresh=NOW + 10, last_attempt=NOW + 10, total_failures=2
+    )
+    # A restarted scheduler carries the history on.
+    restarted = PrefetchScheduler(api, ["a", "b"], state_path=state_path)
+    assert restarted.statuses["a"].total_failures == 2
+
+
+def test_scheduler_survives_exceptions(no_jitter):
+    api = FakeAPI()
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    api.get_spot_report = broken
+    scheduler = PrefetchScheduler(api, ["a"])
+
+    assert not scheduler.refresh("a", now=NOW)
+    assert scheduler.statuses["a"].last_error == "boom"
+
+
+def test_describe_status():
+    status = SpotStatus("a", last_refresh=NOW - 300, failures=1, total_failures=3)
+    status.last_error = "no data for wind"
+
+    assert describe_status(status, now=NOW) == (
+        "a  refreshed 5m ago  failures 1 (total 3)  last error: no data for wind"
+    )
+    assert "refreshed never" in describe_status(SpotStatus("b"), now=NOW)
@@ -13,13 +13,18 @@ def test_group_spot_report_groups_sections(load_json_fixture, monkeypatch):
         2004: "Sat 2024-06-01 20:00:00",
     }
 
-    def fake_convert(timestamp, utc_offset):
-        return fake_times.get(timestamp, "Sat 2024-06-01 00:00:00")
+    def fake_convert(timestamps, utc_offsets):
+        parts = [
+            fake_times.get(timestamp, "Sat 2024-06-01 00:00:00").split()
+            for timestamp in timestamps
+        ]
+        return [part[1] for part in parts], [part[2] for part in parts]
 
-    monkeypatch.setattr(
-        "surf_report.providers.surfline.processing.convert_timestamp_to_datetime",
-        fake_convert,
-    )
+    for module in ("processing", "timeseries"):
+        monkeypatch.setattr(
+            f"surf_report.providers.surfline.{module}.convert_timestamps_to_day_time",
+            fake_convert,
+        )
 
     grouped = group_spot_report(report_data)
 
@@ -31,3 +36,14 @@ def test_group_spot_report_groups_sections(load_json_fixture, monkeypatch):
     assert {t["type"] for t in june_first["tides"]} == {"HIGH", "LOW"}
     assert june_first["wind"][0]["directionType"] == "Offshore"
     assert june_first["sunlight"][0]["sunrise"] == "06:30:00"
+
+
+def test_group_spot_report_skips_failed_endpoints(load_json_fixture):
+    report_data = load_json_fixture("surfline/spot_report_endpoints.json")
+    report_data["wind"] = None
+    report_data["sunlight"] = None
+
+    grouped = group_spot_report(report_data)
+
+    assert grouped
+    assert all(not day["wind"] and not day["sunlight"] for day in grouped.values())
@@ -0,0 +1,173 @@
+import math
+from typing import Dict
+
+import pytest
+
+from surf_report.providers.surfline.fake_server import FakeSurflineServer
+from surf_report.providers.surfline.models import Region, SpotReport
+from surf_report.providers.surfline.ranking import (
+    RANK_SECTIONS,
+    SpotRanking,
+    best_window,
+    rank_spots,
+    region_spots,
+    resolve_region,
+    score_windows,
+    top_rankings,
+)
+from surf_report.providers.surfline.surfline import SurflineAPI
+from surf_report.providers.surfline.synthetic import HOUR, make_report_data
+from surf_report.providers.surfline.taxonomy import TaxonomyIndex
+from surf_report.providers.surfline.timeseries import TimeSeries
+
+
+def make_report(spot_id="spot", direction="Onshore", speed=10, surf=None):
+    report_data = make_report_data(1, 3)
+    for row in report_data["wind"]["data"]["wind"]:
+        row.update(directionType=direction, speed=speed)
+    if surf is not None:
+        for row, (low, high) in zip(report_data["wave"]["data"]["wave"], surf):
+            row["surf"].update(min=low, max=high)
+    return SpotReport(spot_id, 1, report_data).to_columnar(RANK_SECTIONS)
+
+
+def make_series(**kwargs) -> Dict[str, TimeSeries]:
+    series = make_report(**kwargs).series
+    assert series is not None
+    return series
+
+
+def ranking(spot_id, score):
+    return SpotRanking(spot_id, spot_id.title(), score, 0, -7)
+
+
+def test_score_windows_prefers_bigger_surf_and_offshore_wind():
+    onshore = score_windows(make_series(direction="Onshore"))
+    offshore = score_windows(make_series(direction="Offshore"))
+    calm = score_windows(make_series(direction="Onshore", speed=0))
+
+    assert len(onshore) == 8  # one day, 3-hourly
+    assert all(0 <= score <= 10 for score in onshore + offshore)
+    assert all(a < b for a, b in zip(onshore, offshore))
+    # Without wind its direction does not matter.
+    assert calm == pytest.approx(offshore)
+    # Synthetic surf cycles 2-4, 3-5, 4-6 ft.
+    assert offshore[2] > offshore[1] > offshore[0]
+
+
+def test_score_windows_without_wind_or_tides_uses_surf_alone():
+    series = {"surf": make_series()["surf"]}
+
+    scores = score_windows(series)
+
+    assert scores[2] == pytest.approx(10 * (0.6 * 5 / 6 + 0.3 * 0.5 + 0.1 * 0.5))
+    assert score_windows({}) == []
+
+
+def test_best_window_stays_inside_time_range_and_skips_missing_surf():
+    surf = [(None, None), (1, 2), (4, 6), (2, 3)] + [(1, 1)] * 4
+    report = make_report("spot-1", surf=surf)
+    assert report.series is not None
+    first = report.series["surf"].timestamps[0]
+
+    best = best_window(report, "Spot 1")
+    later = best_window(report, start=first + 3 * 3 * HOUR)
+    empty = best_window(report, end=first + 1)
+
+    assert best is not None and best.name == "Spot 1"
+    assert best.timestamp == first + 2 * 3 * HOUR
+    assert (best.surf_min, best.surf_max) == (4, 6)
+    assert best.wind_direction_type == "Onshore" and best.wind_speed == 10
+    assert best.tide_height is not None
+    assert later is not None and later.surf_max == 3
+    assert empty is None  # the only window in range has no surf height
+    assert math.isnan(score_windows(report.series)[0])
+
+
+def test_top_rankings_keeps_best_k_in_order():
+    rankings = [ranking(f"spot-{i}", score) for i, score in enumerate([3, 9, 1, 7, 9])]
+
+    top = top_rankings(iter(rankings + [None]), 3)
+
+    assert [(r.spot_id, r.score) for r in top] == [
+        ("spot-4", 9),
+        ("spot-1", 9),
+        ("spot-3", 7),
+    ]
+    assert top_rankings(reversed(rankings), 3) == top
+    with pytest.raises(ValueError):
+        top_rankings(rankings, 0)
+
+
+def test_rank_spots_ranks_region_from_stand_in():
+    def wind(params):
+        direction = "Offshore" if params["spotId"] == "node-0-0-0-2" else "Onshore"
+        rows = make_report_data(int(params["days"]), int(params["intervalHours"]))
+        for row in rows["wind"]["data"]["wind"]:
+            row["directionType"] = direction
+        return rows["wind"]
+
+    taxonomy = TaxonomyIndex()
+    with FakeSurflineServer(payloads={"wind": wind}) as fake:
+        api = SurflineAPI(base_url=fake.base_url)
+        spots = region_spots(api, taxonomy, "node-0-0-0")
+        top = rank_spots(api, spots, top=2)
+
+        assert [spot.id for spot in spots] == [f"node-0-0-0-{i}" for i in range(4)]
+        assert [r.spot_id for r in top] == ["node-0-0-0-2", "node-0-0-0-3"]
+        assert top[0].name == "Spot 0-0-0-2"
+        assert top[0].score > top[1].score
+        for route in ("wave", "wind", "tides"):
+            assert fake.route_count(route) == 4
+        assert fake.route_count("weather") == 0
+        api.close()
+
+
+def test_region_spots_reads_fresh_snapshot_without_network():
+    taxonomy = TaxonomyIndex()
+    with FakeSurflineServer() as fake:
+        api = SurflineAPI(base_url=fake.base_url)
+        region_spots(api, taxonomy, "node-1")
+        taxonomy_requests = fake.route_count("taxonomy")
+
+        spots = region_spots(api, taxonomy, "node-1")
+        spot = region_spots(api, taxonomy, "node-1-0-0-0")
+
+        assert len(spots) == 64
+        assert [region.id for region in spot] == ["node-1-0-0-0"]
+        assert fake.route_count("taxonomy") == taxonomy_requests
+        api.close()
+
+
+def test_resolve_region_accepts_ids_and_names():
+    taxonomy = TaxonomyIndex()
+    taxonomy.add_document(
+        taxonomy.root_id,
+        {
+            "contains": [
+                {"_id": "ca", "name": "California", "type": "geoname"},
+                {"_id": "ob", "name": "Ocean Beach", "type": "spot"},
+                {"_id": "ob-2", "name": "ocean beach", "type": "spot"},
+            ]
+        },
+    )
+
+    assert resolve_region(taxonomy, "ca") == "ca"
+    assert resolve_region(taxonomy, "california") == "ca"
+    assert resolve_region(taxonomy, "unknown-id") == "unknown-id"
+    with pytest.raises(ValueError, match="2 regions"):
+        resolve_region(taxonomy, "Ocean Beach")
+
+
+def test_rank_spots_skips_spots_without_surf():
+    class API:
+        def get_spot_reports(self, spot_ids, **kwargs):
+            assert kwargs["sections"] == RANK_SECTIONS
+            yield SpotReport("a", 1, {}).to_columnar(RANK_SECTIONS)
+            yield make_report("b")
+
+    spots = [Region("a", "A", "spot", spot="a"), Region("b", "B", "spot", spot="b")]
+
+    top = rank_spots(API(), spots)
+
+    assert [r.name for r in top] == ["B"]
@@ -0,0 +1,120 @@
+import threading
+
+from surf_report.providers.surfline.search_index import SpotSearchIndex, normalize
+from surf_report.providers.surfline.surfline import SurflineAPI
+from surf_report.providers.surfline.taxonomy import TaxonomyIndex
+
+SPOTS = [
+    ("spot-1", "Mavericks", ["California", "San Mateo County", "Mavericks"]),
+    ("spot-2", "Ocean Beach", ["California", "San Francisco", "Ocean Beach"]),
+    ("spot-3", "Ocean Beach Pier", ["California", "San Diego", "Ocean Beach Pier"]),
+    ("spot-4", "Pleasure Point", ["California", "Santa Cruz", "Pleasure Point"]),
+    ("spot-5", "Playa Pérez", ["Mexico", "Oaxaca", "Playa Pérez"]),
+]
+
+
+def test_normalize_strips_accents_and_punctuation():
+    assert normalize("Playa  Pérez (North)") == "playa perez north"
+
+
+def test_search_ranks_exact_and_prefix_name_matches_first():
+    index = SpotSearchIndex(SPOTS)
+
+    results = index.search("ocean beach")
+
+    assert [result.id for result in results] == ["spot-2", "spot-3"]
+    assert results[0].breadcrumbs == ["California", "San Francisco", "Ocean Beach"]
+    assert results[0].type == "spot"
+
+
+def test_search_matches_word_prefixes_and_breadcrumbs():
+    index = SpotSearchIndex(SPOTS)
+
+    assert [r.id for r in index.search("mav")] == ["spot-1"]
+    assert [r.id for r in index.search("santa cruz")] == ["spot-4"]
+    assert [r.id for r in index.search("perez")] == ["spot-5"]
+
+
+def test_search_respects_limit():
+    index = SpotSearchIndex(SPOTS)
+
+    assert len(index.search("california", limit=2)) == 2
+
+
+def test_search_tolerates_typos_with_trigrams():
+    index = SpotSearchIndex(SPOTS)
+
+    assert [r.id for r in index.search("maverciks")][:1] == ["spot-1"]
+
+
+def test_concurrent_first_fuzzy_searches_build_trigrams_once():
+    index = SpotSearchIndex(SPOTS * 200)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def search():
+        barrier.wait()
+        results.append([r.id for r in index.search("maverciks")][:1])
+
+    threads = [threading.Thread(target=search) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(index._trigram_counts) == len(index)
+    assert results == [["spot-1"]] * 8
+
+
+def test_search_returns_nothing_for_unrelated_queries():
+    index = SpotSearchIndex(SPOTS)
+
+    assert index.search("zzzz") == []
+    assert index.search("   ") == []
+
+
+def test_from_taxonomy_uses_ancestors_as_breadcrumbs():
+    taxonomy = TaxonomyIndex(root_id="root")
+    taxonomy.add_document(
+        "root",
+        {
+            "contains": [
+                {"_id": "ca", "name": "California", "type": "geoname", "depth": 0},
+                {
+                    "_id": "mavs",
+                    "name": "Mavericks",
+                    "type": "spot",
+                    "depth": 1,
+                    "liesIn": ["ca"],
+                },
+            ]
+        },
+        max_depth=1,
+    )
+
+    index = SpotSearchIndex.from_taxonomy(taxonomy)
+
+    (result,) = index.search("mavericks")
+    assert result.id == "mavs"
+    assert result.breadcrumbs == ["California", "Mavericks"]
+
+
+def test_search_surfline_prefers_local_index(monkeypatch):
+    api = SurflineAPI(search_index=SpotSearchIndex(SPOTS))
+
+    def unexpected_call(*args, **kwargs):
+        raise AssertionError("Remote search should not be used on a local hit")
+
+    monkeypatch.setattr(api, "_get", unexpected_call)
+
+    assert [r.name for r in api.search_surfline("pleasure")] == ["Pleasure Point"]
+
+
+def test_search_surfline_falls_back_to_remote_on_miss(load_json_fixture, monkeypatch):
+    payload = load_json_fixture("surfline/search_success.json")
+    api = SurflineAPI(search_index=SpotSearchIndex(SPOTS))
+    monkeypatch.setattr(api, "_get", lambda url, params: payload)
+
+    results = api.search_surfline("zzzz")
+
+    assert [r.name for r in results] == ["Mavericks", "Pleasure Point"]
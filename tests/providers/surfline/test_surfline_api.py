@@ -1,9 +1,20 @@
+import json
+import threading
+import time
 from types import SimpleNamespace
+from typing import cast
 
 import pytest
 import requests
 
-from surf_report.providers.surfline.surfline import SurflineAPI
+from surf_report.providers.surfline.models import SpotReport
+from surf_report.providers.surfline.surfline import (
+    Endpoints,
+    SurflineAPI,
+    endpoint_label,
+)
+from surf_report.providers.surfline.timeseries import section_endpoints
+from surf_report.utils.cache import ResponseCache
 
 
 class DummySession:
@@ -12,17 +23,25 @@ class DummySession:
     def __init__(self, responder):
         self._responder = responder
         self.headers = {}
+        self.sent_headers = []
 
-    def get(self, url, params):
+    def get(self, url, params, **kwargs):
+        self.sent_headers.append(kwargs.get("headers"))
         return self._responder(url, params)
 
 
+def as_session(stand_in) -> requests.Session:
+    """Pass a session stand-in where ``SurflineAPI`` expects a real one."""
+    return cast(requests.Session, stand_in)
+
+
 class DummyResponse:
     """Lightweight stand-in for `requests.Response`."""
 
-    def __init__(self, payload, status_code=200):
+    def __init__(self, payload, status_code=200, headers=None):
         self._payload = payload
         self.status_code = status_code
+        self.headers = headers or {}
 
     def raise_for_status(self):
         if self.status_code >= 400:
@@ -31,9 +50,15 @@ class DummyResponse:
     def json(self):
         return self._payload
 
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode("utf-8")
+
 
 def test__get_returns_json_on_success():
-    api = SurflineAPI(session=DummySession(lambda *_: DummyResponse({"ok": True})))
+    api = SurflineAPI(
+        session=as_session(DummySession(lambda *_: DummyResponse({"ok": True})))
+    )
     response = api._get("https://example.com", {"q": "test"})
 
     assert response == {"ok": True}
@@ -43,7 +68,7 @@ def test__get_returns_none_on_request_exception():
     def responder(*_):
         raise requests.exceptions.RequestException("boom")
 
-    api = SurflineAPI(session=DummySession(responder))
+    api = SurflineAPI(session=as_session(DummySession(responder)))
     response = api._get("https://example.com", {"q": "test"})
 
     assert response is None
@@ -129,11 +154,64 @@ def test_get_spot_report_collects_each_endpoint(load_json_fixture, monkeypatch):
     monkeypatch.setattr(api, "_get", fake_get)
 
     report = api.get_spot_report("spot-99", days=4, interval_hours=3)
+    assert report is not None
 
     assert report.spot_id == "spot-99"
-    assert set(requested) == {"wave", "weather", "tides", "surf", "sunlight", "wind", "swells"}
+    # /surf and /swells are not read by any report section.
+    assert set(requested) == {"wave", "weather", "tides", "sunlight", "wind"}
     assert report.report_data["sunlight"]["data"]["sunlight"]
 
+    assert report.load(["surf"])["surf"] == endpoint_payloads["surf"]
+    assert requested[-1] == "surf"
+
+
+def test_get_spot_report_fetches_only_requested_sections(
+    load_json_fixture, monkeypatch
+):
+    endpoint_payloads = load_json_fixture("surfline/spot_report_endpoints.json")
+    api = SurflineAPI()
+    requested = []
+
+    def fake_get(url, params):
+        slug = url.rsplit("/", 1)[-1]
+        requested.append(slug)
+        return endpoint_payloads[slug]
+
+    monkeypatch.setattr(api, "_get", fake_get)
+
+    report = api.get_spot_report("spot-99", sections=["wind", "tides"], columnar=True)
+
+    assert sorted(requested) == ["tides", "wind"]
+    assert report is not None and report.series is not None
+    assert set(report.series) == {"wind", "tides"}
+    assert len(report.series["wind"]) > 0
+
+
+def test_lazy_spot_report_fetches_endpoints_on_first_use(
+    load_json_fixture, monkeypatch
+):
+    from surf_report.providers.surfline.ui import render_combined_spot_report
+
+    endpoint_payloads = load_json_fixture("surfline/spot_report_endpoints.json")
+    api = SurflineAPI()
+    requested = []
+
+    def fake_get(url, params):
+        slug = url.rsplit("/", 1)[-1]
+        requested.append(slug)
+        return endpoint_payloads[slug]
+
+    monkeypatch.setattr(api, "_get", fake_get)
+
+    report = api.get_spot_report("spot-99", lazy=True)
+    assert requested == []
+
+    text = render_combined_spot_report(None, report, sections=["swells"])
+    render_combined_spot_report(None, report, sections=["surf", "swells"])
+
+    assert requested == ["wave"]
+    assert "Swells:" in text and "Wind:" not in text
+
 
 def test_get_spot_report_handles_partial_failures(load_json_fixture, monkeypatch):
     endpoint_payloads = load_json_fixture("surfline/spot_report_endpoints.json")
@@ -148,6 +226,364 @@ def test_get_spot_report_handles_partial_failures(load_json_fixture, monkeypatch
     monkeypatch.setattr(api, "_get", fake_get)
 
     report = api.get_spot_report("spot-99")
+    assert report is not None
 
     assert report.report_data["wind"] is None
     assert report.report_data["wave"]["data"]["wave"][0]["surf"]["min"] == 2
+
+
+def test_get_spot_report_fetches_endpoints_concurrently(
+    load_json_fixture, monkeypatch
+):
+    endpoint_payloads = load_json_fixture("surfline/spot_report_endpoints.json")
+    api = SurflineAPI(max_workers=7)
+    barrier = threading.Barrier(5, timeout=5)
+
+    def fake_get(url, params):
+        # Every endpoint must be in flight at once for the barrier to release.
+        barrier.wait()
+        return endpoint_payloads[url.rsplit("/", 1)[-1]]
+
+    monkeypatch.setattr(api, "_get", fake_get)
+
+    report = api.get_spot_report("spot-99")
+    assert report is not None
+
+    assert list(report.report_data) == ["wave", "weather", "tides", "wind", "sunlight"]
+    assert report.report_data["wind"] == endpoint_payloads["wind"]
+    api.close()
+
+
+def test_get_spot_report_runs_sequentially_with_single_worker(monkeypatch):
+    api = SurflineAPI(max_workers=1)
+    threads = set()
+
+    def fake_get(url, params):
+        threads.add(threading.get_ident())
+        return {"url": url}
+
+    monkeypatch.setattr(api, "_get", fake_get)
+
+    report = api.get_spot_report("spot-99")
+    assert report is not None
+
+    assert threads == {threading.get_ident()}
+    assert report.report_data["tides"]["url"].endswith("/tides")
+
+
+def test__get_serves_repeat_requests_from_cache(tmp_path):
+    calls = []
+
+    def responder(url, params):
+        calls.append(url)
+        return DummyResponse({"data": {"conditions": []}})
+
+    api = SurflineAPI(
+        session=as_session(DummySession(responder)),
+        cache=ResponseCache(tmp_path / "cache.sqlite3"),
+    )
+    url = Endpoints.SPOT_FORECAST.value
+
+    first = api._get(url, {"spotId": "spot-1", "days": 3})
+    second = api._get(url, {"spotId": "spot-1", "days": 3})
+
+    assert first == second == {"data": {"conditions": []}}
+    assert calls == [url]
+
+
+def test__get_selective_decode_keeps_report_fields(tmp_path):
+    payload = {
+        "associated": {"units": {"waveHeight": "FT"}},
+        "data": {
+            "wind": [
+                {
+                    "timestamp": 1001,
+                    "utcOffset": 0,
+                    "speed": 5,
+                    "directionType": "Offshore",
+                    "optimalScore": 2,
+                    "probability": 100,
+                }
+            ]
+        },
+    }
+    api = SurflineAPI(
+        session=as_session(DummySession(lambda *_: DummyResponse(payload))),
+        cache=ResponseCache(tmp_path / "cache.sqlite3"),
+        selective_decode=True,
+    )
+    url = Endpoints.KBYG_BASE.value + "/wind"
+
+    data = api._get(url, {"spotId": "spot-1"})
+
+    assert data == {
+        "data": {
+            "wind": [
+                {
+                    "timestamp": 1001,
+                    "utcOffset": 0,
+                    "speed": 5,
+                    "directionType": "Offshore",
+                    "optimalScore": 2,
+                }
+            ]
+        }
+    }
+    # A client decoding everything does not reuse the projected entry.
+    api.selective_decode = False
+    assert api._get(url, {"spotId": "spot-1"}) == payload
+
+
+def test__get_revalidates_expired_entries(tmp_path, monkeypatch):
+    from surf_report.utils import cache as cache_module
+
+    now = 1_000_000.0
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    responses = [
+        DummyResponse({"data": {"conditions": []}}, headers={"ETag": '"v1"'}),
+        DummyResponse(None, status_code=304),
+    ]
+    session = DummySession(lambda *_: responses.pop(0))
+    api = SurflineAPI(
+        session=as_session(session), cache=ResponseCache(tmp_path / "c.sqlite3")
+    )
+    url = Endpoints.SPOT_FORECAST.value
+
+    first = api._get(url, {"spotId": "spot-1"})
+    now += 31 * 60
+    second = api._get(url, {"spotId": "spot-1"})
+    third = api._get(url, {"spotId": "spot-1"})  # renewed by the 304
+
+    assert first == second == third == {"data": {"conditions": []}}
+    assert session.sent_headers == [None, {"If-None-Match": '"v1"'}]
+    assert api.revalidation.not_modified == 1
+    assert api.revalidation.unchanged_fraction == 0.5
+
+
+def test__get_refresh_ahead_revalidates_entries_close_to_expiry(tmp_path, monkeypatch):
+    from surf_report.utils import cache as cache_module
+
+    now = 1_000_000.0
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    responses = [
+        DummyResponse({"data": {}}, headers={"ETag": '"v1"'}),
+        DummyResponse(None, status_code=304),
+    ]
+    session = DummySession(lambda *_: responses.pop(0))
+    cache = ResponseCache(tmp_path / "c.sqlite3")
+    api = SurflineAPI(session=as_session(session), cache=cache, refresh_ahead=15 * 60)
+    url = Endpoints.SPOT_FORECAST.value
+
+    api._get(url, {"spotId": "spot-1"})
+    now += 20 * 60  # fresh for 10 more minutes, less than refresh_ahead
+    api._get(url, {"spotId": "spot-1"})
+    plain = SurflineAPI(session=as_session(session), cache=cache)
+    plain._get(url, {"spotId": "spot-1"})
+
+    assert session.sent_headers == [None, {"If-None-Match": '"v1"'}]
+
+
+def test_api_records_request_metrics_per_endpoint(tmp_path, monkeypatch):
+    from surf_report.utils import cache as cache_module
+
+    now = 1_000_000.0
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    responses = {
+        "wave": [
+            DummyResponse({"data": {}}, headers={"ETag": '"v1"'}),
+            DummyResponse(None, status_code=304),
+        ],
+        "wind": [DummyResponse(None, status_code=503)],
+    }
+    session = DummySession(lambda url, _: responses[url.rsplit("/", 1)[-1]].pop(0))
+    api = SurflineAPI(
+        session=as_session(session), cache=ResponseCache(tmp_path / "c.sqlite3")
+    )
+    wave = f"{Endpoints.KBYG_BASE.value}/wave"
+
+    api._get(wave, {"spotId": "spot-1"})  # miss
+    api._get(wave, {"spotId": "spot-1"})  # hit
+    now += 21 * 60
+    api._get(wave, {"spotId": "spot-1"})  # revalidated
+    api._get(f"{Endpoints.KBYG_BASE.value}/wind", {"spotId": "spot-1"})
+
+    text = api.metrics.to_prometheus()
+    for result in ("miss", "hit", "revalidated"):
+        assert (
+            f'surfreport_cache_lookups_total{{endpoint="kbyg/wave",result="{result}"}} 1'
+            in text
+        )
+    assert 'surfreport_requests_total{endpoint="kbyg/wave",status="200"} 1' in text
+    assert 'surfreport_requests_total{endpoint="kbyg/wind",status="503"} 1' in text
+    assert len(api.metrics) == 4
+
+
+def test_endpoint_label():
+    assert endpoint_label(f"{Endpoints.KBYG_BASE.value}/swells") == "kbyg/swells"
+    assert endpoint_label(Endpoints.SPOT_FORECAST.value) == "spot_forecast"
+    assert endpoint_label("https://example.com/other") == "other"
+
+
+def test_refresh_spot_report_merges_changed_endpoints(load_json_fixture):
+    payloads = load_json_fixture("surfline/spot_report_endpoints.json")
+    start_ts = 1717243200
+    validated = {}
+
+    def wind_rows(first_step, speeds):
+        return [
+            {"timestamp": start_ts + step * 3600, "utcOffset": 0, "speed": speed}
+            for step, speed in enumerate(speeds, start=first_step)
+        ]
+
+    def responder(url, params):
+        name = url.rsplit("/", 1)[-1]
+        headers = session.sent_headers[-1]
+        if name != "wind":
+            if headers:
+                validated[name] = headers
+                return DummyResponse(None, status_code=304)
+            return DummyResponse(payloads[name], headers={"ETag": f'"{name}"'})
+        # The second window starts one step later and revises one step.
+        rows = wind_rows(1, [5, 99, 7]) if headers else wind_rows(0, [4, 5, 6])
+        return DummyResponse({"data": {"wind": rows}}, headers={"ETag": '"w"'})
+
+    session = DummySession(responder)
+    api = SurflineAPI(session=as_session(session), max_workers=1)
+    start = SpotReport(spot_id="spot-1", days=1, report_data={})
+
+    first = api.refresh_spot_report(start)
+    second = api.refresh_spot_report(first)
+    assert first.series is not None and second.series is not None
+    assert first.validators is not None
+
+    assert first.validators["wave"] == {"If-None-Match": '"wave"'}
+    assert set(validated) == {"wave", "weather", "tides", "sunlight"}
+    assert second.series["tides"] is first.series["tides"]
+    wind = second.series["wind"]
+    assert [start_ts + step * 3600 for step in range(4)] == list(wind.timestamps)
+    assert wind.values("speed", range(4)) == [4, 5, 99, 7]
+    assert api.revalidation.not_modified == 4
+    assert api.revalidation.requests == 10
+
+
+def test__get_coalesces_concurrent_identical_requests():
+    release = threading.Event()
+    calls = []
+
+    def responder(url, params):
+        calls.append(params["spotId"])
+        release.wait(5)
+        return DummyResponse({"spot": params["spotId"]})
+
+    api = SurflineAPI(session=as_session(DummySession(responder)))
+    url = Endpoints.SPOT_FORECAST.value
+    results = []
+
+    def fetch(spot_id):
+        results.append(api._get(url, {"spotId": spot_id}))
+
+    threads = [threading.Thread(target=fetch, args=("a",)) for _ in range(5)]
+    threads.append(threading.Thread(target=fetch, args=("b",)))
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while api._inflight.shared < 4 or len(calls) < 2:
+        assert time.monotonic() < deadline, "requests were not coalesced"
+        time.sleep(0.005)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(calls) == ["a", "b"]
+    assert results.count({"spot": "a"}) == 5
+    assert results.count({"spot": "b"}) == 1
+
+
+def test__get_does_not_cache_failures(tmp_path):
+    calls = []
+
+    def responder(url, params):
+        calls.append(url)
+        return DummyResponse({}, status_code=500)
+
+    api = SurflineAPI(
+        session=as_session(DummySession(responder)),
+        cache=ResponseCache(tmp_path / "cache.sqlite3"),
+    )
+
+    assert api._get(Endpoints.TAXONOMY.value, {"id": "root"}) is None
+    assert api._get(Endpoints.TAXONOMY.value, {"id": "root"}) is None
+    assert len(calls) == 2
+
+
+def test_get_spot_reports_streams_every_spot(load_json_fixture, monkeypatch):
+    endpoint_payloads = load_json_fixture("surfline/spot_report_endpoints.json")
+    api = SurflineAPI()
+
+    def fake_get(url, params):
+        slug = url.rsplit("/", 1)[-1]
+        if params["spotId"] == "spot-2" and slug == "tides":
+            return None
+        return endpoint_payloads[slug]
+
+    monkeypatch.setattr(api, "_get", fake_get)
+
+    reports = {
+        report.spot_id: report
+        for report in api.get_spot_reports(["spot-1", "spot-2", "spot-1"], days=2)
+    }
+
+    assert set(reports) == {"spot-1", "spot-2"}
+    assert list(reports["spot-1"].report_data) == section_endpoints()
+    assert reports["spot-2"].report_data["tides"] is None
+    assert reports["spot-2"].days == 2
+
+
+def test_get_spot_reports_caps_requests_in_flight(monkeypatch):
+    api = SurflineAPI()
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_get(url, params):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight -= 1
+        return {}
+
+    monkeypatch.setattr(api, "_get", fake_get)
+
+    spot_ids = [f"spot-{i}" for i in range(6)]
+    reports = list(api.get_spot_reports(spot_ids, max_concurrency=3))
+
+    assert len(reports) == 6
+    assert peak == 3
+
+
+def test_get_spot_reports_bounds_spots_in_flight_for_slow_consumer(monkeypatch):
+    api = SurflineAPI()
+    lock = threading.Lock()
+    started = set()
+
+    def fake_get(url, params):
+        with lock:
+            started.add(params["spotId"])
+        return {}
+
+    monkeypatch.setattr(api, "_get", fake_get)
+
+    spot_ids = [f"spot-{i}" for i in range(20)]
+    outstanding = []
+    for consumed, _ in enumerate(api.get_spot_reports(spot_ids, max_concurrency=2), 1):
+        # Give the pool time to run ahead of the consumer if it could.
+        time.sleep(0.01)
+        with lock:
+            outstanding.append(len(started) - consumed)
+
+    assert len(outstanding) == 20
+    assert max(outstanding) <= 4  # twice max_concurrency
+    assert len(started) == 20
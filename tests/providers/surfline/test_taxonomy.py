@@ -0,0 +1,196 @@
+from types import SimpleNamespace
+
+from surf_report.providers.surfline.taxonomy import TaxonomyIndex
+
+ROOT = "root"
+
+# Two levels below the root, shaped like a `maxDepth=1` taxonomy response.
+NESTED_DOCUMENT = {
+    "contains": [
+        {"_id": "ca", "name": "California", "type": "geoname", "depth": 0},
+        {
+            "_id": "sm",
+            "name": "San Mateo",
+            "type": "subregion",
+            "subregion": "sub-sm",
+            "depth": 1,
+            "liesIn": ["ca"],
+        },
+        {
+            "_id": "mavs",
+            "name": "Mavericks",
+            "type": "spot",
+            "spot": "spot-mavs",
+            "depth": 1,
+            "liesIn": ["ca", "elsewhere"],
+        },
+    ]
+}
+
+
+class FakeAPI:
+    """Serves taxonomy documents from a dict and records requests."""
+
+    max_workers = 2
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.requests = []
+
+    def get_taxonomy(self, taxonomy_id, max_depth=0):
+        self.requests.append((taxonomy_id, max_depth))
+        return self.documents.get(taxonomy_id)
+
+
+def test_add_document_builds_adjacency_from_nested_levels():
+    index = TaxonomyIndex(root_id=ROOT)
+
+    frontier = index.add_document(ROOT, NESTED_DOCUMENT, max_depth=1)
+
+    assert [region.name for region in index.children_of(ROOT)] == ["California"]
+    assert [region.id for region in index.children_of("ca")] == ["sm", "mavs"]
+    assert index.parent_of("mavs") == "ca"
+    assert [region.name for region in index.ancestors("mavs")] == ["California"]
+    assert frontier == ["sm"]  # spots never need expanding
+    assert {region.id for region in index.spots()} == {"mavs"}
+
+
+def test_descendants_walks_subtree_once_per_node():
+    index = TaxonomyIndex(root_id=ROOT)
+    index.add_document(ROOT, NESTED_DOCUMENT, max_depth=1)
+    index.add_document(
+        "sm",
+        {"contains": [{"_id": "mavs", "name": "Mavericks", "type": "spot"}]},
+    )
+
+    assert [region.id for region in index.descendants(ROOT)] == ["ca", "sm", "mavs"]
+    assert [region.id for region in index.descendants("sm")] == ["mavs"]
+    assert list(index.descendants("mavs")) == []
+
+
+def test_ensure_children_uses_fresh_snapshot_without_network():
+    index = TaxonomyIndex(root_id=ROOT)
+    index.add_document(ROOT, NESTED_DOCUMENT, max_depth=1)
+    api = FakeAPI({})
+
+    regions = index.ensure_children(api, "ca")
+
+    assert [region.id for region in regions] == ["sm", "mavs"]
+    assert api.requests == []
+
+
+def test_ensure_children_fetches_unknown_levels():
+    index = TaxonomyIndex(root_id=ROOT)
+    api = FakeAPI({ROOT: {"contains": NESTED_DOCUMENT["contains"][:1]}})
+
+    regions = index.ensure_children(api, ROOT)
+
+    assert [region.id for region in regions] == ["ca"]
+    assert api.requests == [(ROOT, 0)]
+    assert index.dirty
+
+
+def test_ensure_children_falls_back_to_stale_data_when_offline(monkeypatch):
+    index = TaxonomyIndex(root_id=ROOT)
+    index.add_document(ROOT, NESTED_DOCUMENT, max_depth=1)
+    api = FakeAPI({})
+
+    regions = index.ensure_children(api, "ca", max_age=-1)
+
+    assert [region.id for region in regions] == ["sm", "mavs"]
+    assert api.requests == [("ca", 0)]
+
+
+def test_sync_expands_frontier_until_only_spots_remain():
+    documents = {
+        ROOT: NESTED_DOCUMENT,
+        "sm": {
+            "contains": [
+                {"_id": "ob", "name": "Ocean Beach", "type": "spot", "depth": 0}
+            ]
+        },
+    }
+    api = FakeAPI(documents)
+    index = TaxonomyIndex(root_id=ROOT)
+
+    requests_made = index.sync(api, depth=1)
+
+    assert requests_made == 2
+    assert api.requests == [(ROOT, 1), ("sm", 1)]
+    assert [region.id for region in index.children_of("sm")] == ["ob"]
+
+
+def test_refresh_stale_only_refetches_old_levels():
+    index = TaxonomyIndex(root_id=ROOT)
+    index.add_document(ROOT, NESTED_DOCUMENT, max_depth=1)
+    index.fetched_at["ca"] = 0.0
+    api = FakeAPI({"ca": {"contains": NESTED_DOCUMENT["contains"][1:2]}})
+
+    refreshed = index.refresh_stale(api, max_age=60)
+
+    assert refreshed == 1
+    assert api.requests == [("ca", 0)]
+    assert [region.id for region in index.children_of("ca")] == ["sm"]
+
+
+def test_refresh_drops_children_no_longer_listed():
+    index = TaxonomyIndex(root_id=ROOT)
+    index.add_document(ROOT, NESTED_DOCUMENT, max_depth=1)
+    index.add_document(
+        "sm",
+        {
+            "contains": [
+                {"_id": "mavs", "name": "Mavericks", "type": "spot"},
+                {"_id": "ps", "name": "Pillar", "type": "spot"},
+            ]
+        },
+    )
+    # San Mateo is gone from California; Mavericks is still listed directly.
+    api = FakeAPI({"ca": {"contains": NESTED_DOCUMENT["contains"][2:]}})
+    index.fetched_at["ca"] = 0.0
+
+    index.refresh_stale(api, max_age=60)
+
+    assert [region.id for region in index.children_of("ca")] == ["mavs"]
+    assert "sm" not in index and "ps" not in index
+    assert "sm" not in index.children and "ps" not in index.parents
+    assert {region.id for region in index.spots()} == {"mavs"}
+    assert [region.id for region in index.descendants(ROOT)] == ["ca", "mavs"]
+
+
+def test_snapshot_round_trips_through_disk(tmp_path):
+    index = TaxonomyIndex(root_id=ROOT)
+    index.add_document(ROOT, NESTED_DOCUMENT, max_depth=1)
+    path = index.save(tmp_path / "taxonomy.json")
+
+    loaded = TaxonomyIndex.load(path)
+
+    assert loaded is not None
+    assert loaded.get("mavs") == index.get("mavs")
+    assert loaded.children == index.children
+    assert loaded.parent_of("sm") == "ca"
+    assert not loaded.dirty
+
+
+def test_load_returns_none_for_missing_or_corrupt_snapshot(tmp_path):
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json", encoding="utf-8")
+
+    assert TaxonomyIndex.load(tmp_path / "missing.json") is None
+    assert TaxonomyIndex.load(corrupt) is None
+
+
+def test_get_taxonomy_passes_max_depth(monkeypatch):
+    from surf_report.providers.surfline.surfline import SurflineAPI
+
+    api = SurflineAPI()
+    seen = SimpleNamespace(params=None)
+
+    def fake_get(url, params):
+        seen.params = params
+        return NESTED_DOCUMENT
+
+    monkeypatch.setattr(api, "_get", fake_get)
+
+    assert api.get_taxonomy("root-id", max_depth=3) == NESTED_DOCUMENT
+    assert seen.params["maxDepth"] == 3
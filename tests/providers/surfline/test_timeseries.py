@@ -0,0 +1,143 @@
+import copy
+import io
+import math
+from array import array
+
+import pytest
+
+from surf_report.providers.surfline.models import SpotReport
+from surf_report.providers.surfline.timeseries import (
+    WIND_FIELDS,
+    TimeSeries,
+    build_report_series,
+)
+from surf_report.providers.surfline.ui import display_spot_report
+
+
+def test_time_series_from_rows_builds_typed_columns():
+    rows = [
+        {
+            "timestamp": 1717243200,
+            "utcOffset": -7,
+            "speed": 5,
+            "directionType": "Offshore",
+        },
+        {"timestamp": None, "utcOffset": -7, "speed": 9},
+        {"timestamp": 1717246800, "utcOffset": -7, "speed": 7.5},
+    ]
+
+    series = TimeSeries.from_rows(rows, WIND_FIELDS)
+
+    assert len(series) == 2
+    speed, gust = series.column("speed"), series.column("gust")
+    assert isinstance(speed, array) and speed.typecode == "d"
+    assert isinstance(gust, array) and math.isnan(gust[0])
+    first, second = series
+    assert first["speed"] == 5 and isinstance(first["speed"], int)
+    assert first["directionType"] == "Offshore"
+    assert first["time"] == "05:00:00"
+    assert second["speed"] == 7.5
+    assert second.get("directionType") is None
+    assert second.get("gust", "n/a") == "n/a"
+    with pytest.raises(KeyError):
+        second["unknown"]
+
+
+def test_time_series_keeps_whole_floats_as_floats():
+    rows = [{"timestamp": 1, "utcOffset": 0, "speed": 40.0}]
+
+    series = TimeSeries.from_rows(rows, WIND_FIELDS)
+
+    assert series[0]["speed"] == 40.0
+    assert isinstance(series[0]["speed"], float)
+
+
+def test_time_series_where_and_rows_by_day():
+    rows = [
+        {"timestamp": 1717243200 + hour * 3600, "utcOffset": 0, "speed": hour}
+        for hour in range(0, 24, 4)
+    ]
+    series = TimeSeries.from_rows(rows, WIND_FIELDS)
+
+    windy = series.where("speed", lambda speed: speed >= 8)
+    by_day = windy.rows_by_day()
+
+    assert [row["speed"] for row in windy] == [8, 12, 16, 20]
+    assert list(by_day) == ["2024-06-01", "2024-06-02"]
+    assert [row["time"] for row in by_day["2024-06-01"]] == ["20:00:00"]
+    assert [row["time"] for row in by_day["2024-06-02"]] == [
+        "00:00:00",
+        "04:00:00",
+        "08:00:00",
+    ]
+
+
+def test_build_report_series_splits_wave_into_surf_and_swells(load_json_fixture):
+    report_data = load_json_fixture("surfline/spot_report_endpoints.json")
+    original = copy.deepcopy(report_data)
+
+    series = build_report_series(report_data)
+
+    assert len(series["surf"]) == 2
+    assert len(series["swells"]) == 2  # zero-height swells are kept here
+    assert series["surf"][0]["humanRelation"] == "Fair"
+    assert report_data == original
+
+
+def test_columnar_spot_report_renders_like_raw_report(load_json_fixture):
+    report_data = load_json_fixture("surfline/spot_report_endpoints.json")
+    raw = SpotReport(spot_id="spot-1", days=1, report_data=report_data)
+    columnar = raw.to_columnar()
+
+    raw_output, columnar_output = io.StringIO(), io.StringIO()
+    display_spot_report(raw, output=raw_output)
+    display_spot_report(columnar, output=columnar_output)
+
+    assert columnar.report_data == {}
+    assert columnar.series is not None
+    assert set(columnar.series) == {
+        "surf",
+        "swells",
+        "weather",
+        "tides",
+        "wind",
+        "sunlight",
+    }
+    assert columnar_output.getvalue() == raw_output.getvalue()
+
+
+T0, T1, T2, T3 = (1717243200 + hour * 3600 for hour in range(4))
+
+
+def test_time_series_merge_replaces_overlapping_steps():
+    old = TimeSeries.from_rows(
+        [{"timestamp": ts, "utcOffset": 0, "speed": 1} for ts in (T0, T1, T2)],
+        WIND_FIELDS,
+    )
+    new = TimeSeries.from_rows(
+        [
+            {"timestamp": ts, "utcOffset": 0, "speed": 2, "directionType": "Onshore"}
+            for ts in (T1, T2, T3)
+        ],
+        WIND_FIELDS,
+    )
+
+    merged = old.merge(new)
+
+    assert list(merged.timestamps) == [T0, T1, T2, T3]
+    assert merged.values("speed", range(4)) == [1, 2, 2, 2]
+    assert merged[0].get("directionType") is None
+    assert merged[3]["directionType"] == "Onshore"
+    assert old.merge(TimeSeries.from_rows([], WIND_FIELDS)) is old
+
+
+def test_time_series_merge_sorts_out_of_order_windows():
+    late = TimeSeries.from_rows(
+        [{"timestamp": T2, "utcOffset": 0, "speed": 3}], WIND_FIELDS
+    )
+    early = TimeSeries.from_rows(
+        [{"timestamp": ts, "utcOffset": 0, "speed": 1} for ts in (T0, T1)],
+        WIND_FIELDS,
+    )
+
+    assert list(late.merge(early).timestamps) == [T0, T1, T2]
@@ -1,6 +1,9 @@
 from types import SimpleNamespace
 
-from surf_report.providers.surfline.ui import display_combined_spot_report
+from surf_report.providers.surfline.ui import (
+    display_combined_spot_report,
+    render_grouped_data,
+)
 
 
 def make_spot_report(load_json_fixture):
@@ -56,3 +59,34 @@ def test_display_combined_spot_report_prints_without_pager(
     output = capsys.readouterr().out
     assert "Overview Forecast:" in output
     assert "Surf:" in output
+
+
+def test_render_grouped_data_formats_selected_sections():
+    grouped = {
+        "2024-06-02": {
+            "surf": [
+                {"time": "00:00:00", "min": 1, "max": 2, "humanRelation": "Flat"},
+                {"time": "06:00:00", "min": 2, "max": 3, "humanRelation": "Fair"},
+            ],
+            "swells": [
+                {"time": "00:00:00", "height": 1.2, "direction": 270, "power": 40},
+                {"time": "06:00:00", "height": 1.5, "direction": 265, "power": None},
+            ],
+            "tides": [],
+        },
+        "2024-06-01": {"surf": [{"time": "00:00:00", "min": 1, "max": 2}]},
+    }
+
+    text = render_grouped_data(grouped, sections=["tides", "swells", "surf", "bogus"])
+
+    assert text == (
+        "\n2024-06-01\n"
+        + "-" * 30
+        + "\nSurf:\n"
+        + "\n2024-06-02\n"
+        + "-" * 30
+        + "\nSwells:\n"
+        + "  [06:00:00] Height: 1.5 FT, Direction: 265°, Power: None\n"
+        + "Surf:\n"
+        + "  [06:00:00] Min: 2 FT, Max: 3 FT, Condition: Fair\n"
+    )
@@ -0,0 +1,74 @@
+import pytest
+
+from tests.benchmarks import suite
+from tests.benchmarks.common import compare_results, print_diff, save_results
+
+BASELINE = {
+    "group/1d": {"best_us": 100.0, "median_us": 110.0},
+    "group/5d": {"best_us": 200.0, "median_us": 210.0},
+    "render/1d": {"best_us": 1000.0, "median_us": 1100.0},
+    "render/16d": {"best_us": 5000.0, "median_us": 5500.0},
+}
+
+
+def timings(**best_us):
+    return {
+        name.replace("_", "/"): {"best_us": value, "median_us": value}
+        for name, value in best_us.items()
+    }
+
+
+def test_compare_results_classifies_changes_at_threshold_edges():
+    current = timings(
+        group_1d=110.0,  # exactly +10%: still ok
+        group_5d=220.5,  # just past +10%
+        render_1d=900.0,  # exactly -10%: still ok
+    )
+    current["render/new"] = {"best_us": 1.0, "median_us": 1.0}
+
+    rows = compare_results(BASELINE, current, threshold=0.1)
+
+    assert rows == [
+        ("group/1d", 100.0, 110.0, "ok"),
+        ("group/5d", 200.0, 220.5, "regression"),
+        ("render/1d", 1000.0, 900.0, "ok"),
+        ("render/new", None, 1.0, "new"),
+        ("render/16d", 5000.0, None, "missing"),
+    ]
+
+
+def test_compare_results_reports_improvements():
+    rows = compare_results(BASELINE, timings(group_1d=89.0), threshold=0.1)
+
+    assert rows[0] == ("group/1d", 100.0, 89.0, "improved")
+    assert {verdict for *_, verdict in rows[1:]} == {"missing"}
+
+
+def test_print_diff_groups_rows_by_stage(capsys):
+    rows = [
+        ("group/1d", 100.0, 150.0, "regression"),
+        ("group/5d", None, 2500.0, "new"),
+        ("render/1d", 1000.0, None, "missing"),
+    ]
+
+    print_diff(rows)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "group"
+    assert "100.00 us ->    150.00 us" in lines[1]
+    assert lines[1].split()[-2:] == ["+50.0%", "regression"]
+    assert "- ->      2.50 ms" in lines[2] and lines[2].endswith("new")
+    assert lines[3] == "render"
+    assert lines[4].endswith("missing") and "%" not in lines[4]
+
+
+@pytest.mark.parametrize(("best_us", "status"), [(114.0, 0), (116.0, 1), (50.0, 0)])
+def test_suite_exits_with_1_only_on_regression(
+    monkeypatch, tmp_path, capsys, best_us, status
+):
+    baseline = tmp_path / "baseline.json"
+    save_results(baseline, timings(group_1d=100.0))
+    monkeypatch.setattr(suite, "run", lambda quick: timings(group_1d=best_us))
+
+    assert suite.main(["--baseline", str(baseline)]) == status
+    assert "group/1d" in capsys.readouterr().out
@@ -1,9 +1,12 @@
+import json
 from types import SimpleNamespace
 
 import pytest
 
-from surf_report.main import handle_search, main as cli_main
+from surf_report.main import browse_regions, handle_search, main as cli_main
 from surf_report.providers.surfline.models import SurflineSearchResult
+from surf_report.providers.surfline.taxonomy import TaxonomyIndex
+from surf_report.utils.cache import RevalidationStats
 
 
 def test_handle_search_returns_none_when_no_results(monkeypatch, capsys):
@@ -52,23 +55,26 @@ def test_handle_search_prompts_for_selection(monkeypatch, capsys):
 
 
 def test_main_fetches_spot_data_when_search_succeeds(monkeypatch, make_args):
-    args = make_args(search=True, search_string="mav", days=2)
+    args = make_args(search=True, search_string="mav", days=2, sections=["wind"])
     monkeypatch.setattr("surf_report.main.parse_arguments", lambda: args)
     monkeypatch.setattr("surf_report.main.handle_search", lambda search: "spot-9")
 
     forecast = SimpleNamespace(forecast_data={"data": {}})
     report = SimpleNamespace(report_data={})
+    called = {}
+
+    def fake_get_spot_report(spot_id, days, sections):
+        called["report"] = (spot_id, days, sections)
+        return report
 
     fake_api = SimpleNamespace(
         get_spot_forecast=lambda spot_id, days: forecast,
-        get_spot_report=lambda spot_id, days: report,
+        get_spot_report=fake_get_spot_report,
     )
     monkeypatch.setattr("surf_report.main.surfline", fake_api)
 
-    called = {}
-
-    def fake_display(forecast_arg, report_arg):
-        called["display"] = (forecast_arg, report_arg)
+    def fake_display(forecast_arg, report_arg, sections):
+        called["display"] = (forecast_arg, report_arg, sections)
 
     monkeypatch.setattr(
         "surf_report.main.display_combined_spot_report",
@@ -77,7 +83,8 @@ def test_main_fetches_spot_data_when_search_succeeds(monkeypatch, make_args):
 
     cli_main()
 
-    assert called["display"] == (forecast, report)
+    assert called["report"] == ("spot-9", 2, ["wind"])
+    assert called["display"] == (forecast, report, ["wind"])
 
 
 def test_main_skips_fetch_when_handle_search_returns_none(monkeypatch, make_args):
@@ -95,3 +102,339 @@ def test_main_skips_fetch_when_handle_search_returns_none(monkeypatch, make_args
     monkeypatch.setattr("surf_report.main.surfline", fake_api)
 
     cli_main()
+
+
+def test_browse_regions_navigates_from_snapshot(monkeypatch, make_args, capsys):
+    taxonomy = TaxonomyIndex()
+    taxonomy.add_document(
+        taxonomy.root_id,
+        {
+            "contains": [
+                {"_id": "ca", "name": "California", "type": "geoname", "depth": 0},
+                {
+                    "_id": "ob",
+                    "name": "Ocean Beach",
+                    "type": "spot",
+                    "spot": "spot-ob",
+                    "depth": 1,
+                    "liesIn": ["ca"],
+                },
+            ]
+        },
+        max_depth=1,
+    )
+    taxonomy.save()
+
+    def unexpected_call(*args, **kwargs):
+        raise AssertionError("Taxonomy should be served from the snapshot")
+
+    forecasts = []
+    fake_api = SimpleNamespace(
+        get_taxonomy=unexpected_call,
+        get_spot_forecast=lambda spot_id: forecasts.append(spot_id),
+    )
+    monkeypatch.setattr("surf_report.main.surfline", fake_api)
+    choices = iter([1, 1, 0, 0])
+
+    def fake_choice(options):
+        try:
+            return next(choices)
+        except StopIteration:
+            raise SystemExit(0)
+
+    monkeypatch.setattr("surf_report.main.get_user_choice", fake_choice)
+
+    with pytest.raises(SystemExit):
+        browse_regions(make_args())
+
+    output = capsys.readouterr().out
+    assert "California (geoname)" in output
+    assert "Ocean Beach (spot)" in output
+    assert forecasts == ["spot-ob"]
+
+
+def test_main_batch_streams_reports_for_spots_file(
+    monkeypatch, make_args, tmp_path, capsys
+):
+    spots_file = tmp_path / "spots.txt"
+    spots_file.write_text("spot-1\n# comment\n\nspot-2  # trailing\n", encoding="utf-8")
+    args = make_args(
+        command="batch",
+        spots_file=str(spots_file),
+        days=2,
+        concurrency=4,
+        rate_limit=None,
+        format="text",
+        output=None,
+    )
+    monkeypatch.setattr("surf_report.main.parse_arguments", lambda: args)
+    requested = {}
+
+    def fake_get_spot_reports(spot_ids, days, max_concurrency, columnar, sections):
+        requested.update(
+            spot_ids=spot_ids, days=days, cap=max_concurrency, columnar=columnar
+        )
+        for spot_id in spot_ids:
+            yield SimpleNamespace(spot_id=spot_id, report_data={})
+
+    monkeypatch.setattr(
+        "surf_report.main.surfline",
+        SimpleNamespace(
+            get_spot_reports=fake_get_spot_reports,
+            revalidation=RevalidationStats(),
+        ),
+    )
+
+    cli_main()
+
+    assert requested == {
+        "spot_ids": ["spot-1", "spot-2"],
+        "days": 2,
+        "cap": 4,
+        "columnar": True,
+    }
+    output = capsys.readouterr().out
+    assert "##### spot-1 #####" in output
+    assert "##### spot-2 #####" in output
+
+
+def test_main_batch_exports_jsonl_to_output_file(
+    monkeypatch, make_args, tmp_path, load_json_fixture, capsys
+):
+    spots_file = tmp_path / "spots.txt"
+    spots_file.write_text("spot-1\nspot-2\n", encoding="utf-8")
+    output_file = tmp_path / "reports.jsonl"
+    args = make_args(
+        command="batch",
+        spots_file=str(spots_file),
+        concurrency=4,
+        rate_limit=None,
+        format="jsonl",
+        output=str(output_file),
+    )
+    monkeypatch.setattr("surf_report.main.parse_arguments", lambda: args)
+    payload = load_json_fixture("surfline/spot_report_endpoints.json")
+
+    stats = RevalidationStats()
+
+    def fake_get_spot_reports(spot_ids, days, max_concurrency, columnar, sections):
+        for spot_id in spot_ids:
+            stats.record(conditional=True, not_modified=spot_id == "spot-1")
+            yield SimpleNamespace(spot_id=spot_id, report_data=payload)
+
+    monkeypatch.setattr(
+        "surf_report.main.surfline",
+        SimpleNamespace(get_spot_reports=fake_get_spot_reports, revalidation=stats),
+    )
+
+    cli_main()
+
+    lines = output_file.read_text(encoding="utf-8").splitlines()
+    spot_ids = [json.loads(line)["spot_id"] for line in lines]
+    assert spot_ids[0] == "spot-1" and spot_ids[-1] == "spot-2"
+    assert set(spot_ids) == {"spot-1", "spot-2"}
+    assert "1 of 2 requests unchanged (304, 50%)" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("output_format", ["csv", "text"])
+def test_main_batch_renders_in_worker_processes(
+    monkeypatch, make_args, tmp_path, load_json_fixture, output_format
+):
+    from surf_report.providers.surfline.models import SpotReport
+
+    spots_file = tmp_path / "spots.txt"
+    spots_file.write_text("spot-1\nspot-2\nspot-3\n", encoding="utf-8")
+    payload = load_json_fixture("surfline/spot_report_endpoints.json")
+
+    def fake_get_spot_reports(spot_ids, days, max_concurrency, columnar, sections):
+        for spot_id in spot_ids:
+            yield SpotReport(spot_id, days, payload).to_columnar()
+
+    monkeypatch.setattr(
+        "surf_report.main.surfline",
+        SimpleNamespace(
+            get_spot_reports=fake_get_spot_reports, revalidation=RevalidationStats()
+        ),
+    )
+    outputs = []
+    for workers in (0, 2):
+        output_file = tmp_path / f"reports-{workers}.{output_format}"
+        args = make_args(
+            command="batch",
+            spots_file=str(spots_file),
+            concurrency=4,
+            rate_limit=None,
+            format=output_format,
+            output=str(output_file),
+            workers=workers,
+            chunk_size=2,
+        )
+        monkeypatch.setattr("surf_report.main.parse_arguments", lambda args=args: args)
+        cli_main()
+        outputs.append(output_file.read_bytes())
+
+    assert outputs[1] == outputs[0]
+    if output_format == "csv":
+        assert outputs[0].count(b"spot_id") == 1
+
+
+def test_main_batch_parquet_requires_output(monkeypatch, make_args, tmp_path):
+    spots_file = tmp_path / "spots.txt"
+    spots_file.write_text("spot-1\n", encoding="utf-8")
+    args = make_args(
+        command="batch",
+        spots_file=str(spots_file),
+        concurrency=4,
+        rate_limit=None,
+        format="parquet",
+        output=None,
+    )
+    monkeypatch.setattr("surf_report.main.parse_arguments", lambda: args)
+    monkeypatch.setattr(
+        "surf_report.main.surfline",
+        SimpleNamespace(
+            get_spot_reports=lambda *args, **kwargs: iter(()),
+            revalidation=RevalidationStats(),
+        ),
+    )
+
+    with pytest.raises(SystemExit, match="--output"):
+        cli_main()
+
+
+def test_main_search_uses_running_daemon(monkeypatch, make_args):
+    args = make_args(search=True, search_string="mav", days=2)
+    monkeypatch.setattr("surf_report.main.parse_arguments", lambda: args)
+    monkeypatch.setattr("surf_report.main.surfline", None)
+    monkeypatch.setattr("surf_report.main.handle_search", lambda search: "spot-9")
+    monkeypatch.setattr(
+        "surf_report.main.display_combined_spot_report", lambda *a, **k: None
+    )
+    fetched = []
+    daemon_client = SimpleNamespace(
+        get_spot_forecast=lambda spot_id, days: fetched.append(("forecast", spot_id)),
+        get_spot_report=lambda spot_id, days, sections: fetched.append(
+            ("report", spot_id)
+        ),
+    )
+    monkeypatch.setattr(
+        "surf_report.providers.surfline.daemon_client.connect", lambda: daemon_client
+    )
+    monkeypatch.setattr(
+        TaxonomyIndex,
+        "load",
+        classmethod(lambda cls: pytest.fail("daemon owns the search index")),
+    )
+
+    cli_main()
+
+    assert fetched == [("forecast", "spot-9"), ("report", "spot-9")]
+
+
+def test_main_prefetch_once_then_status(monkeypatch, make_args, tmp_path, capsys):
+    favourites = tmp_path / "favourites.txt"
+    favourites.write_text("spot-1\nspot-2\n", encoding="utf-8")
+    args = make_args(
+        command="prefetch",
+        favourites=str(favourites),
+        interval=15,
+        rate_limit=2.0,
+        once=True,
+        status=False,
+    )
+    monkeypatch.setattr("surf_report.main.parse_arguments", lambda: args)
+    fetched = []
+
+    def fake_forecast(spot_id, days):
+        fetched.append(spot_id)
+        return None if spot_id == "spot-2" else SimpleNamespace()
+
+    api = SimpleNamespace(
+        get_spot_forecast=fake_forecast,
+        get_spot_report=lambda spot_id, days: SimpleNamespace(report_data={}),
+    )
+    monkeypatch.setattr(
+        "surf_report.providers.surfline.prefetch.prefetch_client",
+        lambda cache, **kwargs: api,
+    )
+
+    cli_main()
+    args.once, args.status = False, True
+    cli_main()
+
+    out = capsys.readouterr().out.splitlines()
+    assert fetched == ["spot-1", "spot-2"]
+    assert out[0] == "Prefetched 1 of 2 spots."
+    assert out[1].startswith("spot-1  refreshed 0m ago  failures 0")
+    assert out[2].endswith("failures 1 (total 1)  last error: no data for forecast")
+
+
+def test_main_batch_writes_metrics_and_stats(monkeypatch, make_args, tmp_path, capsys):
+    from surf_report.utils.metrics import RequestMetrics, RequestSample
+
+    spots_file = tmp_path / "spots.txt"
+    spots_file.write_text("spot-1\n", encoding="utf-8")
+    metrics_file = tmp_path / "surfreport.prom"
+    args = make_args(
+        command="batch",
+        spots_file=str(spots_file),
+        concurrency=4,
+        rate_limit=None,
+        format="jsonl",
+        output=str(tmp_path / "out.jsonl"),
+        metrics_file=str(metrics_file),
+        stats=True,
+    )
+    monkeypatch.setattr("surf_report.main.parse_arguments", lambda: args)
+    metrics = RequestMetrics()
+
+    def fake_get_spot_reports(spot_ids, days, max_concurrency, columnar, sections):
+        metrics.record(RequestSample("kbyg/wave", cache="miss", status=200))
+        return iter(())
+
+    monkeypatch.setattr(
+        "surf_report.main.surfline",
+        SimpleNamespace(
+            get_spot_reports=fake_get_spot_reports,
+            revalidation=RevalidationStats(),
+            metrics=metrics,
+        ),
+    )
+
+    cli_main()
+
+    assert "surfreport_requests_total" in metrics_file.read_text(encoding="utf-8")
+    assert "kbyg/wave" in capsys.readouterr().err.splitlines()[1]
+
+
+def test_main_rank_lists_best_spots_in_region(monkeypatch, make_args, capsys):
+    from surf_report.providers.surfline.fake_server import FakeSurflineServer
+    from surf_report.providers.surfline.surfline import SurflineAPI
+
+    args = make_args(
+        command="rank",
+        region="node-2-1",
+        top=3,
+        days=1,
+        hours=None,
+        interval=3,
+        concurrency=8,
+        max_age=24,
+    )
+    monkeypatch.setattr("surf_report.main.parse_arguments", lambda: args)
+
+    with FakeSurflineServer() as fake:
+        api = SurflineAPI(base_url=fake.base_url)
+        monkeypatch.setattr("surf_report.main.surfline", api)
+        cli_main()
+        args.region = "subregion 2-1-3"  # a name from the saved snapshot
+        cli_main()
+        api.close()
+
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == "Ranked 16 spots in node-2-1."
+    assert "Ranked 4 spots in Subregion 2-1-3." in out
+    ranks = [line.split(".")[0].strip() for line in out if ". Spot " in line]
+    assert ranks == ["1", "2", "3"] * 2
+    taxonomy = TaxonomyIndex.load()
+    assert taxonomy is not None and "node-2-1-3" in taxonomy
@@ -0,0 +1,131 @@
+"""Startup cost guard: `surfreport --help` must stay cheap to launch."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+# Cumulative import time of surf_report.main, in microseconds. Currently
+# ~25ms; the budget leaves room for slow CI machines while still catching
+# an eager import of the HTTP stack (~100ms on its own).
+IMPORT_BUDGET_US = 80_000
+
+# Modules that only commands talking to the network or cache should load.
+DEFERRED_MODULES = (
+    "requests",
+    "urllib3",
+    "sqlite3",
+    "surf_report.providers.surfline.surfline",
+    "surf_report.utils.cache",
+)
+
+HELP_SCRIPT = (
+    "import sys; sys.argv = ['surfreport', '--help']\n"
+    "from surf_report.main import main\n"
+    "main()\n"
+)
+
+
+def run_help_with_importtime(cwd):
+    env = dict(os.environ)
+    env.pop("SURFREPORT_LOG_FILE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", HELP_SCRIPT],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    # argparse exits with status 0 after printing help.
+    assert result.returncode == 0, result.stderr
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        imports[name.strip()] = int(cumulative)
+    return result, imports
+
+
+def test_help_does_not_import_network_stack(tmp_path):
+    result, imports = run_help_with_importtime(tmp_path)
+
+    assert "usage:" in result.stdout
+    loaded = [name for name in DEFERRED_MODULES if name in imports]
+    assert loaded == []
+
+
+def test_help_does_not_create_log_file(tmp_path):
+    run_help_with_importtime(tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_help_import_time_within_budget(tmp_path):
+    # Take the best of a few runs to smooth over a noisy machine.
+    timings = [
+        run_help_with_importtime(tmp_path)[1]["surf_report.main"] for _ in range(3)
+    ]
+
+    assert min(timings) < IMPORT_BUDGET_US, (
+        f"importing surf_report.main took {min(timings) / 1000:.1f}ms "
+        f"(budget {IMPORT_BUDGET_US / 1000:.0f}ms); run "
+        "`python -X importtime -c 'import surf_report.main'` to find the culprit"
+    )
+
+
+DAEMON_SCRIPT = (
+    "import sys\n"
+    "sys.argv = ['surfreport'] + sys.argv[1:]\n"
+    "from surf_report.main import main\n"
+    "try:\n"
+    "    main()\n"
+    "except EOFError:\n"  # the menus ran out of input
+    "    pass\n"
+    "print('requests loaded:', 'requests' in sys.modules)\n"
+)
+
+
+@pytest.mark.parametrize("argv", [["-s", "pipeline"], []], ids=["search", "browse"])
+def test_daemon_backed_run_does_not_import_network_stack(argv):
+    from surf_report.providers.surfline.daemon import build_server
+    from surf_report.providers.surfline.fake_server import FakeSurflineServer
+    from surf_report.providers.surfline.surfline import SurflineAPI
+
+    # Unix socket paths are limited to ~100 bytes, so avoid pytest's tmp_path.
+    directory = Path(tempfile.mkdtemp(prefix="sr-"))
+    with FakeSurflineServer() as fake:
+        api = SurflineAPI(base_url=fake.base_url)
+        server = build_server(api, socket_path=directory / "d.sock")
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        thread.start()
+        env = dict(os.environ, SURFREPORT_SOCKET=str(directory / "d.sock"))
+        env.pop("SURFREPORT_LOG_FILE", None)
+        try:
+            result = subprocess.run(
+                [sys.executable, "-c", DAEMON_SCRIPT, *argv],
+                cwd=directory,
+                env=env,
+                input="",
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+            api.close()
+            shutil.rmtree(directory, ignore_errors=True)
+
+    assert result.returncode == 0, result.stderr
+    assert fake.requests, "the run should have gone through the daemon"
+    assert "requests loaded: False" in result.stdout
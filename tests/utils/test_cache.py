@@ -0,0 +1,131 @@
+import sqlite3
+
+from surf_report.utils import cache as cache_module
+from surf_report.utils.cache import ResponseCache, make_cache_key
+
+
+def test_make_cache_key_ignores_param_order():
+    first = make_cache_key("https://example.com", {"a": 1, "b": 2})
+    second = make_cache_key("https://example.com", {"b": 2, "a": 1})
+
+    assert first == second
+    assert first != make_cache_key("https://example.com", {"a": 2, "b": 2})
+
+
+def test_response_cache_round_trips_values(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    cache.set("key", "https://example.com", {"data": [1, 2, 3]}, ttl=60)
+
+    assert cache.get("key") == {"data": [1, 2, 3]}
+    assert cache.get("missing") is None
+
+
+def test_response_cache_expires_entries(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    now = 1_000_000.0
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    cache.set("key", "https://example.com", {"ok": True}, ttl=60)
+
+    now += 61
+
+    assert cache.get("key") is None
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    clock = iter(range(1_000_000, 1_000_100))
+    monkeypatch.setattr(cache_module.time, "time", lambda: float(next(clock)))
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_bytes=70)
+    payload = {"blob": "x" * 10}  # 21 bytes once serialized
+
+    cache.set("a", "https://example.com/a", payload, ttl=600)
+    cache.set("b", "https://example.com/b", payload, ttl=600)
+    cache.set("c", "https://example.com/c", payload, ttl=600)
+    assert cache.get("a") == payload  # "b" is now least recently used
+    cache.set("d", "https://example.com/d", payload, ttl=600)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == payload
+    assert cache.get("d") == payload
+
+
+def test_response_cache_clear_removes_everything(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    cache.set("key", "https://example.com", {"ok": True}, ttl=60)
+
+    cache.clear()
+
+    assert cache.get("key") is None
+
+
+def test_response_cache_defaults_to_user_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SURFREPORT_CACHE_DIR", str(tmp_path / "custom"))
+
+    assert ResponseCache().path == tmp_path / "custom" / cache_module.CACHE_FILENAME
+
+
+def test_response_cache_keeps_validators_of_expired_entries(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    now = 1_000_000.0
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    cache.set("key", "https://example.com", {"ok": True}, ttl=60, etag='"v1"')
+
+    now += 61
+    entry = cache.get_entry("key")
+
+    assert entry is not None and not entry.fresh
+    assert entry.value == {"ok": True}
+    assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+
+    cache.renew("key", ttl=60)
+
+    assert cache.get("key") == {"ok": True}
+
+
+def test_response_cache_adds_validator_columns_to_old_databases(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE responses (key TEXT PRIMARY KEY, url TEXT NOT NULL, "
+        "body TEXT NOT NULL, size INTEGER NOT NULL, expires_at REAL NOT NULL, "
+        "last_access REAL NOT NULL)"
+    )
+    conn.commit()
+    conn.close()
+
+    cache = ResponseCache(path)
+    cache.set("key", "https://example.com", [1], ttl=60, last_modified="yesterday")
+
+    entry = cache.get_entry("key")
+    assert entry is not None
+    assert entry.conditional_headers() == {"If-Modified-Since": "yesterday"}
+
+
+def test_response_cache_only_scans_for_eviction_over_budget(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_bytes=100)
+    cache.set("a", "https://example.com/a", {"blob": "x" * 10}, ttl=600)
+    statements = []
+    cache._connection().set_trace_callback(statements.append)
+
+    cache.set("a", "https://example.com/a", {"blob": "y" * 10}, ttl=600)
+    cache.set("b", "https://example.com/b", {"blob": "x" * 10}, ttl=600)
+    cache.set("c", "https://example.com/c", {"blob": "x" * 10}, ttl=600)
+    scans = [sql for sql in statements if "SUM(size)" in sql or "ORDER BY" in sql]
+    assert scans == []
+
+    cache.set("d", "https://example.com/d", {"blob": "x" * 50}, ttl=600)
+
+    assert cache.get("a") is None  # least recently used, evicted
+    assert cache.get("d") is not None
+    stored = cache._connection().execute("SELECT SUM(size) FROM responses")
+    assert stored.fetchone()[0] == cache._total_bytes <= 100
+
+
+def test_response_cache_indexes_last_access(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    cache.set("key", "https://example.com", [1], ttl=60)
+
+    plan = cache._connection().execute(
+        "EXPLAIN QUERY PLAN SELECT key, size FROM responses ORDER BY last_access"
+    )
+
+    assert any("responses_last_access" in row[-1] for row in plan)
@@ -0,0 +1,96 @@
+import pytest
+
+from surf_report.utils.helpers import (
+    convert_timestamp_to_datetime,
+    convert_timestamps_to_day_time,
+    parse_arguments,
+)
+
+
+def test_parse_arguments_defaults_to_browse_mode():
+    args = parse_arguments(["-s", "mavericks", "--days", "2"])
+
+    assert args.command is None
+    assert args.search
+    assert args.search_string == "mavericks"
+    assert args.days == 2
+
+
+def test_parse_arguments_dispatches_commands():
+    args = parse_arguments(["taxonomy", "sync", "--depth", "3", "--no-cache"])
+
+    assert args.command == "taxonomy"
+    assert args.action == "sync"
+    assert args.depth == 3
+    assert args.no_cache
+
+
+def test_parse_arguments_batch_export_options():
+    args = parse_arguments(["batch", "--spots-file", "-", "-f", "csv", "-o", "x.csv"])
+
+    assert args.format == "csv"
+    assert args.output == "x.csv"
+    assert parse_arguments(["batch", "--spots-file", "-"]).format == "text"
+
+
+def test_parse_arguments_sections():
+    args = parse_arguments(["-s", "mavericks", "--sections", "wind, tides"])
+    batch = parse_arguments(["batch", "--spots-file", "-", "--sections", "swells"])
+
+    assert args.sections == ["wind", "tides"]
+    assert batch.sections == ["swells"]
+    assert parse_arguments([]).sections is None
+    with pytest.raises(SystemExit):
+        parse_arguments(["--sections", "wind,waves"])
+
+
+def test_parse_arguments_serve_options():
+    args = parse_arguments(["serve", "--port", "8787"])
+
+    assert args.command == "serve"
+    assert args.port == 8787
+    assert args.socket is None
+    assert not args.prefetch
+
+
+def test_parse_arguments_prefetch_options():
+    args = parse_arguments(["prefetch", "--once", "--interval", "5", "-d", "5"])
+
+    assert args.command == "prefetch"
+    assert args.once and not args.status
+    assert args.interval == 5
+    assert args.days == 5
+    assert args.favourites is None
+    with pytest.raises(SystemExit):
+        parse_arguments(["prefetch", "--once", "--status"])
+
+
+def test_parse_arguments_rank_options():
+    args = parse_arguments(["rank", "North Orange County", "-k", "5", "--hours", "6"])
+
+    assert args.command == "rank"
+    assert args.region == "North Orange County"
+    assert args.top == 5
+    assert args.hours == 6
+    assert args.days == 1
+    assert args.concurrency == 32
+
+
+def test_convert_timestamps_to_day_time_matches_scalar_conversion():
+    timestamps = [0, 1717221600, 1717243199, 1717286400, 1735689599, 1735689600]
+    for utc_offset in (-10, -7, 0, 5.5, 9.75, 14):
+        days, times = convert_timestamps_to_day_time(
+            timestamps, [utc_offset] * len(timestamps)
+        )
+        expected = [
+            convert_timestamp_to_datetime(timestamp, utc_offset).split()[1:3]
+            for timestamp in timestamps
+        ]
+        assert [list(pair) for pair in zip(days, times)] == expected
+
+
+def test_convert_timestamps_to_day_time_handles_mixed_offsets():
+    days, times = convert_timestamps_to_day_time([1717243200, 1717243200], [-8, 2])
+
+    assert days == ["2024-06-01", "2024-06-01"]
+    assert times == ["04:00:00", "14:00:00"]
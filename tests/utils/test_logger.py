@@ -0,0 +1,49 @@
+import logging
+import logging.handlers
+
+from surf_report.utils import logger as logger_module
+from surf_report.utils.logger import setup_logger
+
+
+def test_setup_logger_reads_level_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv(logger_module.ENV_LOG_LEVEL, "debug")
+
+    log = setup_logger("surf_report.tests.env_level", log_file=str(tmp_path / "a.log"))
+
+    assert log.level == logging.DEBUG
+
+
+def test_setup_logger_defaults_to_warning(monkeypatch):
+    monkeypatch.delenv(logger_module.ENV_LOG_LEVEL, raising=False)
+
+    log = setup_logger("surf_report.tests.default_level", log_file="")
+
+    assert log.level == logging.WARNING
+    assert not log.isEnabledFor(logging.DEBUG)
+
+
+def test_setup_logger_can_disable_file_logging(monkeypatch, tmp_path):
+    monkeypatch.setenv(logger_module.ENV_LOG_FILE, "")
+    monkeypatch.chdir(tmp_path)
+    log = logging.getLogger("surf_report.tests.no_file")
+    log.propagate = False
+
+    setup_logger(log.name)
+
+    assert log.handlers == []
+    assert not (tmp_path / logger_module.LOG_FILE).exists()
+
+
+def test_setup_logger_queue_mode_writes_from_background_thread(tmp_path):
+    log_path = tmp_path / "queued.log"
+    log = logging.getLogger("surf_report.tests.queued")
+    log.propagate = False
+
+    setup_logger(log.name, level=logging.INFO, log_file=str(log_path), use_queue=True)
+    log.info("queued %s", "message")
+    logger_module._stop_queue_listener()
+
+    assert isinstance(log.handlers[0], logging.handlers.QueueHandler)
+    assert "queued message" in log_path.read_text(encoding="utf-8")
+    for handler in log.handlers:
+        log.removeHandler(handler)
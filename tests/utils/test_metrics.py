@@ -0,0 +1,58 @@
+from surf_report.utils.metrics import Histogram, RequestMetrics, RequestSample
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+    for value in (0.005, 0.05, 0.05, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(0.01, 1), (0.1, 3), (1.0, 4), (float("inf"), 5)]
+    assert histogram.count == 5
+    assert histogram.max == 2.0
+    assert 0.01 < histogram.quantile(0.5) <= 0.1
+    assert histogram.quantile(0.99) == 2.0
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_request_metrics_aggregates_per_endpoint():
+    metrics = RequestMetrics()
+    metrics.record(
+        RequestSample(
+            "kbyg/wave", cache="miss", status=200, bytes=2048, ttfb=0.2, total=0.3
+        )
+    )
+    metrics.record(RequestSample("kbyg/wave", cache="hit", parse=0.001, total=0.002))
+    metrics.record(RequestSample("kbyg/wind", cache="miss", retries=2, total=1.5))
+
+    assert len(metrics) == 3
+    lines = metrics.summary().splitlines()
+    # Slowest endpoint first; the failed wind request counts as an error.
+    assert lines[1].split()[:4] == ["kbyg/wind", "1", "0", "1"]
+    assert lines[2].split()[:4] == ["kbyg/wave", "2", "1", "0"]
+
+
+def test_request_metrics_prometheus_export():
+    metrics = RequestMetrics()
+    metrics.record(
+        RequestSample("search", cache="miss", status=200, bytes=10, total=0.004)
+    )
+    metrics.record(RequestSample("search", cache="revalidated", status=304, total=0.3))
+
+    text = metrics.to_prometheus()
+
+    assert "# TYPE surfreport_request_duration_seconds histogram" in text
+    assert (
+        'surfreport_request_duration_seconds_bucket{endpoint="search",'
+        'phase="total",le="0.005"} 1'
+    ) in text
+    assert (
+        'surfreport_request_duration_seconds_bucket{endpoint="search",'
+        'phase="total",le="+Inf"} 2'
+    ) in text
+    assert 'surfreport_requests_total{endpoint="search",status="304"} 1' in text
+    assert (
+        'surfreport_cache_lookups_total{endpoint="search",result="revalidated"} 1'
+        in text
+    )
+    assert 'surfreport_response_bytes_total{endpoint="search"} 10' in text
+    assert 'phase="ttfb"' not in text  # no sample had that phase
@@ -0,0 +1,192 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, cast
+
+import pytest
+import requests
+
+from surf_report.providers.surfline.surfline import SurflineAPI
+from surf_report.utils import transport as transport_module
+from surf_report.utils.transport import (
+    HostRateLimiter,
+    SingleFlight,
+    TransportPolicy,
+)
+
+
+@pytest.fixture
+def flaky_server():
+    """Local server answering 503 (with Retry-After) before succeeding."""
+    state = {"calls": 0, "failures": 2}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state["calls"] += 1
+            if state["calls"] <= state["failures"]:
+                self.send_response(503)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/", state
+    server.shutdown()
+    server.server_close()
+
+
+def fast_policy(**overrides):
+    options: Dict[str, Any] = dict(backoff_factor=0, backoff_jitter=0, read_timeout=2)
+    options.update(overrides)
+    return TransportPolicy(**options)
+
+
+def test_build_retry_honours_policy():
+    retry = TransportPolicy(max_retries=5, retry_statuses=(429,)).build_retry()
+
+    assert retry.total == 5
+    assert retry.status_forcelist == (429,)
+    assert retry.respect_retry_after_header
+
+
+def test_mount_sizes_pool_to_concurrency():
+    session = requests.Session()
+
+    adapter = TransportPolicy(pool_maxsize=4).mount(session, pool_maxsize=32)
+
+    assert session.get_adapter("https://services.surfline.com") is adapter
+    assert adapter._pool_maxsize == 32
+
+
+def test_api_retries_retryable_statuses(flaky_server):
+    url, state = flaky_server
+    api = SurflineAPI(transport=fast_policy(max_retries=3))
+
+    assert api._get(url, {}) == {"ok": True}
+    assert state["calls"] == 3
+
+
+def test_api_gives_up_after_max_retries(flaky_server):
+    url, state = flaky_server
+    state["failures"] = 10
+    api = SurflineAPI(transport=fast_policy(max_retries=1))
+
+    assert api._get(url, {}) is None
+    assert state["calls"] == 2
+
+
+def test_api_passes_timeouts_to_session():
+    seen = {}
+
+    class RecordingSession:
+        headers = {}
+
+        def get(self, url, params, timeout, headers=None):
+            seen["timeout"] = timeout
+            raise requests.exceptions.Timeout("too slow")
+
+    api = SurflineAPI(
+        session=cast(requests.Session, RecordingSession()),
+        transport=TransportPolicy(connect_timeout=1, read_timeout=7),
+    )
+
+    assert api._get("https://example.com", {}) is None
+    assert seen["timeout"] == (1, 7)
+
+
+def test_rate_limiter_spaces_requests_per_host(monkeypatch):
+    clock = {"now": 100.0}
+    sleeps = []
+    monkeypatch.setattr(transport_module.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(transport_module.time, "sleep", sleeps.append)
+    monkeypatch.setattr(transport_module.random, "uniform", lambda a, b: 0.0)
+    limiter = HostRateLimiter(rate=2, burst=2)
+
+    waits = [limiter.acquire("https://a.example/x") for _ in range(4)]
+    other_host = limiter.acquire("https://b.example/x")
+
+    assert waits == [0.0, 0.0, 0.5, 1.0]
+    assert other_host == 0.0
+    assert sleeps == [0.5, 1.0]
+
+
+def wait_for_waiters(flight, key, count):
+    for _ in range(500):
+        if flight.waiting(key) == count:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError(f"expected {count} waiters on {key!r}")
+
+
+def test_single_flight_shares_one_call_between_concurrent_callers():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait(5)
+        return {"value": 42}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", work)))
+        for _ in range(4)
+    ]
+    threads[0].start()
+    while not calls:
+        threading.Event().wait(0.001)
+    for thread in threads[1:]:
+        thread.start()
+    wait_for_waiters(flight, "k", 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 4 and all(result is results[0] for result in results)
+    assert flight.shared == 3
+    # Completed calls are forgotten.
+    assert flight.do("k", lambda: "again") == "again"
+
+
+def test_single_flight_propagates_errors_to_waiters():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do("k", fail)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    wait_for_waiters(flight, "k", 1)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert len(errors) == 2 and errors[0] is errors[1]
@@ -1,3 +1,4 @@
+import threading
 from types import SimpleNamespace
 
 from surf_report.utils import user_agent
@@ -13,7 +14,7 @@ class DummyResponse:
             raise Exception("HTTP error")
 
 
-def test_get_user_agent_fetches_first_entry(monkeypatch, load_text_fixture):
+def test_refresh_user_agent_fetches_first_entry(monkeypatch, load_text_fixture):
     monkeypatch.delenv(user_agent.ENV_USER_AGENT, raising=False)
     user_agent.clear_cached_user_agent()
     html = load_text_fixture("useragents_me_sample.html")
@@ -24,9 +25,49 @@ def test_get_user_agent_fetches_first_entry(monkeypatch, load_text_fixture):
         SimpleNamespace(get=lambda url, timeout: DummyResponse(html)),
     )
 
-    ua = user_agent.get_user_agent()
+    ua = user_agent.refresh_user_agent()
+    assert ua is not None
     assert "Windows NT 10.0" in ua
     assert "\n" not in ua
+    assert user_agent.get_user_agent() == ua
+
+
+def test_get_user_agent_does_not_wait_for_network(monkeypatch, load_text_fixture):
+    monkeypatch.delenv(user_agent.ENV_USER_AGENT, raising=False)
+    user_agent.clear_cached_user_agent()
+    html = load_text_fixture("useragents_me_sample.html")
+    release = threading.Event()
+
+    def slow_get(url, timeout):
+        release.wait(5)
+        return DummyResponse(html)
+
+    monkeypatch.setattr(user_agent, "requests", SimpleNamespace(get=slow_get))
+
+    # Cold start: the default is returned while the fetch runs in the background.
+    assert user_agent.get_user_agent() == user_agent.DEFAULT_USER_AGENT
+    release.set()
+    user_agent.refresh_user_agent_in_background().join(5)
+
+    user_agent.clear_cached_user_agent()
+    # The next process start is served from the cache file.
+    assert "Windows NT 10.0" in user_agent.get_user_agent()
+
+
+def test_get_user_agent_refreshes_stale_cache_in_background(monkeypatch):
+    monkeypatch.delenv(user_agent.ENV_USER_AGENT, raising=False)
+    user_agent.clear_cached_user_agent()
+    user_agent._write_user_agent_cache("Stale/1.0")
+    monkeypatch.setattr(user_agent, "UA_CACHE_TTL", -1)
+    refreshes = []
+    monkeypatch.setattr(
+        user_agent,
+        "refresh_user_agent_in_background",
+        lambda: refreshes.append(True),
+    )
+
+    assert user_agent.get_user_agent() == "Stale/1.0"
+    assert refreshes == [True]
 
 
 def test_get_user_agent_respects_env_override(monkeypatch):
@@ -53,3 +94,5 @@ def test_get_user_agent_falls_back_to_default(monkeypatch):
     )
 
     assert user_agent.get_user_agent() == user_agent.DEFAULT_USER_AGENT
+    user_agent.refresh_user_agent_in_background().join(5)
+    assert user_agent.refresh_user_agent() is None